@@ -0,0 +1,80 @@
+"""
+Compares a full solve with the rolling horizon mode: solve time and the objective given up by stitching
+windows, on the sample data and on synthetic days of growing length.
+
+Usage:
+    python -m benchmarks.rolling_horizon_benchmark [--window 180] [--overlap 60] [--bank-size 15] [--staff 40]
+"""
+from argparse import ArgumentParser
+from time import time
+from typing import List, Tuple
+import logging
+
+from opspilot.core import Scheduler, RollingHorizonScheduler
+from opspilot.models import Settings
+from benchmarks.transition_encoding_benchmark import build_arrival_banks
+from main import load_flights, load_services, load_roster, load_service_assignments, load_travel_times, load_locations
+
+def load_sample_data() -> Tuple[List, ...]:
+    return (
+        load_roster("data/roster.json"),
+        load_services("data/services.json"),
+        load_flights("data/flights.json"),
+        load_service_assignments("data/service_assignments.json"),
+        load_locations("data/locations.json"),
+        load_travel_times("data/travel_times.json"),
+    )
+
+def compare(name: str, data: Tuple[List, ...], window: int, overlap: int) -> None:
+    roster, services, flights, service_assignments, locations, travel_times = data
+    settings = Settings()
+
+    full_start = time()
+    scheduler = Scheduler(
+        roster=roster,
+        services=services,
+        flights=flights,
+        service_assignments=service_assignments,
+        locations=locations,
+        settings=settings,
+        travel_times=travel_times,
+    )
+    scheduler.run()
+    full_time = time() - full_start
+
+    rolling = RollingHorizonScheduler(
+        roster=roster,
+        services=services,
+        flights=flights,
+        service_assignments=service_assignments,
+        locations=locations,
+        settings=settings,
+        travel_times=travel_times,
+        window_minutes=window,
+        overlap_minutes=overlap,
+    )
+    rolling.run()
+
+    print(
+        f"{name:<12} assignments={len(service_assignments):<5} "
+        f"full={full_time:.2f}s rolling={rolling.solve_time:.2f}s windows={rolling.window_count:<3} "
+        f"full_objective={scheduler.objective_value} rolling_objective={rolling.objective_value} "
+        f"gap={rolling.objective_gap(scheduler.objective_value):.4%}"
+    )
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--window", type=int, default=180)
+    parser.add_argument("--overlap", type=int, default=60)
+    parser.add_argument("--bank-size", type=int, default=15)
+    parser.add_argument("--staff", type=int, default=40)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    compare("sample", load_sample_data(), args.window, args.overlap)
+    for banks in (2, 4, 6):
+        compare(f"{banks} banks", build_arrival_banks(banks, args.bank_size, args.staff), args.window, args.overlap)
+
+if __name__ == "__main__":
+    main()
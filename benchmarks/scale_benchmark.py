@@ -0,0 +1,87 @@
+"""
+Runs the Scheduler end to end on synthetic hub days of 100, 1000 and 5000 tasks and records build time,
+solve time, peak memory and model size per scale, for tracking regressions across releases.
+
+Each scale runs in a fresh worker process so the peak RSS of one scale does not leak into the next.
+
+Usage:
+    python -m benchmarks.scale_benchmark [--tasks 100 1000 5000] [--seed 0] [--time-limit 60] [--trace-memory] [--output results.json]
+"""
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import time
+from typing import List
+import json
+import logging
+import resource
+
+from opspilot.core import Scheduler
+from opspilot.models import Settings, SolverProfile
+from benchmarks.synthetic_data import generate_hub_day
+
+def run_scale(task_count: int, seed: int, time_limit: float, trace_memory: bool) -> dict:
+    logging.getLogger().setLevel(logging.WARNING)
+
+    generate_start = time()
+    roster, services, flights, service_assignments, locations, travel_times = generate_hub_day(task_count, seed)
+    generate_time = time() - generate_start
+
+    settings = Settings(solver_profile=SolverProfile(max_time_in_seconds=time_limit), trace_memory=trace_memory)
+    scheduler = Scheduler(
+        roster=roster,
+        services=services,
+        flights=flights,
+        service_assignments=service_assignments,
+        locations=locations,
+        settings=settings,
+        travel_times=travel_times,
+    )
+    scheduler.run()
+
+    metrics = scheduler.metrics
+    solve = metrics.stage("solve")
+
+    return {
+        "tasks": len(service_assignments),
+        "flights": len(flights),
+        "staff": len(roster),
+        "seed": seed,
+        "generate_s": generate_time,
+        "build_s": metrics.wall_time - solve.wall_time,
+        "solve_s": solve.wall_time,
+        "status": scheduler.solver_report.status,
+        "objective": scheduler.solver_report.objective_value,
+        "relative_gap": scheduler.solver_report.relative_gap,
+        "variables": metrics.variables,
+        "constraints": metrics.constraints,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "stages": json.loads(metrics.to_json())["stages"],
+    }
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    parser.add_argument("--trace-memory", action="store_true", help="Record peak Python memory per stage (slower)")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    results: List[dict] = []
+    for task_count in args.tasks:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(run_scale, task_count, args.seed, args.time_limit, args.trace_memory).result()
+        results.append(result)
+
+        print(
+            f"tasks={result['tasks']:<5} staff={result['staff']:<5} vars={result['variables']:<8} "
+            f"constraints={result['constraints']:<8} build={result['build_s']:.2f}s solve={result['solve_s']:.2f}s "
+            f"rss={result['peak_rss_mb']:.0f}MB status={result['status']} gap={result['relative_gap']}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
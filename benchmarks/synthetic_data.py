@@ -0,0 +1,229 @@
+"""
+Seeded generator of synthetic hub days at a configurable number of service assignments (tasks):
+arrival and departure banks, turnarounds crossing midnight, common-zone tasks, terminals/piers/stands
+with travel times between piers, and a roster with varied shifts, certifications and roles.
+
+Usage:
+    python -m benchmarks.synthetic_data --tasks 1000 [--seed 0] --output data/synthetic
+"""
+from argparse import ArgumentParser
+from datetime import time
+from enum import Enum
+from pathlib import Path
+from typing import List, Tuple
+import json
+import random
+
+from opspilot.models import (
+    Flight, Service, Staff, Shift, ServiceAssignment, Location, TravelTime,
+    CertificationRequirement, ServiceType
+)
+from benchmarks.transition_encoding_benchmark import _format_time
+
+TERMINALS = 2
+PIERS_PER_TERMINAL = 3
+STANDS_PER_PIER = 8
+
+# Bank start times (minutes from midnight) of a hub day; the last bank turns around after midnight
+BANKS = [6 * 60, 8 * 60 + 30, 11 * 60, 13 * 60 + 30, 16 * 60, 18 * 60 + 30, 21 * 60, 23 * 60]
+
+# (id, name, certifications, requirement, service type, department, relative start, relative end)
+FLIGHT_ZONE_SERVICES = [
+    (1, "Baggage Unloading", [1], CertificationRequirement.ANY, ServiceType.SINGLE, 1, "A", "A+30"),
+    (2, "Baggage Loading", [1], CertificationRequirement.ANY, ServiceType.SINGLE, 1, "D-45", "D-10"),
+    (3, "GPU", [2], CertificationRequirement.ANY, ServiceType.MULTI_TASK, 1, "A", "D"),
+    (4, "Water and Toilet", [3], CertificationRequirement.ANY, ServiceType.MULTI_TASK, 2, "A+10", "A+40"),
+    (5, "Cabin Cleaning", [3], CertificationRequirement.ANY, ServiceType.MULTI_TASK, 2, "A+5", "D-30"),
+    (6, "Pushback", [2, 4], CertificationRequirement.ALL, ServiceType.SINGLE, 1, "D-15", "D+5"),
+    (7, "Turnaround Coordination", [5], CertificationRequirement.ANY, ServiceType.FIXED, 3, "A-10", "D+5"),
+]
+
+# (id, name, certifications, requirement, service type, department, duration in minutes)
+COMMON_ZONE_SERVICES = [
+    (8, "Check-in", [6], CertificationRequirement.ANY, ServiceType.FIXED, 3, 180),
+    (9, "Baggage Hall", [1], CertificationRequirement.ANY, ServiceType.SINGLE, 1, 120),
+]
+
+SHIFTS = [
+    ["04:00-12:00"],
+    ["06:00-14:00"],
+    ["10:00-18:00"],
+    ["14:00-22:00"],
+    ["16:00-00:30"],
+    ["21:00-05:00"],
+    ["05:00-09:00", "17:00-21:00"],  # Split shift covering the morning and evening peaks
+]
+
+ROLES = ["TL", "RAMP", "CSA"]
+
+def generate_hub_day(task_count: int, seed: int = 0, tasks_per_staff: float = 3.0) -> Tuple[List, ...]:
+    """
+    Generate (roster, services, flights, service_assignments, locations, travel_times) with about
+    `task_count` service assignments and one staff member per `tasks_per_staff` of them.
+    """
+    rng = random.Random(seed)
+
+    services = [
+        Service(id=service_id, name=name, certifications=certifications, certification_requirement=requirement)
+        for service_id, name, certifications, requirement, *_ in FLIGHT_ZONE_SERVICES + COMMON_ZONE_SERVICES
+    ]
+
+    locations, stands, halls, travel_points = _build_locations()
+    travel_times = [
+        TravelTime(
+            origin_location_id=origin,
+            destination_location_id=destination,
+            travel_minutes=5 if origin == destination else rng.randrange(8, 25),
+        )
+        for origin in travel_points
+        for destination in travel_points
+    ]
+
+    flights: List[Flight] = []
+    service_assignments: List[ServiceAssignment] = []
+    common_zone_count = task_count // 10
+
+    while len(service_assignments) < task_count - common_zone_count:
+        bank = len(flights) % len(BANKS)
+        arrival = BANKS[bank] + rng.randrange(0, 40)
+        if bank == len(BANKS) - 1 and rng.random() < 0.5:
+            ground_time = rng.randrange(240, 420)  # Night stop departing the next morning
+        else:
+            ground_time = rng.randrange(45, 110)
+
+        number = f"SY{len(flights) + 1:04}"
+        flights.append(Flight(
+            number=number,
+            arrival_time=_format_time(arrival),
+            departure_time=_format_time(arrival + ground_time),
+        ))
+
+        flight_priority = rng.randrange(1, 10)
+        stand = rng.choice(stands)
+        for service_id, _, _, _, service_type, department_id, relative_start, relative_end in FLIGHT_ZONE_SERVICES:
+            if service_type == ServiceType.MULTI_TASK and rng.random() < 0.3:
+                continue
+
+            service_assignments.append(ServiceAssignment(
+                id=len(service_assignments) + 1,
+                service_id=service_id,
+                department_id=department_id,
+                priority=float(f"{flight_priority}.{service_id}"),
+                staff_count=2 if service_id in (1, 2) and rng.random() < 0.5 else 1,
+                location_id=stand,
+                priority_roles=[["TL"]] if service_type == ServiceType.FIXED else [],
+                flight_number=number,
+                relative_start=relative_start,
+                relative_end=relative_end,
+                service_type=service_type,
+                multi_task_limit=2 if service_type == ServiceType.MULTI_TASK else None,
+                exclude_services=[5] if service_id == 4 else [],
+            ))
+
+    for _ in range(common_zone_count):
+        service_id, _, _, _, service_type, department_id, duration = rng.choice(COMMON_ZONE_SERVICES)
+        start = rng.randrange(4 * 60, 22 * 60, 30)
+        service_assignments.append(ServiceAssignment(
+            id=len(service_assignments) + 1,
+            service_id=service_id,
+            department_id=department_id,
+            priority=float(f"{rng.randrange(1, 10)}.{service_id}"),
+            staff_count=rng.randrange(1, 3),
+            location_id=rng.choice(halls),
+            start_time=_format_time(start),
+            end_time=_format_time(start + duration),
+            service_type=service_type,
+        ))
+
+    staff_count = max(1, round(len(service_assignments) / tasks_per_staff))
+    roster = [_build_staff(staff_id, rng) for staff_id in range(1, staff_count + 1)]
+
+    return roster, services, flights, service_assignments, locations, travel_times
+
+def write_dataset(data: Tuple[List, ...], directory: Path) -> None:
+    """Write the day as JSON files in the format of data/ (loadable with the loaders of main)."""
+    directory.mkdir(parents=True, exist_ok=True)
+    names = ["roster", "services", "flights", "service_assignments", "locations", "travel_times"]
+
+    for name, records in zip(names, data):
+        with open(directory / f"{name}.json", "w") as file:
+            json.dump([_to_json(record.model_dump()) for record in records], file, indent=2)
+
+def _to_json(value):
+    """JSON-compatible value with times as "HH:MM", as the models parse them."""
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    if isinstance(value, time):
+        return value.strftime("%H:%M")
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+def _build_locations() -> Tuple[List[Location], List[int], List[int], List[int]]:
+    """Terminals with piers of stands and common-zone halls; travel times are given between piers and terminals."""
+    locations, stands, halls, travel_points = [], [], [], []
+
+    for terminal in range(1, TERMINALS + 1):
+        terminal_id = terminal * 1000
+        locations.append(Location(id=terminal_id, name=f"Terminal {terminal}"))
+        travel_points.append(terminal_id)
+
+        for hall, name in enumerate(["Check-in Hall", "Baggage Hall"], start=1):
+            locations.append(Location(id=terminal_id + 900 + hall, name=f"T{terminal} {name}", parent_id=terminal_id))
+            halls.append(terminal_id + 900 + hall)
+
+        for pier in range(1, PIERS_PER_TERMINAL + 1):
+            pier_id = terminal_id + pier * 100
+            locations.append(Location(id=pier_id, name=f"Pier {terminal}{chr(64 + pier)}", parent_id=terminal_id))
+            travel_points.append(pier_id)
+
+            for stand in range(1, STANDS_PER_PIER + 1):
+                locations.append(Location(id=pier_id + stand, name=f"Stand {terminal}{chr(64 + pier)}{stand}", parent_id=pier_id))
+                stands.append(pier_id + stand)
+
+    return locations, stands, halls, travel_points
+
+def _build_staff(staff_id: int, rng: random.Random) -> Staff:
+    role_code = rng.choices(ROLES, weights=[1, 5, 3])[0]
+    department_id = {"TL": 3, "RAMP": 1, "CSA": 2}[role_code]
+
+    certifications = {
+        "TL": [5, 6] + rng.sample([1, 2, 4], rng.randrange(0, 3)),
+        "RAMP": [1] + rng.sample([2, 4], rng.randrange(0, 3)),
+        "CSA": [3] + rng.sample([1, 6], rng.randrange(0, 2)),
+    }[role_code]
+
+    eligible_for_services = [ServiceType.SINGLE, ServiceType.MULTI_TASK]
+    if role_code == "TL" or rng.random() < 0.1:
+        eligible_for_services.append(ServiceType.FIXED)
+
+    return Staff(
+        id=staff_id,
+        name=f"Agent {staff_id}",
+        department_id=department_id,
+        shifts=[
+            Shift(start_time=start, end_time=end)
+            for start, end in (shift.split("-") for shift in rng.choice(SHIFTS))
+        ],
+        certifications=sorted(certifications),
+        eligible_for_services=eligible_for_services,
+        priority_service_id=rng.choice([None, None, 1, 3, 5]),
+        rank_level=rng.randrange(1, 5),
+        role_code=role_code,
+    )
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    data = generate_hub_day(args.tasks, args.seed)
+    write_dataset(data, args.output)
+    print(f"Wrote {len(data[3])} service assignments, {len(data[2])} flights and {len(data[0])} staff to {args.output}")
+
+if __name__ == "__main__":
+    main()
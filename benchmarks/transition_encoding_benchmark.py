@@ -0,0 +1,154 @@
+"""
+Compares the pairwise and clique transition encodings and the interval engine on dense arrival banks
+(e.g. 30 arrivals within 20 minutes): model size, build time and solve time.
+
+Usage:
+    python -m benchmarks.transition_encoding_benchmark [--banks 4] [--bank-size 30] [--staff 60] [--time-limit 30]
+"""
+from argparse import ArgumentParser
+from time import time
+from typing import List, Tuple
+import logging
+import random
+
+from ortools.sat.python import cp_model
+from opspilot.core import Scheduler
+from opspilot.models import (
+    Flight, Service, Staff, Shift, ServiceAssignment, Location, TravelTime, Settings,
+    CertificationRequirement, ServiceType, TransitionEncoding, SchedulingEngine
+)
+
+def _format_time(minutes: int) -> str:
+    minutes %= 1440
+    return f"{minutes // 60:02}:{minutes % 60:02}"
+
+def build_arrival_banks(banks: int, bank_size: int, staff_count: int, seed: int = 7) -> Tuple[List, ...]:
+    """
+    Banks of `bank_size` arrivals spread over 20 minutes, one bank every 3 hours from 06:00,
+    each flight with a handful of services at its own bay.
+    """
+    rng = random.Random(seed)
+
+    services = [
+        Service(id=1, name="Baggage", certifications=[1], certification_requirement=CertificationRequirement.ANY),
+        Service(id=2, name="GPU", certifications=[2], certification_requirement=CertificationRequirement.ANY),
+        Service(id=3, name="Cleaning", certifications=[3], certification_requirement=CertificationRequirement.ANY),
+    ]
+
+    locations = [Location(id=1, name="Apron North"), Location(id=2, name="Apron South")]
+    flights, service_assignments = [], []
+
+    for bank in range(banks):
+        bank_start = 6 * 60 + bank * 180
+        for k in range(bank_size):
+            number = f"BK{bank}{k:03}"
+            arrival = bank_start + rng.randrange(0, 20)
+            flights.append(Flight(
+                number=number,
+                arrival_time=_format_time(arrival),
+                departure_time=_format_time(arrival + rng.randrange(45, 90)),
+            ))
+
+            bay_id = len(locations) + 1
+            locations.append(Location(id=bay_id, name=f"Bay {bay_id}", parent_id=1 + k % 2))
+
+            for service in services:
+                service_assignments.append(ServiceAssignment(
+                    id=len(service_assignments) + 1,
+                    service_id=service.id,
+                    department_id=1,
+                    priority=float(f"{1 + k % 3}.{service.id}"),
+                    staff_count=1,
+                    location_id=bay_id,
+                    flight_number=number,
+                    relative_start="A+5",
+                    relative_end="D-10",
+                    service_type=ServiceType.SINGLE,
+                ))
+
+    travel_times = [
+        TravelTime(origin_location_id=1, destination_location_id=2, travel_minutes=15),
+        TravelTime(origin_location_id=2, destination_location_id=1, travel_minutes=15),
+        TravelTime(origin_location_id=1, destination_location_id=1, travel_minutes=5),
+        TravelTime(origin_location_id=2, destination_location_id=2, travel_minutes=5),
+    ]
+
+    roster = [
+        Staff(
+            id=staff_id,
+            name=f"Agent {staff_id}",
+            department_id=1,
+            shifts=[Shift(start_time="05:00", end_time="23:00")],
+            certifications=rng.sample([1, 2, 3], rng.randrange(1, 4)),
+            eligible_for_services=[ServiceType.SINGLE],
+            rank_level=rng.randrange(1, 5),
+        )
+        for staff_id in range(1, staff_count + 1)
+    ]
+
+    return roster, services, flights, service_assignments, locations, travel_times
+
+CONFIGURATIONS = [
+    ("Pairwise", Settings(transition_encoding=TransitionEncoding.PAIRWISE)),
+    ("Clique", Settings(transition_encoding=TransitionEncoding.CLIQUE)),
+    ("Interval", Settings(scheduling_engine=SchedulingEngine.INTERVAL)),
+]
+
+def run_configuration(name: str, settings: Settings, data: Tuple[List, ...], time_limit: float) -> dict:
+    roster, services, flights, service_assignments, locations, travel_times = data
+
+    build_start = time()
+    scheduler = Scheduler(
+        roster=roster,
+        services=services,
+        flights=flights,
+        service_assignments=service_assignments,
+        locations=locations,
+        settings=settings,
+        travel_times=travel_times,
+    )
+    scheduler.create_assignment_variables()
+    scheduler.apply_constraints()
+    scheduler.set_objective()
+    build_time = time() - build_start
+
+    proto = scheduler.model.Proto()
+    scheduler.solver.parameters.max_time_in_seconds = time_limit
+
+    solve_start = time()
+    status = scheduler.solver.Solve(scheduler.model)
+    solve_time = time() - solve_start
+
+    return {
+        "configuration": name,
+        "variables": len(proto.variables),
+        "constraints": len(proto.constraints),
+        "build_s": build_time,
+        "solve_s": solve_time,
+        "status": scheduler.solver.StatusName(status),
+        "objective": scheduler.solver.ObjectiveValue() if status in (cp_model.OPTIMAL, cp_model.FEASIBLE) else None,
+        "bound": scheduler.solver.BestObjectiveBound(),
+    }
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--banks", type=int, default=4)
+    parser.add_argument("--bank-size", type=int, default=30)
+    parser.add_argument("--staff", type=int, default=60)
+    parser.add_argument("--time-limit", type=float, default=30.0)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    data = build_arrival_banks(args.banks, args.bank_size, args.staff)
+    print(f"{len(data[3])} service assignments, {len(data[0])} staff, {args.banks} banks of {args.bank_size} arrivals")
+
+    for name, settings in CONFIGURATIONS:
+        result = run_configuration(name, settings, data, args.time_limit)
+        print(
+            f"{result['configuration']:<9} vars={result['variables']:<7} constraints={result['constraints']:<8} "
+            f"build={result['build_s']:.2f}s solve={result['solve_s']:.2f}s "
+            f"status={result['status']} objective={result['objective']} bound={result['bound']}"
+        )
+
+if __name__ == "__main__":
+    main()
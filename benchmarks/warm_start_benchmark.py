@@ -0,0 +1,89 @@
+"""
+Compares the time to the first and to the final solution of a re-solve after a flight delay,
+cold and warm started from the plan of the day before the delay (with and without hint repair).
+
+Usage:
+    python -m benchmarks.warm_start_benchmark [--banks 4] [--bank-size 15] [--staff 40] [--delay 30]
+"""
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from time import time
+from typing import List, Optional, Tuple
+import logging
+
+from opspilot.core import Scheduler
+from opspilot.core.solution_stream_callback import SolutionStreamCallback
+from opspilot.models import Settings
+from opspilot.plans import AllocationPlan
+from benchmarks.transition_encoding_benchmark import build_arrival_banks
+
+def delay_flight(flights: List, number: str, minutes: int) -> List:
+    def shift(value):
+        moved = datetime.combine(datetime.min, value) + timedelta(minutes=minutes)
+        return moved.time()
+
+    return [
+        flight.model_copy(update={
+            "arrival_time": shift(flight.arrival_time),
+            "departure_time": shift(flight.departure_time),
+        }) if flight.number == number else flight
+        for flight in flights
+    ]
+
+def solve(data: Tuple[List, ...], settings: Settings, hints: Optional[AllocationPlan] = None) -> Tuple[Scheduler, float, float]:
+    roster, services, flights, service_assignments, locations, travel_times = data
+    scheduler = Scheduler(
+        roster=roster,
+        services=services,
+        flights=flights,
+        service_assignments=service_assignments,
+        locations=locations,
+        settings=settings,
+        travel_times=travel_times,
+        hints=hints,
+    )
+    scheduler.build_model()
+
+    first_solution = []
+    start_time = time()
+    def on_solution(assigned, objective) -> None:
+        if not first_solution:
+            first_solution.append(time() - start_time)
+
+    scheduler.solve(SolutionStreamCallback(scheduler.assignment_vars, on_solution))
+    return scheduler, first_solution[0] if first_solution else float("nan"), time() - start_time
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--banks", type=int, default=4)
+    parser.add_argument("--bank-size", type=int, default=15)
+    parser.add_argument("--staff", type=int, default=40)
+    parser.add_argument("--delay", type=int, default=30)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    data = build_arrival_banks(args.banks, args.bank_size, args.staff)
+    roster, services, flights, service_assignments, locations, travel_times = data
+    location_map = {location.id: location for location in locations}
+
+    scheduler, _, _ = solve(data, Settings())
+    plan = scheduler.get_allocation_plan(location_map)
+
+    delayed = flights[len(flights) // 2].number
+    replay = (roster, services, delay_flight(flights, delayed, args.delay), service_assignments, locations, travel_times)
+    print(f"{len(service_assignments)} assignments, {len(roster)} staff, {delayed} delayed {args.delay} minutes")
+
+    for name, settings, hints in (
+        ("cold", Settings(), None),
+        ("warm", Settings(), plan),
+        ("warm+repair", Settings(repair_hints=True), plan),
+    ):
+        scheduler, first_time, total_time = solve(replay, settings, hints)
+        print(
+            f"{name:<12} first_solution={first_time:.2f}s total={total_time:.2f}s "
+            f"status={scheduler.solution_status} objective={scheduler.objective_value}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+Feature: Certification Matrix
+  As a scheduler
+  I want to match the whole roster against the service catalogue at once
+  So that certification checks stay fast on large rosters
+
+  Scenario: All and Any requirements are matched for every staff and service
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | John  | 1             | [1, 2, 3]      | ['S']                 | ['08:00-16:00'] |
+      | 2  | Sarah | 1             | [1, 3]         | ['S']                 | ['08:00-16:00'] |
+      | 3  | Mike  | 1             | []             | ['S']                 | ['08:00-16:00'] |
+      | 4  | Emma  | 1             | [4]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name         | certifications | requirement |
+      | 1  | Security     | [1, 2]         | All         |
+      | 2  | Baggage      | [2, 4]         | Any         |
+      | 3  | Cleaning     | [3]            | Any         |
+      | 4  | Coordination | [1, 3]         | All         |
+
+    When the certification matrix is computed
+
+    Then the certified services should be:
+      | staff_id | certified_service_ids |
+      | 1        | [1, 2, 3, 4]          |
+      | 2        | [3, 4]                |
+      | 3        | []                    |
+      | 4        | [2]                   |
+
+  Scenario: Large and sparse certification ids are matched
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | John  | 1             | [70, 130]      | ['S']                 | ['08:00-16:00'] |
+      | 2  | Sarah | 1             | [1, 130]       | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name      | certifications | requirement |
+      | 1  | De-icing  | [70, 130]      | All         |
+      | 2  | Pushback  | [1, 70]        | Any         |
+      | 3  | Refueling | [200]          | Any         |
+
+    When the certification matrix is computed
+
+    Then the certified services should be:
+      | staff_id | certified_service_ids |
+      | 1        | [1, 2]                |
+      | 2        | [2]                   |
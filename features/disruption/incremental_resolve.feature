@@ -0,0 +1,205 @@
+Feature: Incremental Re-solve
+  As a dispatcher
+  I want a disruption to only re-solve the service assignments it affects
+  So that delays, cancellations and sick calls are fixed without re-planning the whole day
+
+  Scenario: Delayed flight is re-solved together with the services it now overlaps
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL801  | 09:00        | 10:00          |
+      | FL802  | 10:30        | 11:30          |
+      | FL803  | 13:00        | 14:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL801         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL802         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL803         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy |
+      | 5                      | 15                  | Minimize Staff      |
+
+    And the scheduler has produced a plan
+
+    When flight "FL801" is rescheduled to arrive at "10:00" and depart at "11:00"
+
+    Then the re-solved service assignments should be [1, 2]
+
+    And the plan coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 1                    |
+
+  Scenario: Services of a sick staff member are taken over by the remaining staff
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL801  | 09:00        | 10:00          |
+      | FL802  | 10:30        | 11:30          |
+      | FL803  | 13:00        | 14:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL801         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL802         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL803         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy |
+      | 5                      | 15                  | Minimize Staff      |
+
+    And the scheduler has produced a plan
+
+    When staff 1 calls in sick
+
+    Then the plan assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | []                   |
+      | 2        | [1, 2, 3]            |
+
+  Scenario: Cancelled flight releases its services
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL801  | 09:00        | 10:00          |
+      | FL802  | 10:30        | 11:30          |
+      | FL803  | 13:00        | 14:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL801         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL802         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL803         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy |
+      | 5                      | 15                  | Minimize Staff      |
+
+    And the scheduler has produced a plan
+
+    When flight "FL802" is cancelled
+
+    Then the plan coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 0                    |
+      | 3                     | 1                    |
+
+  Scenario: Frozen allocations that are no longer feasible are released into the re-solve
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1, 2]         | ['F', 'S']            | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name   | certifications | requirement |
+      | 1  | Escort | [1]            | All         |
+      | 2  | Guide  | [2]            | All         |
+
+    And the following locations exist:
+      | id | name       |
+      | 1  | Terminal A |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | start_time | end_time | service_type | priority |
+      | 1  | 1          | 1             | 1           | 1           | 13:00      | 15:00    | F            | 1.0      |
+      | 2  | 2          | 1             | 1           | 1           | 09:00      | 10:00    | S            | 2.0      |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy |
+      | 5                      | 15                  | Minimize Staff      |
+
+    And the scheduler has produced a plan
+
+    When the shifts of staff 1 change to ['08:00-12:00']
+
+    Then the released allocations should be {1: {1}}
+
+    And the plan assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | [2]                  |
+
+    And the plan coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 0                    |
+      | 2                     | 1                    |
+
+  Scenario: Allocations outside the new shift of a replaced staff record are released
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['12:00-16:00'] |
+
+    And the following services exist:
+      | id | name  | certifications | requirement |
+      | 1  | Guide | [1]            | All         |
+
+    And the following locations exist:
+      | id | name       |
+      | 1  | Terminal A |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | start_time | end_time | service_type | priority |
+      | 1  | 1          | 1             | 1           | 1           | 09:00      | 10:00    | S            | 1.0      |
+      | 2  | 1          | 1             | 1           | 1           | 13:00      | 15:00    | S            | 2.0      |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy |
+      | 5                      | 15                  | Minimize Staff      |
+
+    And the scheduler has produced a plan
+
+    When the shifts of staff 1 change to ['08:00-12:00']
+
+    Then the released allocations should be {2: {1}}
+
+    And the re-solved service assignments should be [2]
+
+    And the plan assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | [1]                  |
+      | 2        | [2]                  |
@@ -15,10 +15,17 @@ def before_scenario(context, scenario):
     context.travel_time_map = {}
     context.overlap_map = {}
     context.scheduler = None
+    context.allocation_plan = None
+    context.plan_directory = None
+    context.base_plan = None
 
     if 'wip' in scenario.effective_tags:
         scenario.skip("Skipping WIP scenario")
     
+def after_scenario(context, scenario):
+    if context.plan_directory is not None:
+        context.plan_directory.cleanup()
+
 def before_feature(context, feature):
     if 'wip' in feature.tags:
         feature.skip("Skipping WIP feature")
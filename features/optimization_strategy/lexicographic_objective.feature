@@ -0,0 +1,64 @@
+Feature: Lexicographic Objective
+  As a scheduler
+  I want the strategy objective to be solved one term at a time
+  So that coverage, priority and staff usage are optimized in order without large weights
+
+  Scenario: Minimize staff maximizes coverage, then priority, then minimizes staff used
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL401  | 09:00        | 10:00          |
+      | FL402  | 09:05        | 10:05          |
+      | FL403  | 09:10        | 10:10          |
+      | FL404  | 11:00        | 12:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+      | 4  | Bay 4 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL401         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL402         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL403         | A              | D            | S            |
+      | 4  | 1          | 1             | 1           | 4           | 4.0      | FL404         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy | objective_mode |
+      | 5                      | 15                  | Minimize Staff      | Lexicographic  |
+
+    When the scheduler runs
+
+    Then the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 0                    |
+      | 4                     | 1                    |
+
+    And the objective stages should be:
+      | name       | objective_value |
+      | coverage   | 3               |
+      | priority   | -7000           |
+      | staff_used | -2              |
+
+    When the scheduler solves again
+
+    Then the built model should have no objective
+
+    And the objective stages should be:
+      | name       | objective_value |
+      | coverage   | 3               |
+      | priority   | -7000           |
+      | staff_used | -2              |
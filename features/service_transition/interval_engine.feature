@@ -0,0 +1,90 @@
+Feature: Interval Scheduling Engine
+  As a scheduler
+  I want to model each staff member's day with interval variables and NoOverlap
+  So that the solver reasons about time directly while respecting the same transition rules
+
+  Scenario: Staff cannot be assigned to two services without enough travel time between them
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL201  | 08:00        | 09:00          |
+      | FL202  | 09:00        | 10:45          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay X |
+      | 2  | Bay Y |
+
+    And the following travel times exist:
+      | origin_location_id | destination_location_id | travel_minutes |
+      | 1                  | 2                       | 30             |
+      | 2                  | 1                       | 30             |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL201         | A+10           | D-10         | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL202         | A+10           | A+40         | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | scheduling_engine |
+      | 5                      | 15                  | Interval          |
+
+    When the scheduler runs
+
+    Then the assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | [1]                  |
+
+    And the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 0                    |
+
+  Scenario: Staff can still perform overlapping multi-task services on the same flight
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1,2]          | ['M', 'S']            | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name       | certifications | requirement |
+      | 1  | GPU        | [1]            | All         |
+      | 2  | Water cart | [2]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL500  | 09:00        | 11:00          |
+      | FL501  | 09:20        | 10:00          |
+
+    And the following locations exist:
+      | id | name   |
+      | 1  | Bay 44 |
+      | 2  | Bay 45 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | flight_number | relative_start | relative_end | service_type | priority | multi_task_limit |
+      | 1  | 1          | 1             | 1           | 1           | FL500         | A+10           | A+30         | M            | 1.0      | 2                |
+      | 2  | 2          | 1             | 1           | 1           | FL500         | A+20           | A+40         | M            | 1.1      | 2                |
+      | 3  | 1          | 1             | 1           | 2           | FL501         | A              | A+20         | S            | 9.0      |                  |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | scheduling_engine |
+      | 5                      | 15                  | Interval          |
+
+    When the scheduler runs
+
+    Then the assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | [1, 2]               |
+
+    And the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 0                    |
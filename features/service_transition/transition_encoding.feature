@@ -0,0 +1,92 @@
+Feature: Transition Encoding
+  As a scheduler
+  I want overlapping service assignments to be encoded either pairwise or per clique
+  So that dense arrival banks keep the model small without changing the assignments
+
+  Scenario: Pairwise encoding assigns staff to only one of a bank of mutually overlapping services
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL401  | 09:00        | 10:00          |
+      | FL402  | 09:05        | 10:05          |
+      | FL403  | 09:10        | 10:10          |
+      | FL404  | 11:00        | 12:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+      | 4  | Bay 4 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL401         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL402         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL403         | A              | D            | S            |
+      | 4  | 1          | 1             | 1           | 4           | 4.0      | FL404         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | transition_encoding |
+      | 5                      | 15                  | Pairwise            |
+
+    When the scheduler runs
+
+    Then the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 0                    |
+      | 4                     | 1                    |
+
+  Scenario: Clique encoding assigns staff to only one of a bank of mutually overlapping services
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL401  | 09:00        | 10:00          |
+      | FL402  | 09:05        | 10:05          |
+      | FL403  | 09:10        | 10:10          |
+      | FL404  | 11:00        | 12:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+      | 4  | Bay 4 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL401         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL402         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL403         | A              | D            | S            |
+      | 4  | 1          | 1             | 1           | 4           | 4.0      | FL404         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | transition_encoding |
+      | 5                      | 15                  | Clique              |
+
+    When the scheduler runs
+
+    Then the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 0                    |
+      | 4                     | 1                    |
@@ -0,0 +1,50 @@
+Feature: Decomposition
+  As a scheduler
+  I want independent groups of staff and services to be solved separately and in parallel
+  So that departments that cannot help each other do not share one large model
+
+  Scenario: Departments with disjoint certifications are solved as separate components
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 3  | Carol | 2             | [2]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name     | certifications | requirement |
+      | 1  | GPU      | [1]            | All         |
+      | 2  | Cleaning | [2]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL111  | 09:00        | 10:00          |
+      | FL112  | 09:05        | 10:05          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.1      | FL111         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.1      | FL112         | A              | D            | S            |
+      | 3  | 2          | 2             | 1           | 1           | 1.2      | FL111         | A              | D            | S            |
+      | 4  | 2          | 2             | 1           | 2           | 2.2      | FL112         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy |
+      | 5                      | 15                  | Turnaround Workload |
+
+    When the decomposed scheduler runs with 2 workers
+
+    Then the problem should be split into 2 components
+
+    And the plan coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 1                    |
+      | 4                     | 0                    |
+
+    And the decomposed objective should match a single solve
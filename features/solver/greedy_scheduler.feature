@@ -0,0 +1,117 @@
+Feature: Greedy Scheduler
+  As a ramp supervisor
+  I want a plan within milliseconds for what-if questions
+  So that I do not have to wait for the solver to answer them
+
+  Scenario: Staff are allocated by priority without overlapping services
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL951  | 09:00        | 10:00          |
+      | FL952  | 09:30        | 10:30          |
+      | FL953  | 09:45        | 11:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 3.0      | FL951         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 1.0      | FL952         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 2.0      | FL953         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time |
+      | 5                      | 15                  |
+
+    When the greedy scheduler runs
+
+    Then the plan coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 0                    |
+      | 2                     | 1                    |
+      | 3                     | 1                    |
+
+  Scenario: Multi-task exclusions and limits are respected
+    Given the following staff exists:
+      | id | name  | department_id |  certifications   | eligible_for_services | shifts          |
+      | 1  | Alice | 1             |  [1,2,3]          | ['M']                 | ['08:00-12:00'] |
+
+    And the following services exist:
+      | id | name       | certifications | requirement |
+      | 1  | GPU        | [1]            | All         |
+      | 2  | Toilet     | [2]            | All         |
+      | 3  | Water cart | [3]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL200  | 09:00        | 11:00          |
+
+    And the following locations exist:
+      | id | name   |
+      | 1  | Bay 44 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id |  staff_count | location_id | flight_number | relative_start | relative_end | service_type | priority | multi_task_limit | exclude_services |
+      | 1  | 1          | 1             | 1            | 1           | FL200         | A+10           | A+30         | M            | 7.0      | 2                | [2]              |
+      | 2  | 2          | 1             | 1            | 1           | FL200         | A+20           | A+40         | M            | 6.9      | 2                | [1]              |
+      | 3  | 3          | 1             | 1            | 1           | FL200         | A+30           | A+50         | M            | 7.1      | 2                | []               |
+
+    When the greedy scheduler runs
+
+    Then the plan assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | [2, 3]               |
+
+  Scenario: Greedy plan seeds the solver
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL951  | 09:00        | 10:00          |
+      | FL952  | 09:30        | 10:30          |
+      | FL953  | 10:45        | 11:30          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL951         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL952         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL953         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time |
+      | 5                      | 15                  |
+
+    And the greedy scheduler has produced a plan
+
+    When the scheduler runs warm started from the plan
+
+    Then the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 1                    |
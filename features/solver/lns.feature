@@ -0,0 +1,106 @@
+Feature: Large Neighbourhood Search
+  As a planner
+  I want the plan to keep improving in the background
+  So that a quick first plan gets better within the time I have
+
+  Scenario: Greedy plan is improved by re-solving neighbourhoods
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          | priority_service_id |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |                     |
+      | 2  | Bob   | 1             | [1, 2]         | ['S']                 | ['08:00-16:00'] | 1                   |
+
+    And the following services exist:
+      | id | name     | certifications | requirement |
+      | 1  | GPU      | [1]            | All         |
+      | 2  | Pushback | [2]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL961  | 09:00        | 10:00          |
+      | FL962  | 09:00        | 10:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL961         | A              | D            | S            |
+      | 2  | 2          | 1             | 1           | 2           | 2.0      | FL962         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time |
+      | 5                      | 15                  |
+
+    And the greedy scheduler has produced a plan
+
+    When the LNS scheduler improves the plan for 3 iterations
+
+    Then the LNS objective should have improved
+
+    And the plan assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | [1]                  |
+      | 2        | [2]                  |
+
+  Scenario: Lexicographic objective compares the stage values in order
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          | priority_service_id |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |                     |
+      | 2  | Bob   | 1             | [1, 2]         | ['S']                 | ['08:00-16:00'] | 1                   |
+
+    And the following services exist:
+      | id | name     | certifications | requirement |
+      | 1  | GPU      | [1]            | All         |
+      | 2  | Pushback | [2]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL961  | 09:00        | 10:00          |
+      | FL962  | 09:00        | 10:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL961         | A              | D            | S            |
+      | 2  | 2          | 1             | 1           | 2           | 2.0      | FL962         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy | objective_mode |
+      | 5                      | 15                  | Balance Workload    | Lexicographic  |
+
+    And the greedy scheduler has produced a plan
+
+    When the LNS scheduler improves the plan for 3 iterations
+
+    Then the LNS objective should have improved
+    And the LNS objective should be the stage values of the plan
+
+    And the plan assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | [1]                  |
+      | 2        | [2]                  |
+
+  Scenario: Day without service assignments
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the greedy scheduler has produced a plan
+
+    When the LNS scheduler improves the plan for 3 iterations with seed 1
+
+    Then the plan assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | []                   |
+
+    When the LNS scheduler improves the plan for 3 iterations with seed 5
+
+    Then the plan assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | []                   |
@@ -0,0 +1,62 @@
+Feature: Allocation Plan Diff and Patch
+  As a dispatcher
+  I want only the changes between two plans
+  So that handheld devices receive the reassignments instead of the whole plan
+
+  Background:
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 3  | Carol | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 4  | Dave  | 1             | [1]            | ['S']                 | ['17:00-20:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 09:00        | 10:00          |
+      | FL902  | 12:00        | 13:00          |
+      | FL903  | 17:30        | 18:30          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 3           | 1           | 1.0      | FL901         | A              | D            | S            |
+      | 2  | 1          | 1             | 3           | 1           | 2.0      | FL902         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 1           | 3.0      | FL903         | A              | D            | S            |
+
+  Scenario: Diff of a removed flight grouped per staff and per flight
+    When the scheduler runs
+    And a copy of the plan is kept
+    And flight "FL902" is removed from the plan
+
+    Then the plan diff per staff should be:
+      | staff_id | added | removed |
+      | 1        | []    | [2]     |
+      | 2        | []    | [2]     |
+      | 3        | []    | [2]     |
+    And the plan diff should only change flights ['FL902']
+    And the plan diff should move []
+    And patching the copy with the plan diff should give the plan
+
+  Scenario: Staff members reassigned to another service assignment are reported as moves
+    When the scheduler runs
+    And a copy of the plan is kept
+    And flight "FL902" is removed from the plan
+    And staff 4 is moved from service assignment 3 to service assignment 1 in the plan
+
+    Then the plan diff per staff should be:
+      | staff_id | added | removed |
+      | 1        | []    | [2]     |
+      | 2        | []    | [2]     |
+      | 3        | []    | [2]     |
+      | 4        | [1]   | [3]     |
+    And the plan diff should move [(4, 3, 1)]
+    And the plan diff should only change flights ['FL901', 'FL902', 'FL903']
+    And patching the copy with the plan diff should give the plan
@@ -0,0 +1,106 @@
+Feature: Allocation Plan Staff Index
+  As a dispatcher
+  I want to know who is busy or free in a time window
+  So that I can reassign staff without scanning the whole plan
+
+  Scenario: Busy and free staff in a time window
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 09:00        | 10:00          |
+      | FL902  | 12:00        | 13:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 2           | 1           | 1.0      | FL901         | A              | D            | S            |
+      | 2  | 1          | 1             | 2           | 1           | 2.0      | FL902         | A              | D            | S            |
+
+    When the scheduler runs
+
+    Then the busy staff from "09:30" to "09:45" should be [1, 2]
+    And the free staff from "10:00" to "12:00" should be [1, 2]
+    And the busy staff from "11:00" to "12:01" should be [1, 2]
+    And staff 1 should be assigned to [1, 2]
+
+    When staff 2 is removed from the plan
+
+    Then the busy staff from "09:30" to "09:45" should be [1]
+    And the free staff from "12:00" to "13:00" should be [2]
+    And staff 2 should be assigned to []
+
+    When flight "FL901" is removed from the plan
+
+    Then the free staff from "09:00" to "10:00" should be [1, 2]
+    And the busy staff from "12:30" to "12:45" should be [1]
+    And staff 1 should be assigned to [2]
+
+  Scenario: Time windows crossing midnight
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['22:00-02:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 23:30        | 00:30          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL901         | A              | D            | S            |
+
+    When the scheduler runs
+
+    Then the busy staff from "00:00" to "00:15" should be [1]
+    And the busy staff from "23:00" to "23:45" should be [1]
+    And the busy staff from "23:50" to "00:10" should be [1]
+    And the free staff from "00:30" to "23:30" should be [1]
+
+  Scenario: A long common zone allocation only makes its own staff busy
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['00:00-23:59'] |
+      | 2  | Bob   | 1             | [2]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name     | certifications | requirement |
+      | 1  | Security | [1]            | All         |
+      | 2  | GPU      | [2]            | All         |
+
+    And the following locations exist:
+      | id | name       |
+      | 1  | Terminal A |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | start_time | end_time | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 00:00      | 23:59    | S            |
+      | 2  | 2          | 1             | 1           | 1           | 09:00      | 10:00    | S            |
+
+    When the scheduler runs
+
+    Then the busy staff from "12:00" to "12:30" should be [1]
+    And the busy staff from "09:30" to "09:45" should be [1, 2]
+
+    When staff 1 is removed from the plan
+
+    Then the busy staff from "12:00" to "12:30" should be []
+    And the free staff from "00:00" to "08:00" should be [1, 2]
+    And the busy staff from "09:59" to "10:30" should be [2]
@@ -0,0 +1,48 @@
+Feature: Allocation Plan Binary Format
+  As an operations auditor
+  I want plans snapshotted and journaled in a compact binary format
+  So that I can store and replay them at hub scale
+
+  Background:
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 09:00        | 10:00          |
+      | FL902  | 12:00        | 13:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 2           | 1           | 1.0      | FL901         | A              | D            | S            |
+      | 2  | 1          | 1             | 2           | 1           | 2.0      | FL902         | A              | D            | S            |
+
+  Scenario: Plan round trip through the binary format
+    When the scheduler runs
+    And the plan is saved and loaded back in the binary format
+
+    Then the flight zone schedule of "FL901" should list staff [1, 2]
+    And the busy staff from "09:00" to "10:00" should be [1, 2]
+    And staff 1 should be assigned to [1, 2]
+
+  Scenario: Journal replay applies the diffs after the last snapshot
+    When the scheduler runs
+    And the plan is written to the journal
+    And staff 2 is removed from the plan and the change is written to the journal
+    And the journal is replayed into a new plan
+
+    Then the flight zone schedule of "FL901" should list staff [1]
+    And the staff schedule should be:
+      | staff_id | service_assignment_ids |
+      | 1        | [1, 2]                 |
+      | 2        | []                     |
@@ -0,0 +1,91 @@
+Feature: Allocation Plan Views
+  As a dispatcher
+  I want the schedules of a plan in chronological order
+  So that each staff member's day reads in order
+
+  Scenario: Staff schedule is sorted by start time
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-18:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 15:00        | 15:45          |
+      | FL902  | 09:00        | 09:45          |
+      | FL903  | 12:00        | 12:45          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL901         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 1           | 2.0      | FL902         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 1           | 3.0      | FL903         | A              | D            | S            |
+
+    When the scheduler runs
+
+    Then the staff schedule should be:
+      | staff_id | service_assignment_ids |
+      | 1        | [2, 3, 1]              |
+
+  Scenario: Views follow changes of the allocations
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 09:00        | 10:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 2           | 1           | 1.0      | FL901         | A              | D            | S            |
+
+    When the scheduler runs
+
+    Then the flight zone schedule of "FL901" should list staff [1, 2]
+
+    When staff 2 is removed from the plan
+
+    Then the flight zone schedule of "FL901" should list staff [1]
+    And the staff schedule should be:
+      | staff_id | service_assignment_ids |
+      | 1        | [1]                    |
+      | 2        | []                     |
+
+  Scenario: Common zone services keep their priority as flight priority in the staff schedule only
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name  | certifications | requirement |
+      | 1  | Guide | [1]            | All         |
+
+    And the following locations exist:
+      | id | name       |
+      | 1  | Terminal A |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | start_time | end_time | service_type | priority |
+      | 1  | 1          | 1             | 1           | 1           | 09:00      | 10:00    | S            | 2.0      |
+
+    When the scheduler runs
+
+    Then the staff schedule entry of service assignment 1 should have flight priority 2
+    And the common zone schedule entry of service assignment 1 should have flight priority None
@@ -0,0 +1,56 @@
+Feature: Rolling Horizon
+  As a scheduler
+  I want to solve the day in overlapping time windows
+  So that solve time grows with the length of the day instead of faster
+
+  Scenario: Windows are stitched into one plan respecting transitions across window boundaries
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['06:00-18:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['06:00-18:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 07:00        | 08:00          |
+      | FL902  | 08:50        | 09:50          |
+      | FL903  | 09:00        | 10:00          |
+      | FL904  | 09:10        | 10:10          |
+      | FL905  | 14:00        | 15:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+      | 4  | Bay 4 |
+      | 5  | Bay 5 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL901         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL902         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL903         | A              | D            | S            |
+      | 4  | 1          | 1             | 1           | 4           | 4.0      | FL904         | A              | D            | S            |
+      | 5  | 1          | 1             | 1           | 5           | 5.0      | FL905         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time |
+      | 5                      | 15                  |
+
+    When the rolling horizon scheduler runs with 120 minute windows overlapping 30 minutes
+
+    Then the rolling horizon should solve 3 windows
+
+    And the rolling horizon objective should be the objective of the plan solved frozen
+
+    And the plan coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 1                    |
+      | 4                     | 0                    |
+      | 5                     | 1                    |
@@ -0,0 +1,50 @@
+Feature: Scheduler Metrics
+  As a maintainer
+  I want the cost of every build and solve stage recorded
+  So that build cost regressions show up between releases
+
+  Scenario: Every stage reports the variables and constraints it added
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL971  | 09:00        | 10:00          |
+      | FL972  | 09:30        | 10:30          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL971         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL972         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | transition_encoding |
+      | 5                      | 15                  | Pairwise            |
+
+    When the scheduler runs
+
+    Then the scheduler metrics should be:
+      | name                        | variables_added | constraints_added |
+      | overlap_detection           | 0               | 0                 |
+      | feasibility                 | 0               | 0                 |
+      | compile                     | 0               | 0                 |
+      | variables                   | 4               | 0                 |
+      | StaffCountConstraint        | 0               | 2                 |
+      | ServiceTransitionConstraint | 0               | 2                 |
+      | SingleServiceConstraint     | 0               | 4                 |
+      | FixedServiceConstraint      | 0               | 0                 |
+      | MultiTaskServiceConstraint  | 0               | 0                 |
+      | strategy                    | 4               | 4                 |
+      | solve                       | 0               | 0                 |
+      | extraction                  | 0               | 0                 |
@@ -0,0 +1,46 @@
+Feature: Solution Stream
+  As a dispatcher
+  I want every improving solution to be streamed as an allocation plan
+  So that a usable plan is available while the solver keeps working
+
+  Scenario: Streamed solutions end with the final solution
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL601  | 09:00        | 10:00          |
+      | FL602  | 09:05        | 10:05          |
+      | FL603  | 09:10        | 10:10          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL601         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL602         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL603         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time |
+      | 5                      | 15                  |
+
+    When the scheduler streams solutions
+
+    Then the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 0                    |
+
+    And the last streamed plan should match the solution
@@ -0,0 +1,88 @@
+Feature: Solver Profile
+  As a scheduler
+  I want to run the solver with a predefined profile of time limits and search parameters
+  So that a run never blocks longer than the use case allows and reports why it stopped
+
+  Scenario: Realtime profile covers every service assignment
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL501  | 09:00        | 10:00          |
+      | FL502  | 09:05        | 10:05          |
+      | FL503  | 11:00        | 12:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL501         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL502         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL503         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy | solver_profile |
+      | 5                      | 15                  | Minimize Staff      | Realtime       |
+
+    When the scheduler runs
+
+    Then the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 1                    |
+
+  Scenario: Overnight profile solves a small day to optimality
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL501  | 09:00        | 10:00          |
+      | FL502  | 09:05        | 10:05          |
+      | FL503  | 11:00        | 12:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL501         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL502         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL503         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy | solver_profile |
+      | 5                      | 15                  | Minimize Staff      | Overnight      |
+
+    When the scheduler runs
+
+    Then the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 1                    |
+
+    And the solver report should be:
+      | termination_reason |
+      | Optimal            |
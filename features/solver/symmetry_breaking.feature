@@ -0,0 +1,79 @@
+Feature: Symmetry Breaking
+  As a scheduler
+  I want interchangeable staff to be recognized
+  So that the solver does not explore the permutations of their schedules
+
+  Scenario: Interchangeable staff are grouped into equivalence classes
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          | rank_level |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] | 1          |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] | 1          |
+      | 3  | Carol | 1             | [1]            | ['S']                 | ['08:00-16:00'] | 1          |
+      | 4  | Dave  | 1             | [1]            | ['S']                 | ['08:00-16:00'] | 2          |
+      | 5  | Erin  | 1             | [1]            | ['S']                 | ['10:00-18:00'] | 1          |
+      | 6  | Frank | 1             | [1]            | ['S']                 | ['10:00-18:00'] | 1          |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 09:00        | 10:00          |
+      | FL902  | 10:30        | 11:30          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL901         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL902         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | break_symmetry |
+      | 5                      | 15                  | True           |
+
+    When the scheduler runs
+
+    Then the staff equivalence classes should be [[1, 2, 3], [5, 6]]
+
+  Scenario: Equivalent staff take their schedules in staff id order
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 3  | Carol | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 09:00        | 10:00          |
+      | FL902  | 10:30        | 11:30          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL901         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL902         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | break_symmetry |
+      | 5                      | 15                  | True           |
+
+    When the scheduler runs
+
+    Then the assignments should be:
+      | staff_id | assigned_service_ids |
+      | 1        | [1]                  |
+      | 2        | [2]                  |
+      | 3        | []                   |
@@ -0,0 +1,86 @@
+Feature: Warm Start
+  As a dispatcher
+  I want the scheduler to start from the previous plan
+  So that a re-run after a change finds a good plan quickly
+
+  Scenario: Previous plan is kept when nothing changed
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 09:00        | 10:00          |
+      | FL902  | 10:30        | 11:30          |
+      | FL903  | 13:00        | 14:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL901         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL902         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL903         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy |
+      | 5                      | 15                  | Minimize Staff      |
+
+    And the scheduler has produced a plan
+
+    When the scheduler runs warm started from the plan
+
+    Then the last plan should be kept
+
+  Scenario: Infeasible hint is repaired after a delay
+    Given the following staff exists:
+      | id | name  | department_id | certifications | eligible_for_services | shifts          |
+      | 1  | Alice | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+      | 2  | Bob   | 1             | [1]            | ['S']                 | ['08:00-16:00'] |
+
+    And the following services exist:
+      | id | name | certifications | requirement |
+      | 1  | GPU  | [1]            | All         |
+
+    And the following flights exist:
+      | number | arrival_time | departure_time |
+      | FL901  | 09:00        | 10:00          |
+      | FL902  | 10:30        | 11:30          |
+      | FL903  | 13:00        | 14:00          |
+
+    And the following locations exist:
+      | id | name  |
+      | 1  | Bay 1 |
+      | 2  | Bay 2 |
+      | 3  | Bay 3 |
+
+    And the following service assignments exist:
+      | id | service_id | department_id | staff_count | location_id | priority | flight_number | relative_start | relative_end | service_type |
+      | 1  | 1          | 1             | 1           | 1           | 1.0      | FL901         | A              | D            | S            |
+      | 2  | 1          | 1             | 1           | 2           | 2.0      | FL902         | A              | D            | S            |
+      | 3  | 1          | 1             | 1           | 3           | 3.0      | FL903         | A              | D            | S            |
+
+    And the following settings exist:
+      | overlap_buffer_minutes | default_travel_time | assignment_strategy | repair_hints |
+      | 5                      | 15                  | Minimize Staff      | True         |
+
+    And the scheduler has produced a plan
+
+    And flight "FL901" now arrives at "10:00" and departs at "11:00"
+
+    When the scheduler runs warm started from the plan
+
+    Then the service coverage should be:
+      | service_assignment_id | assigned_staff_count |
+      | 1                     | 1                    |
+      | 2                     | 1                    |
+      | 3                     | 1                    |
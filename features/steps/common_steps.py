@@ -1,9 +1,19 @@
 from behave import given, when, then
 from opspilot.models import Staff, Service, Flight, Location, ServiceAssignment, ServiceType
-from opspilot.models import EquipmentType, Shift, CertificationRequirement, Settings, TravelTime
-from opspilot.services import OverlapDetectionService
+from opspilot.models import EquipmentType, Shift, CertificationRequirement, Settings, TravelTime, Disruption
+from opspilot.services import OverlapDetectionService, FeasibilityService
 from opspilot.core.scheduler import Scheduler
+from opspilot.core.incremental_scheduler import IncrementalScheduler
+from opspilot.core.rolling_horizon_scheduler import RollingHorizonScheduler
+from opspilot.core.decomposed_scheduler import DecomposedScheduler
+from opspilot.core.greedy_scheduler import GreedyScheduler
+from opspilot.core.lns_scheduler import LnsScheduler
+from opspilot.plans import AllocationPlan, PlanDiff, PlanJournal
+from datetime import time
+from pathlib import Path
 import ast
+import json
+import tempfile
 
 def parse_human_friendly_shifts(shift_strings):
     shifts = []
@@ -131,7 +141,13 @@ def setup_settings(context, settings_table):
     context.settings = Settings(
         overlap_buffer_minutes=int(settings_row.get('overlap_buffer_minutes', 10)),
         default_travel_time=int(settings_row.get('default_travel_time', 10)),
-        assignment_strategy=settings_row.get('assignment_strategy', 'Balance Workload')
+        assignment_strategy=settings_row.get('assignment_strategy', 'Balance Workload'),
+        transition_encoding=settings_row.get('transition_encoding', 'Clique'),
+        scheduling_engine=settings_row.get('scheduling_engine', 'Overlap Map'),
+        solver_profile=settings_row.get('solver_profile', 'Default'),
+        objective_mode=settings_row.get('objective_mode', 'Weighted'),
+        repair_hints=settings_row.get('repair_hints', 'False') == 'True',
+        break_symmetry=settings_row.get('break_symmetry', 'False') == 'True'
     )
 
 def setup_flight_map(context):
@@ -203,6 +219,41 @@ def step_impl(context):
             f"Expected: {expected_overlaps}, Actual: {actual_overlaps}"
         )
 
+@when('the certification matrix is computed')
+def step_impl(context):
+    setup_flight_map(context)
+
+    context.certified, context.certified_service_index = FeasibilityService(
+        roster=context.staff,
+        service_assignments=context.service_assignments,
+        service_map={service.id: service for service in context.services},
+        flight_map=context.flight_map
+    ).certification_matrix()
+
+@then('the certified services should be')
+def step_impl(context):
+    service_map = {service.id: service for service in context.services}
+    staff_index = {staff.id: i for i, staff in enumerate(context.staff)}
+    for row in context.table:
+        staff_id = int(row['staff_id'])
+        expected = ast.literal_eval(row['certified_service_ids'])
+        actual = [
+            service_id for service_id, k in context.certified_service_index.items()
+            if context.certified[staff_index[staff_id], k]
+        ]
+        assert set(actual) == set(expected), (
+            f"Staff {staff_id} certification mismatch. "
+            f"Expected: {expected}, Actual: {actual}"
+        )
+
+        # The single staff check must agree with the matrix
+        staff = context.staff[staff_index[staff_id]]
+        single = [service_id for service_id, service in service_map.items() if staff.is_certified_for_service(service)]
+        assert set(single) == set(expected), (
+            f"Staff {staff_id} is_certified_for_service mismatch. "
+            f"Expected: {expected}, Actual: {single}"
+        )
+
 @when('the scheduler runs')
 def step_impl(context):
     context.scheduler = Scheduler(
@@ -216,6 +267,30 @@ def step_impl(context):
     )
     context.scheduler.run()
 
+@when('the scheduler streams solutions')
+def step_impl(context):
+    context.scheduler = Scheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        travel_times=context.travel_times,
+        settings=context.settings
+    )
+    context.streamed_plans = list(context.scheduler.stream_solutions())
+
+@then('the last streamed plan should match the solution')
+def step_impl(context):
+    assert context.streamed_plans, "No allocation plan was streamed"
+    location_map = {location.id: location for location in context.locations}
+    expected = context.scheduler.get_allocation_plan(location_map).allocations
+    actual = context.streamed_plans[-1].allocations
+    assert actual == expected, (
+        f"Last streamed plan mismatch. "
+        f"Expected: {expected}, Actual: {actual}"
+    )
+
 @then('the assignments should be')
 def step_impl(context):
     actual_assignments = context.scheduler.get_assignments()
@@ -238,4 +313,472 @@ def step_impl(context):
         assert actual == expected, (
             f"Service {sa_id} coverage mismatch. "
             f"Expected: {expected}, Actual: {actual}"
-        )
\ No newline at end of file
+        )
+@then('the solver report should be')
+def step_impl(context):
+    report = context.scheduler.solver_report
+    row = context.table[0]
+    assert report.termination_reason.value == row['termination_reason'], (
+        f"Termination reason mismatch. "
+        f"Expected: {row['termination_reason']}, Actual: {report.termination_reason.value}"
+    )
+    if 'best_objective_bound' in row.headings:
+        expected = float(row['best_objective_bound'])
+        assert report.best_objective_bound == expected, (
+            f"Best objective bound mismatch. "
+            f"Expected: {expected}, Actual: {report.best_objective_bound}"
+        )
+
+@given('the scheduler has produced a plan')
+def step_impl(context):
+    scheduler = Scheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        travel_times=context.travel_times,
+        settings=context.settings
+    )
+    scheduler.run()
+    context.previous_plan = scheduler.get_allocation_plan({location.id: location for location in context.locations})
+    context.incremental_scheduler = IncrementalScheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        settings=context.settings,
+        plan=context.previous_plan,
+        travel_times=context.travel_times
+    )
+
+def run_greedy_scheduler(context):
+    return GreedyScheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        travel_times=context.travel_times,
+        settings=context.settings
+    ).run()
+
+@when('the greedy scheduler runs')
+def step_impl(context):
+    context.plan = run_greedy_scheduler(context)
+
+@given('the greedy scheduler has produced a plan')
+def step_impl(context):
+    context.previous_plan = run_greedy_scheduler(context)
+
+@given('flight "{flight_number}" now arrives at "{arrival_time}" and departs at "{departure_time}"')
+def step_impl(context, flight_number, arrival_time, departure_time):
+    flight = Flight(number=flight_number, arrival_time=arrival_time, departure_time=departure_time)
+    context.flights = [flight if f.number == flight_number else f for f in context.flights]
+
+@when('the scheduler runs warm started from the plan')
+def step_impl(context):
+    context.scheduler = Scheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        travel_times=context.travel_times,
+        settings=context.settings,
+        hints=context.previous_plan
+    )
+    context.scheduler.run()
+
+@when('flight "{flight_number}" is rescheduled to arrive at "{arrival_time}" and depart at "{departure_time}"')
+def step_impl(context, flight_number, arrival_time, departure_time):
+    flight = Flight(number=flight_number, arrival_time=arrival_time, departure_time=departure_time)
+    context.plan = context.incremental_scheduler.resolve(Disruption(changed_flights=[flight]))
+
+@when('flight "{flight_number}" is cancelled')
+def step_impl(context, flight_number):
+    context.plan = context.incremental_scheduler.resolve(Disruption(cancelled_flights=[flight_number]))
+
+@when('staff {staff_id:d} calls in sick')
+def step_impl(context, staff_id):
+    context.plan = context.incremental_scheduler.resolve(Disruption(removed_staff_ids=[staff_id]))
+
+@when('the shifts of staff {staff_id:d} change to {shifts}')
+def step_impl(context, staff_id, shifts):
+    staff = next(staff for staff in context.incremental_scheduler.roster if staff.id == staff_id)
+    updated = staff.model_copy(update={'shifts': parse_human_friendly_shifts(ast.literal_eval(shifts))})
+    context.plan = context.incremental_scheduler.resolve(Disruption(added_staff=[updated]))
+
+@then('the plan coverage should be')
+def step_impl(context):
+    for row in context.table:
+        sa_id = int(row['service_assignment_id'])
+        expected = int(row['assigned_staff_count'])
+        actual = len(context.plan.allocations.get(sa_id, set()))
+        assert actual == expected, (
+            f"Service {sa_id} plan coverage mismatch. "
+            f"Expected: {expected}, Actual: {actual}"
+        )
+
+@then('the plan assignments should be')
+def step_impl(context):
+    for row in context.table:
+        staff_id = int(row['staff_id'])
+        expected = ast.literal_eval(row['assigned_service_ids'])
+        actual = [sa_id for sa_id, staff_ids in context.plan.allocations.items() if staff_id in staff_ids]
+        assert set(actual) == set(expected), (
+            f"Staff {staff_id} plan assignment mismatch. "
+            f"Expected: {expected}, Actual: {actual}"
+        )
+
+@then('the re-solved service assignments should be {expected}')
+def step_impl(context, expected):
+    expected = ast.literal_eval(expected)
+    actual = context.incremental_scheduler.neighbourhood
+    assert actual == set(expected), (
+        f"Re-solved service assignments mismatch. "
+        f"Expected: {expected}, Actual: {sorted(actual)}"
+    )
+
+@then('the released allocations should be {expected}')
+def step_impl(context, expected):
+    expected = ast.literal_eval(expected)
+    actual = context.incremental_scheduler.released
+    assert actual == expected, (
+        f"Released allocations mismatch. "
+        f"Expected: {expected}, Actual: {actual}"
+    )
+
+@when('the rolling horizon scheduler runs with {window_minutes:d} minute windows overlapping {overlap_minutes:d} minutes')
+def step_impl(context, window_minutes, overlap_minutes):
+    context.rolling_horizon_scheduler = RollingHorizonScheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        settings=context.settings,
+        travel_times=context.travel_times,
+        window_minutes=window_minutes,
+        overlap_minutes=overlap_minutes
+    )
+    context.plan = context.rolling_horizon_scheduler.run()
+
+@then('the rolling horizon should solve {window_count:d} windows')
+def step_impl(context, window_count):
+    actual = context.rolling_horizon_scheduler.window_count
+    assert actual == window_count, (
+        f"Window count mismatch. "
+        f"Expected: {window_count}, Actual: {actual}"
+    )
+
+@then('the rolling horizon objective should be the objective of the plan solved frozen')
+def step_impl(context):
+    scheduler = Scheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        travel_times=context.travel_times,
+        settings=context.settings,
+        frozen={sa.id: context.plan.allocations.get(sa.id, set()) for sa in context.service_assignments}
+    )
+    scheduler.run()
+    actual = context.rolling_horizon_scheduler.objective_value
+    assert actual == scheduler.objective_value, (
+        f"Rolling horizon objective mismatch. "
+        f"Expected: {scheduler.objective_value}, Actual: {actual}"
+    )
+
+@when('the decomposed scheduler runs with {max_workers:d} workers')
+def step_impl(context, max_workers):
+    context.decomposed_scheduler = DecomposedScheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        settings=context.settings,
+        travel_times=context.travel_times,
+        max_workers=max_workers
+    )
+    context.decomposed_scheduler.run()
+    context.plan = context.decomposed_scheduler.get_allocation_plan()
+
+@then('the problem should be split into {component_count:d} components')
+def step_impl(context, component_count):
+    actual = len(context.decomposed_scheduler.components)
+    assert actual == component_count, (
+        f"Component count mismatch. "
+        f"Expected: {component_count}, Actual: {actual}"
+    )
+
+@then('the decomposed objective should match a single solve')
+def step_impl(context):
+    scheduler = Scheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        travel_times=context.travel_times,
+        settings=context.settings
+    )
+    scheduler.run()
+    actual = context.decomposed_scheduler.objective_value
+    assert actual == scheduler.objective_value, (
+        f"Decomposed objective mismatch. "
+        f"Expected: {scheduler.objective_value}, Actual: {actual}"
+    )
+
+@then('the objective stages should be')
+def step_impl(context):
+    actual = [(report.name, report.objective_value) for report in context.scheduler.stage_reports]
+    expected = [(row['name'], float(row['objective_value'])) for row in context.table]
+    assert actual == expected, (
+        f"Objective stages mismatch. "
+        f"Expected: {expected}, Actual: {actual}"
+    )
+
+@then('the last plan should be kept')
+def step_impl(context):
+    location_map = {location.id: location for location in context.locations}
+    expected = context.previous_plan.allocations
+    actual = context.scheduler.get_allocation_plan(location_map).allocations
+    assert actual == expected, (
+        f"Warm started plan mismatch. "
+        f"Expected: {expected}, Actual: {actual}"
+    )
+
+@when('the LNS scheduler improves the plan for {iterations:d} iterations')
+def step_impl(context, iterations):
+    run_lns_scheduler(context, iterations, seed=0)
+
+@when('the LNS scheduler improves the plan for {iterations:d} iterations with seed {seed:d}')
+def step_impl(context, iterations, seed):
+    run_lns_scheduler(context, iterations, seed)
+
+def run_lns_scheduler(context, iterations, seed):
+    context.lns_scheduler = LnsScheduler(
+        roster=context.staff,
+        services=context.services,
+        flights=context.flights,
+        service_assignments=context.service_assignments,
+        locations=context.locations,
+        travel_times=context.travel_times,
+        settings=context.settings,
+        plan=context.previous_plan,
+        max_iterations=iterations,
+        seed=seed
+    )
+    context.plan = context.lns_scheduler.run()
+
+@then('the LNS objective should have improved')
+def step_impl(context):
+    trajectory = context.lns_scheduler.trajectory
+    assert len(trajectory) > 1 and trajectory[-1][1] > trajectory[0][1], (
+        f"LNS objective did not improve. Trajectory: {trajectory}"
+    )
+
+@when('the scheduler solves again')
+def step_impl(context):
+    context.scheduler.solve()
+
+@then('the built model should have no objective')
+def step_impl(context):
+    proto = context.scheduler.model.Proto()
+    assert not proto.HasField('objective'), f"Built model has an objective: {proto.objective}"
+
+@then('the LNS objective should be the stage values of the plan')
+def step_impl(context):
+    lns_scheduler = context.lns_scheduler
+    pairs = [(staff_id, sa_id) for sa_id, staff_ids in context.plan.allocations.items() for staff_id in staff_ids]
+    expected = lns_scheduler.strategy.evaluate(pairs)
+    assert lns_scheduler.objective_value == expected, (
+        f"LNS objective mismatch. "
+        f"Expected: {expected}, Actual: {lns_scheduler.objective_value}"
+    )
+
+@then('the staff equivalence classes should be {expected}')
+def step_impl(context, expected):
+    expected_classes = ast.literal_eval(expected)
+    assert context.scheduler.staff_classes == expected_classes, (
+        f"Equivalence classes mismatch. Expected: {expected_classes}, Actual: {context.scheduler.staff_classes}"
+    )
+
+def allocation_plan(context):
+    if context.allocation_plan is None:
+        context.allocation_plan = context.scheduler.get_allocation_plan({location.id: location for location in context.locations})
+    return context.allocation_plan
+
+@when('staff {staff_id:d} is removed from the plan')
+def step_impl(context, staff_id):
+    allocation_plan(context).remove_staff(staff_id)
+
+@then('the staff schedule should be')
+def step_impl(context):
+    staff_schedule = allocation_plan(context).staff_schedule()
+    for row in context.table:
+        staff_id = int(row['staff_id'])
+        expected = ast.literal_eval(row['service_assignment_ids'])
+        actual = [entry.service_assignment_id for entry in staff_schedule.get(staff_id, [])]
+        assert actual == expected, (
+            f"Staff {staff_id} schedule mismatch. "
+            f"Expected: {expected}, Actual: {actual}"
+        )
+
+@then('the flight zone schedule of "{flight_number}" should list staff {expected}')
+def step_impl(context, flight_number, expected):
+    expected_staff_ids = ast.literal_eval(expected)
+    entries = allocation_plan(context).flight_zone_services_schedule().get(flight_number, [])
+    actual = sorted(entry.staff_id for entry in entries)
+    assert actual == expected_staff_ids, (
+        f"Flight {flight_number} schedule mismatch. "
+        f"Expected: {expected_staff_ids}, Actual: {actual}"
+    )
+
+@then('the {view} schedule entry of service assignment {sa_id:d} should have flight priority {expected}')
+def step_impl(context, view, sa_id, expected):
+    expected = ast.literal_eval(expected)
+    plan = allocation_plan(context)
+    schedule = plan.staff_schedule() if view == "staff" else plan.common_zone_services_schedule()
+    actual = [entry.flight_priority for entries in schedule.values() for entry in entries if entry.service_assignment_id == sa_id]
+    assert actual == [expected], (
+        f"Flight priority mismatch in the {view} schedule of service assignment {sa_id}. "
+        f"Expected: {expected}, Actual: {actual}"
+    )
+
+@when('flight "{flight_number}" is removed from the plan')
+def step_impl(context, flight_number):
+    allocation_plan(context).remove_flight(flight_number)
+
+@then('the busy staff from "{start}" to "{end}" should be {expected}')
+def step_impl(context, start, end, expected):
+    expected_staff_ids = ast.literal_eval(expected)
+    actual = sorted(allocation_plan(context).busy_staff(time.fromisoformat(start), time.fromisoformat(end)))
+    assert actual == expected_staff_ids, (
+        f"Busy staff mismatch from {start} to {end}. "
+        f"Expected: {expected_staff_ids}, Actual: {actual}"
+    )
+
+@then('the free staff from "{start}" to "{end}" should be {expected}')
+def step_impl(context, start, end, expected):
+    expected_staff_ids = ast.literal_eval(expected)
+    actual = sorted(allocation_plan(context).free_staff(time.fromisoformat(start), time.fromisoformat(end)))
+    assert actual == expected_staff_ids, (
+        f"Free staff mismatch from {start} to {end}. "
+        f"Expected: {expected_staff_ids}, Actual: {actual}"
+    )
+
+@then('staff {staff_id:d} should be assigned to {expected}')
+def step_impl(context, staff_id, expected):
+    expected_sa_ids = ast.literal_eval(expected)
+    actual = sorted(allocation_plan(context).staff_assignments(staff_id))
+    assert actual == expected_sa_ids, (
+        f"Staff {staff_id} assignments mismatch. "
+        f"Expected: {expected_sa_ids}, Actual: {actual}"
+    )
+
+def plan_path(context, name):
+    if context.plan_directory is None:
+        context.plan_directory = tempfile.TemporaryDirectory()
+    return Path(context.plan_directory.name) / name
+
+def new_allocation_plan(context):
+    plan = allocation_plan(context)
+    return AllocationPlan(plan.service_assignment_map, plan.service_map, plan.staff_map, plan.flight_map, plan.location_map)
+
+@when('the plan is saved and loaded back in the binary format')
+def step_impl(context):
+    path = plan_path(context, "plan.bin")
+    allocation_plan(context).save(path)
+    context.allocation_plan = new_allocation_plan(context)
+    context.allocation_plan.load(path)
+
+@when('the plan is written to the journal')
+def step_impl(context):
+    PlanJournal(plan_path(context, "plan.journal")).append_snapshot(allocation_plan(context))
+
+@when('staff {staff_id:d} is removed from the plan and the change is written to the journal')
+def step_impl(context, staff_id):
+    plan = allocation_plan(context)
+    removed = {sa_id: [staff_id] for sa_id in plan.staff_assignments(staff_id)}
+    plan.remove_staff(staff_id)
+    PlanJournal(plan_path(context, "plan.journal")).append_diff(PlanDiff(removed=removed))
+
+@when('the journal is replayed into a new plan')
+def step_impl(context):
+    replayed = new_allocation_plan(context)
+    PlanJournal(plan_path(context, "plan.journal")).replay(replayed)
+    context.allocation_plan = replayed
+
+@when('a copy of the plan is kept')
+def step_impl(context):
+    context.base_plan = new_allocation_plan(context)
+    context.base_plan.from_bytes(allocation_plan(context).to_bytes())
+
+@when('staff {staff_id:d} is moved from service assignment {from_id:d} to service assignment {to_id:d} in the plan')
+def step_impl(context, staff_id, from_id, to_id):
+    plan = allocation_plan(context)
+    plan.remove_allocation(from_id, staff_id)
+    plan.add_allocation(to_id, staff_id)
+
+@then('the plan diff per staff should be')
+def step_impl(context):
+    per_staff = context.base_plan.diff(allocation_plan(context)).per_staff()
+    actual = {
+        staff_id: (sorted(diff.added), sorted(diff.removed))
+        for staff_id, diff in per_staff.items()
+    }
+    expected = {
+        int(row['staff_id']): (ast.literal_eval(row['added']), ast.literal_eval(row['removed']))
+        for row in context.table
+    }
+    assert actual == expected, (
+        f"Plan diff per staff mismatch. "
+        f"Expected: {expected}, Actual: {actual}"
+    )
+
+@then('the plan diff should move {expected}')
+def step_impl(context, expected):
+    expected_moves = [tuple(move) for move in ast.literal_eval(expected)]
+    actual = context.base_plan.diff(allocation_plan(context)).moved()
+    assert actual == expected_moves, (
+        f"Plan diff moves mismatch. "
+        f"Expected: {expected_moves}, Actual: {actual}"
+    )
+
+@then('the plan diff should only change flights {expected}')
+def step_impl(context, expected):
+    expected_flights = ast.literal_eval(expected)
+    plan = allocation_plan(context)
+    actual = sorted(context.base_plan.diff(plan).per_flight(plan.service_assignment_map), key=str)
+    assert actual == expected_flights, (
+        f"Plan diff flights mismatch. "
+        f"Expected: {expected_flights}, Actual: {actual}"
+    )
+
+@then('patching the copy with the plan diff should give the plan')
+def step_impl(context):
+    plan = allocation_plan(context)
+    context.base_plan.patch(context.base_plan.diff(plan))
+    assert context.base_plan.allocations == plan.allocations, (
+        f"Patched plan mismatch. "
+        f"Expected: {plan.allocations}, Actual: {context.base_plan.allocations}"
+    )
+    assert context.base_plan.diff(plan).is_empty(), "Patched plan still differs from the plan"
+
+@then('the scheduler metrics should be')
+def step_impl(context):
+    metrics = json.loads(context.scheduler.metrics.to_json())
+    actual = [(stage['name'], stage['variables_added'], stage['constraints_added']) for stage in metrics['stages']]
+    expected = [
+        (row['name'], int(row['variables_added']), int(row['constraints_added']))
+        for row in context.table
+    ]
+    assert actual == expected, (
+        f"Scheduler metrics mismatch. "
+        f"Expected: {expected}, Actual: {actual}"
+    )
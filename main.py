@@ -82,14 +82,15 @@ def run():
             print(f"Staff ID {staff_id} assigned to Service Assignment ID {assignment_id}") 
     
         location_map = {location.id: location for location in locations}
+        allocation_plan = scheduler.get_allocation_plan(location_map)
         
-        staff_schedule = scheduler.get_allocation_plan(location_map).staff_schedule()
+        staff_schedule = allocation_plan.staff_schedule()
         print(f"Staff schedule: #{staff_schedule}")
 
-        flight_zone_services_schedule = scheduler.get_allocation_plan(location_map).flight_zone_services_schedule()
+        flight_zone_services_schedule = allocation_plan.flight_zone_services_schedule()
         print(f"Flight zone services schedule: #{flight_zone_services_schedule}")
 
-        common_zone_services_schedule = scheduler.get_allocation_plan(location_map).common_zone_services_schedule()
+        common_zone_services_schedule = allocation_plan.common_zone_services_schedule()
         print(f"Common zone services schedule: #{common_zone_services_schedule}")
     else:
         print("No feasible schedule found.")
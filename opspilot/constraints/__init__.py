@@ -1,16 +1,15 @@
 from .constraint import Constraint
-from .staff_certification_constraint import StaffCertificationConstraint
-from .staff_eligibility_constraint import StaffEligibilityConstraint
 from .staff_count_constraint import StaffCountConstraint
-from .staff_role_constraint import StaffRoleConstraint
-from .staff_availability_constraint import StaffAvailabilityConstraint
 from .service_transition_constraint import ServiceTransitionConstraint
+from .no_overlap_transition_constraint import NoOverlapTransitionConstraint
 from .single_service_constraint import SingleServiceConstraint
 from .fixed_service_constraint import FixedServiceConstraint
 from .multi_task_service_constraint import MultiTaskServiceConstraint
+from .frozen_allocation_constraint import FrozenAllocationConstraint
+from .symmetry_breaking_constraint import SymmetryBreakingConstraint
 
 __all__ = [
-    'Constraint', 'StaffCertificationConstraint', 'StaffEligibilityConstraint', 'StaffRoleConstraint',
-    'StaffCountConstraint', 'StaffAvailabilityConstraint', 'ServiceTransitionConstraint',
-    'SingleServiceConstraint', 'FixedServiceConstraint', 'MultiTaskServiceConstraint'
+    'Constraint', 'StaffCountConstraint', 'ServiceTransitionConstraint', 'NoOverlapTransitionConstraint',
+    'SingleServiceConstraint', 'FixedServiceConstraint', 'MultiTaskServiceConstraint', 'FrozenAllocationConstraint',
+    'SymmetryBreakingConstraint',
 ]
\ No newline at end of file
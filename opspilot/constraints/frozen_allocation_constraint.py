@@ -0,0 +1,38 @@
+from ortools.sat.python.cp_model import CpModel, IntVar
+from typing import Dict, Tuple, Set
+from time import time
+import logging
+
+from opspilot.constraints import Constraint
+
+class FrozenAllocationConstraint(Constraint):
+    """
+    Pin the allocations kept from an existing plan: every frozen (staff, service assignment)
+    pair with a decision variable is fixed to 1. The scheduler creates no variables for other
+    staff on frozen service assignments, so they stay exactly as planned.
+
+    Frozen pairs without a variable are no longer feasible (e.g. the staff member's shift changed):
+    they cannot be pinned and are recorded in `dropped` (service_assignment_id -> staff_ids).
+    """
+    def __init__(self, frozen: Dict[int, Set[int]]):
+        self.frozen = frozen
+        self.dropped: Dict[int, Set[int]] = {}
+
+    def apply(self, model: CpModel, assignments: Dict[Tuple[int, int], IntVar]) -> None:
+        start_time = time()
+        logging.info("Applying FrozenAllocationConstraint...")
+
+        pinned_count = 0
+        self.dropped = {}
+        for sa_id, staff_ids in self.frozen.items():
+            for staff_id in staff_ids:
+                var = assignments.get((staff_id, sa_id))
+                if var is None:
+                    logging.warning(f"Frozen allocation of staff {staff_id} to service assignment {sa_id} is no longer feasible")
+                    self.dropped.setdefault(sa_id, set()).add(staff_id)
+                    continue
+
+                model.Add(var == 1)
+                pinned_count += 1
+
+        logging.info(f"Applied FrozenAllocationConstraint ({pinned_count} pinned, {sum(map(len, self.dropped.values()))} dropped) in {time() - start_time:.2f}s")
@@ -1,22 +1,16 @@
 from collections import defaultdict
 from ortools.sat.python import cp_model
 from typing import Dict, Tuple, List
-from opspilot.models import ServiceAssignment, ServiceType, Staff, Service
+from opspilot.models import ServiceType
 from opspilot.constraints import Constraint
+from opspilot.problem import CompiledProblem, SERVICE_TYPE_CODES
 import logging
 from time import time
 
 
 class MultiTaskServiceConstraint(Constraint):
-    def __init__(
-        self,
-        service_assignments: List[ServiceAssignment],
-        roster: List[Staff],
-        service_map: Dict[int, Service],
-    ):
-        self.service_assignments = service_assignments
-        self.roster = roster
-        self.service_map = service_map
+    def __init__(self, problem: CompiledProblem):
+        self.problem = problem
 
     def apply(self, model: cp_model.CpModel, assignments: Dict[Tuple[int, int], cp_model.IntVar]) -> None:
         """
@@ -27,78 +21,82 @@ class MultiTaskServiceConstraint(Constraint):
         start_time = time()
         logging.info("Applying MultiTaskServiceConstraints...")
 
-        # Group multi-task service assignments by flight number
-        flight_service_map = defaultdict(list)
-        for sa in self.service_assignments:
-            if sa.service_type == ServiceType.MULTI_TASK and sa.flight_number:
-                flight_service_map[sa.flight_number].append(sa)
+        problem = self.problem
+        multi_task = SERVICE_TYPE_CODES[ServiceType.MULTI_TASK]
+        task_ids = problem.task_ids.tolist()
+        task_flight = problem.task_flight.tolist()
+        task_type = problem.task_type.tolist()
+        task_service = problem.task_service.tolist()
+        task_limit = problem.task_multi_task_limit.tolist()
+
+        # Excluded services per multi-task service assignment, resolved once
+        excludes = {
+            j: set(problem.task_excludes(j).tolist())
+            for j in range(problem.task_count) if task_type[j] == multi_task
+        }
+
+        def excluded(j: int, k: int) -> bool:
+            return task_service[k] in excludes[j] or task_service[j] in excludes[k]
 
-        for staff in self.roster:
-            for flight_number, flight_services in flight_service_map.items():
-                # All multi-task service assignments on this flight that this staff might be assigned to
-                staff_services = [
-                    sa for sa in flight_services
-                    if (staff.id, sa.id) in assignments
-                    and staff.is_certified_for_service(self.service_map[sa.service_id])
-                    and staff.is_eligible_for_service(sa)
-                ]
+        for i, staff_id in enumerate(problem.staff_ids.tolist()):
+            # All multi-task service assignments per flight that this staff might be assigned to
+            flight_tasks = defaultdict(list)
+            for j in problem.tasks_of_staff(i).tolist():
+                if task_type[j] == multi_task and task_flight[j] >= 0 and (staff_id, task_ids[j]) in assignments:
+                    flight_tasks[task_flight[j]].append(j)
 
-                if not staff_services:
-                    continue
-            
-                staff_vars = {
-                    sa.id: assignments[(staff.id, sa.id)] for sa in staff_services
-                }
+            for flight, staff_tasks in flight_tasks.items():
+                staff_vars = {j: assignments[(staff_id, task_ids[j])] for j in staff_tasks}
+                flight_number = problem.flight_numbers[flight]
 
-                self._apply_exclude_services_constraint(model, staff_services, staff_vars, staff.id, flight_number)
-                self._apply_multi_task_limit_constraint(model, staff_services, staff_vars, staff.id, flight_number)
+                self._apply_exclude_services_constraint(model, staff_tasks, staff_vars, excluded, staff_id, flight_number)
+                self._apply_multi_task_limit_constraint(model, staff_tasks, staff_vars, excluded, task_limit, staff_id, flight_number)
 
         logging.info(f"Applied MultiTaskServiceConstraints in {time() - start_time:.2f}s")
 
     def _apply_exclude_services_constraint(
         self,
         model: cp_model.CpModel,
-        staff_services: List[ServiceAssignment],
+        staff_tasks: List[int],
         staff_vars: Dict[int, cp_model.IntVar],
+        excluded,
         staff_id: int,
         flight_number: str,
     ):
         """
         Ensure a staff is not assigned to two services that exclude each other on the same flight.
         """
-        for i in range(len(staff_services)):
-            sa1 = staff_services[i]
-            for j in range(i + 1, len(staff_services)):
-                sa2 = staff_services[j]
-                if sa2.service_id in sa1.exclude_services or sa1.service_id in sa2.exclude_services:
-                    var1 = staff_vars[sa1.id]
-                    var2 = staff_vars[sa2.id]
-                    logging.debug(f"[Exclude] Staff {staff_id} - Flight {flight_number} - SA {sa1.id} ↔ SA {sa2.id}")
-                    model.Add(var1 + var2 <= 1)
+        for a in range(len(staff_tasks)):
+            j = staff_tasks[a]
+            for b in range(a + 1, len(staff_tasks)):
+                k = staff_tasks[b]
+                if excluded(j, k):
+                    logging.debug(f"[Exclude] Staff {staff_id} - Flight {flight_number} - Task {j} ↔ Task {k}")
+                    model.Add(staff_vars[j] + staff_vars[k] <= 1)
 
     def _apply_multi_task_limit_constraint(
         self,
         model: cp_model.CpModel,
-        staff_services: List[ServiceAssignment],
+        staff_tasks: List[int],
         staff_vars: Dict[int, cp_model.IntVar],
+        excluded,
+        task_limit: List[int],
         staff_id: int,
         flight_number: str,
     ):
         """
         Ensure the number of multi-task services assigned to a staff on a single flight does not exceed the limit.
         """
-        for sa in staff_services:
-            limit = sa.multi_task_limit
-            if limit is None:
+        for j in staff_tasks:
+            limit = task_limit[j]
+            if limit < 0:
                 continue
 
             compatible_vars = [
-                staff_vars[other_sa.id]
-                for other_sa in staff_services
-                if other_sa.id != sa.id
-                and sa.service_id not in other_sa.exclude_services
-                and other_sa.service_id not in sa.exclude_services
+                staff_vars[k]
+                for k in staff_tasks
+                if k != j and not excluded(j, k)
             ]
-            total = staff_vars[sa.id] + sum(compatible_vars)
-            logging.debug(f"[Limit] Staff {staff_id} - Flight {flight_number} - SA {sa.id} → Limit {limit}")
+            total = staff_vars[j] + sum(compatible_vars)
+            logging.debug(f"[Limit] Staff {staff_id} - Flight {flight_number} - Task {j} → Limit {limit}")
             model.Add(total <= limit)
@@ -0,0 +1,183 @@
+from ortools.sat.python.cp_model import CpModel, IntVar
+from typing import Dict, Tuple, List, Optional, Set
+from time import time
+import logging
+
+from opspilot.models import ServiceAssignment, ServiceType, Flight
+from opspilot.utils import CapabilityMatrix
+from opspilot.constraints import Constraint
+
+class NoOverlapTransitionConstraint(Constraint):
+    """
+    Interval engine alternative to ServiceTransitionConstraint. Each staff member's day is modelled
+    with optional interval variables (present when the staff is assigned) and AddNoOverlap, so the
+    solver reasons about time directly.
+
+    Each interval is padded with the assignment's transition padding: the smallest travel gap it
+    requires before any other assignment. As the padding never exceeds the real gap of a pair,
+    padded intervals of two assignments on different flights only overlap when the overlap map
+    has them overlapping.
+
+    Multi-task assignments on the same flight may run in parallel, so per staff the intervals
+    are split into lanes where no two such assignments overlap, with one NoOverlap per lane.
+    Any other same-flight pair can share a lane: SingleServiceConstraint and FixedServiceConstraint
+    already forbid a staff member from taking both of them.
+
+    Overlapping pairs a NoOverlap does not cover (different lanes, midnight wrapped assignments,
+    or pairs only overlapping with the full travel gap) fall back to pairwise constraints, so the
+    model stays equivalent to the overlap map.
+    """
+    def __init__(
+        self,
+        service_assignments: List[ServiceAssignment],
+        overlap_map: Dict[int, List[int]],
+        flight_map: Dict[str, Flight],
+        transition_paddings: Dict[int, int],
+        capability_matrix: Optional[CapabilityMatrix] = None
+    ):
+        self.service_assignment_map = {sa.id: sa for sa in service_assignments}
+        self.overlap_map = overlap_map
+        self.flight_map = flight_map
+        self.transition_paddings = transition_paddings
+        self.capability_matrix = capability_matrix
+
+    def apply(self, model: CpModel, assignments: Dict[Tuple[int, int], IntVar]) -> None:
+        start_time = time()
+        logging.info("Applying NoOverlapTransitionConstraint...")
+
+        capability_matrix = self.capability_matrix
+        if capability_matrix is None:
+            capability_matrix = CapabilityMatrix.from_pairs(
+                staff_ids=sorted({staff_id for staff_id, _ in assignments}),
+                service_assignment_ids=sorted({sa_id for _, sa_id in assignments}),
+                pairs=assignments.keys()
+            )
+
+        # Padded [start, end) per assignment with a single interval; wrapped ones stay pairwise
+        padded: Dict[int, Tuple[int, int]] = {}
+        for sa_id in capability_matrix.service_assignment_ids:
+            intervals = self.service_assignment_map[sa_id].minute_intervals(self.flight_map)
+            if len(intervals) == 1:
+                start, end = intervals[0]
+                padded[sa_id] = (start, end + self.transition_paddings.get(sa_id, 0))
+
+        lanes, lane_of, displaced = self._assign_lanes(capability_matrix, padded, assignments)
+
+        interval_count = 0
+        for staff_id, staff_lanes in lanes.items():
+            for lane in staff_lanes:
+                if len(lane) < 2:
+                    continue
+
+                lane_intervals = []
+                for sa_id in lane:
+                    start, end = padded[sa_id]
+                    lane_intervals.append(model.NewOptionalFixedSizeIntervalVar(
+                        start, end - start, assignments[(staff_id, sa_id)],
+                        f"interval_staff_{staff_id}_service_assignment_{sa_id}"
+                    ))
+
+                model.AddNoOverlap(lane_intervals)
+                interval_count += len(lane_intervals)
+
+        # Overlapping pairs not covered by a NoOverlap
+        residual_count = 0
+        for sa_id_a, conflicting_ids in self.overlap_map.items():
+            if sa_id_a not in capability_matrix.service_assignment_index:
+                continue
+
+            for sa_id_b in conflicting_ids:
+                if sa_id_b not in capability_matrix.service_assignment_index:
+                    continue
+
+                capable = capability_matrix.columns([sa_id_a, sa_id_b]).all(axis=1)
+
+                if self._padded_overlap(padded, sa_id_a, sa_id_b):
+                    # Covered unless one of them was moved to another lane
+                    rows = displaced.get(sa_id_a, set()) | displaced.get(sa_id_b, set())
+                    rows = [i for i in rows if capable[i]]
+                else:
+                    rows = capable.nonzero()[0].tolist()
+
+                for i in rows:
+                    staff_id = capability_matrix.staff_ids[i]
+                    var_a = assignments.get((staff_id, sa_id_a))
+                    var_b = assignments.get((staff_id, sa_id_b))
+                    if var_a is None or var_b is None:
+                        continue
+
+                    staff_lane_of = lane_of[staff_id]
+                    if self._padded_overlap(padded, sa_id_a, sa_id_b) \
+                            and staff_lane_of.get(sa_id_a) == staff_lane_of.get(sa_id_b):
+                        continue
+
+                    model.Add(var_a + var_b <= 1)
+                    residual_count += 1
+
+        logging.info(
+            f"Applied NoOverlapTransitionConstraint ({interval_count} intervals, "
+            f"{residual_count} residual pairwise constraints) in {time() - start_time:.2f}s"
+        )
+
+    def _assign_lanes(
+        self,
+        capability_matrix: CapabilityMatrix,
+        padded: Dict[int, Tuple[int, int]],
+        assignments: Dict[Tuple[int, int], IntVar]
+    ) -> Tuple[Dict[int, List[List[int]]], Dict[int, Dict[int, int]], Dict[int, Set[int]]]:
+        """
+        Sweep each staff member's single-interval assignments by start and put each one in the first
+        lane without an overlapping multi-task assignment of the same flight.
+        Returns the lanes per staff, the lane of each assignment per staff and, per assignment,
+        the staff rows where it is not in the first lane.
+        """
+        lanes: Dict[int, List[List[int]]] = {}
+        lane_of: Dict[int, Dict[int, int]] = {}
+        displaced: Dict[int, Set[int]] = {}
+        sa_ids = [sa_id for sa_id in capability_matrix.service_assignment_ids if sa_id in padded]
+        columns = capability_matrix.columns(sa_ids)
+
+        for i, staff_id in enumerate(capability_matrix.staff_ids):
+            staff_sa_ids = sorted(
+                (sa_id for sa_id, can_perform in zip(sa_ids, columns[i].tolist())
+                 if can_perform and (staff_id, sa_id) in assignments),
+                key=lambda sa_id: (padded[sa_id][0], sa_id)
+            )
+
+            staff_lanes: List[List[int]] = []
+            staff_lane_of: Dict[int, int] = {}
+            active: List[List[Tuple[int, str]]] = []  # per lane: (padded end, flight number) of multi-task assignments
+
+            for sa_id in staff_sa_ids:
+                start, end = padded[sa_id]
+                sa = self.service_assignment_map[sa_id]
+                flight_number = sa.flight_number if sa.service_type == ServiceType.MULTI_TASK else None
+
+                for lane_index, lane_active in enumerate(active):
+                    lane_active[:] = [item for item in lane_active if item[0] > start]
+                    if flight_number is None or all(item[1] != flight_number for item in lane_active):
+                        break
+                else:
+                    lane_index = len(staff_lanes)
+                    staff_lanes.append([])
+                    active.append([])
+
+                staff_lanes[lane_index].append(sa_id)
+                staff_lane_of[sa_id] = lane_index
+                if flight_number is not None:
+                    active[lane_index].append((end, flight_number))
+                if lane_index > 0:
+                    displaced.setdefault(sa_id, set()).add(i)
+
+            lanes[staff_id] = staff_lanes
+            lane_of[staff_id] = staff_lane_of
+
+        return lanes, lane_of, displaced
+
+    @staticmethod
+    def _padded_overlap(padded: Dict[int, Tuple[int, int]], sa_id_a: int, sa_id_b: int) -> bool:
+        if sa_id_a not in padded or sa_id_b not in padded:
+            return False
+        start_a, end_a = padded[sa_id_a]
+        start_b, end_b = padded[sa_id_b]
+        return max(start_a, start_b) < min(end_a, end_b)
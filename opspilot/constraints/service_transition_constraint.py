@@ -1,58 +1,77 @@
 from ortools.sat.python.cp_model import CpModel, IntVar
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional
 from time import time
 import logging
 
-from opspilot.models import Staff, ServiceAssignment, Service, Flight
+from opspilot.utils import CapabilityMatrix
 from opspilot.constraints import Constraint
 
 class ServiceTransitionConstraint(Constraint):
     """
     Prevent staff from being assigned to overlapping service assignments
     that do not allow sufficient travel and buffer time between them.
-    Only apply to staff who are eligible for both services.
+    Only apply to staff who are able to perform both services.
+
+    Two encodings are supported:
+    - Pairwise (no cliques given): one `var_a + var_b <= 1` per staff and overlapping pair.
+    - Clique: one AddAtMostOne per clique of mutually overlapping service assignments
+      (see OverlapCliqueService) and per staff capable of two or more of its members.
     """
     def __init__(
         self,
-        roster: List[Staff],
         overlap_map: Dict[int, List[int]],
-        service_assignment_map: Dict[int, ServiceAssignment],
-        service_map: Dict[int, Service],
-        flight_map: Dict[int, Flight]
+        capability_matrix: Optional[CapabilityMatrix] = None,
+        cliques: Optional[List[List[int]]] = None
     ):
-        self.roster = roster
         self.overlap_map = overlap_map
-        self.service_assignment_map = service_assignment_map
-        self.service_map = service_map
-        self.flight_map = flight_map
+        self.capability_matrix = capability_matrix
+        self.cliques = cliques
 
     def apply(self, model: CpModel, assignments: Dict[Tuple[int, int], IntVar]) -> None:
         start_time = time()
         logging.info("Applying ServiceTransitionConstraint...")
 
-        for staff in self.roster:
-            for sa_id_a, conflicting_ids in self.overlap_map.items():
-                service_assignment_a = self.service_assignment_map[sa_id_a]
-                service_a = self.service_map[service_assignment_a.service_id]
-                service_a_intervals = service_assignment_a.minute_intervals(self.flight_map)
+        capability_matrix = self.capability_matrix
+        if capability_matrix is None:
+            capability_matrix = CapabilityMatrix.from_pairs(
+                staff_ids=sorted({staff_id for staff_id, _ in assignments}),
+                service_assignment_ids=sorted({sa_id for _, sa_id in assignments}),
+                pairs=assignments.keys()
+            )
 
-                # Skip if staff cannot perform service A
-                if not staff.can_perform_service(service_a, service_a_intervals, service_assignment_a):
-                    continue
+        if self.cliques is None:
+            groups = [
+                [sa_id_a, sa_id_b]
+                for sa_id_a, conflicting_ids in self.overlap_map.items()
+                for sa_id_b in conflicting_ids
+            ]
+        else:
+            groups = self.cliques
 
-                for sa_id_b in conflicting_ids:
-                    service_assignment_b = self.service_assignment_map[sa_id_b]
-                    service_b = self.service_map[service_assignment_b.service_id]
-                    service_b_intervals = service_assignment_b.minute_intervals(self.flight_map)
+        constraint_count = 0
+        for group in groups:
+            group = [sa_id for sa_id in group if sa_id in capability_matrix.service_assignment_index]
+            if len(group) < 2:
+                continue
 
-                    # Skip if staff cannot perform service B
-                    if not staff.can_perform_service(service_b, service_b_intervals, service_assignment_b):
-                        continue
+            # Masked lookup: staff able to perform at least two members of the group
+            capable = capability_matrix.columns(group)
+            for i in (capable.sum(axis=1) >= 2).nonzero()[0].tolist():
+                staff_id = capability_matrix.staff_ids[i]
+                group_vars = [
+                    assignments[(staff_id, sa_id)]
+                    for sa_id, can_perform in zip(group, capable[i].tolist())
+                    if can_perform and (staff_id, sa_id) in assignments
+                ]
 
-                    var_a = assignments[(staff.id, sa_id_a)]
-                    var_b = assignments[(staff.id, sa_id_b)]
+                if len(group_vars) < 2:
+                    continue
 
-                    # Ensure staff is not assigned to both conflicting services
-                    model.Add(var_a + var_b <= 1)
+                # Ensure staff is not assigned to more than one of the conflicting services
+                if len(group_vars) == 2:
+                    model.Add(group_vars[0] + group_vars[1] <= 1)
+                else:
+                    model.AddAtMostOne(group_vars)
+                constraint_count += 1
 
-        logging.info(f"Applied ServiceTransitionConstraint in {time() - start_time:.2f}s")
+        logging.info(f"Applied ServiceTransitionConstraint ({constraint_count} constraints) in {time() - start_time:.2f}s")
@@ -1,8 +1,9 @@
 from ortools.sat.python.cp_model import CpModel, IntVar
 from typing import Dict, Tuple
 from collections import defaultdict
-from opspilot.models import ServiceAssignment
 from opspilot.constraints import Constraint
+from opspilot.problem import CompiledProblem, SERVICE_TYPE_CODES
+from opspilot.models import ServiceType
 from time import time
 import logging
 
@@ -17,48 +18,52 @@ class SingleServiceConstraint(Constraint):
     that a staff member is not assigned to multiple CommonZone services (at same or different location) at the same time.
     """
 
-    def __init__(self, service_assignment_map: Dict[int, ServiceAssignment]):
-        self.service_assignment_map = service_assignment_map
+    def __init__(self, problem: CompiledProblem):
+        self.problem = problem
 
     def apply(self, model: CpModel, assignments: Dict[Tuple[int, int], IntVar]) -> None:
         start_time = time()
         logging.info("Applying SingleServiceConstraint...")
 
-        # Group service assignments by (flight_number, staff_id)
-        flight_staff_to_vars = defaultdict(lambda: {"S": [], "other": []})
+        problem = self.problem
+        single = SERVICE_TYPE_CODES[ServiceType.SINGLE]
+        task_ids = problem.task_ids.tolist()
+        task_flight = problem.task_flight.tolist()
+        task_type = problem.task_type.tolist()
 
-        for (staff_id, service_assignment_id), var in assignments.items():
-            service_assignment = self.service_assignment_map[service_assignment_id]
-            flight_number = service_assignment.flight_number
-            service_type = service_assignment.service_type
+        for i, staff_id in enumerate(problem.staff_ids.tolist()):
+            # Group the staff's FlightZone service assignments by flight
+            flight_to_vars = defaultdict(lambda: {"S": [], "other": []})
 
-            # Only apply constraints for FlightZone services
-            if flight_number is None:
-                continue
+            for j in problem.tasks_of_staff(i).tolist():
+                flight = task_flight[j]
+                var = assignments.get((staff_id, task_ids[j]))
 
-            if service_type == 'S':
-                flight_staff_to_vars[(flight_number, staff_id)]["S"].append(var)
-            else:
-                flight_staff_to_vars[(flight_number, staff_id)]["other"].append(var)
+                # Only apply constraints for FlightZone services
+                if flight < 0 or var is None:
+                    continue
 
-        for (flight_number, staff_id), grouped in flight_staff_to_vars.items():
-            s_vars = grouped["S"]
-            other_vars = grouped["other"]
+                flight_to_vars[flight]["S" if task_type[j] == single else "other"].append(var)
 
-            if not s_vars:
-                continue
+            for flight, grouped in flight_to_vars.items():
+                s_vars = grouped["S"]
+                other_vars = grouped["other"]
 
-            # Constraint 1: At most one 'S' service per flight
-            model.Add(sum(s_vars) <= 1)
+                if not s_vars:
+                    continue
 
-            if not other_vars:
-                continue
+                # Constraint 1: At most one 'S' service per flight
+                model.Add(sum(s_vars) <= 1)
 
-            # Constraint 2: If assigned to an 'S' service, cannot be assigned to other services on the same flight
-            has_s = model.NewBoolVar(f's_assigned_{flight_number}_{staff_id}')
-            model.Add(sum(s_vars) == 1).OnlyEnforceIf(has_s)
-            model.Add(sum(s_vars) == 0).OnlyEnforceIf(has_s.Not())
+                if not other_vars:
+                    continue
 
-            model.Add(sum(other_vars) == 0).OnlyEnforceIf(has_s)
+                # Constraint 2: If assigned to an 'S' service, cannot be assigned to other services on the same flight
+                flight_number = problem.flight_numbers[flight]
+                has_s = model.NewBoolVar(f's_assigned_{flight_number}_{staff_id}')
+                model.Add(sum(s_vars) == 1).OnlyEnforceIf(has_s)
+                model.Add(sum(s_vars) == 0).OnlyEnforceIf(has_s.Not())
+
+                model.Add(sum(other_vars) == 0).OnlyEnforceIf(has_s)
 
         logging.info(f"Applied SingleServiceConstraint in {time() - start_time:.2f}s")
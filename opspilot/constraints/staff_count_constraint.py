@@ -1,9 +1,10 @@
 from ortools.sat.python.cp_model import CpModel, IntVar
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, Optional
 from time import time
 import logging
 
-from opspilot.models import ServiceAssignment
+from opspilot.problem import CompiledProblem
+from opspilot.utils import AssignmentVarIndex
 from opspilot.constraints import Constraint
 
 class StaffCountConstraint(Constraint):
@@ -12,20 +13,25 @@ class StaffCountConstraint(Constraint):
     """
     def __init__(
         self,
-        service_assignments: List[ServiceAssignment]
+        problem: CompiledProblem,
+        var_index: Optional[AssignmentVarIndex] = None
     ):
-        self.service_assignments = service_assignments
+        self.problem = problem
+        self.var_index = var_index
 
     def apply(self, model: CpModel, assignments: Dict[Tuple[int, int], IntVar]) -> None:
         start_time = time()
         logging.info("Applying StaffCountConstraint...")
 
-        for service_assignment in self.service_assignments:
-            assignment_vars = [
-                var for (_, sa_id), var in assignments.items()
-                if sa_id == service_assignment.id
-            ]
+        var_index = self.var_index if self.var_index is not None else AssignmentVarIndex.from_assignments(assignments)
 
-            model.Add(sum(assignment_vars) <= service_assignment.staff_count)
+        for sa_id, staff_count in zip(self.problem.task_ids.tolist(), self.problem.task_staff_count.tolist()):
+            assignment_vars = list(var_index.for_service_assignment(sa_id).values())
+
+            # No staff can perform this service assignment
+            if not assignment_vars:
+                continue
+
+            model.Add(sum(assignment_vars) <= staff_count)
 
         logging.info(f"Applied StaffCountConstraint in {time() - start_time:.2f}s")
@@ -0,0 +1,60 @@
+from ortools.sat.python.cp_model import CpModel, IntVar
+from typing import Dict, List, Tuple
+from opspilot.constraints import Constraint
+from time import time
+import logging
+
+class SymmetryBreakingConstraint(Constraint):
+    """
+    Breaks the symmetry between interchangeable staff (see StaffEquivalenceService): within each class,
+    the assignment vectors over the service assignments of the class must be lexicographically
+    non-increasing in staff id order, so only one of the permutations of a schedule stays feasible.
+
+    For consecutive staff a and b of a class and columns 1..n, prefix_t is true exactly when
+    both vectors agree on columns 1..t, and x_a[t] >= x_b[t] is enforced while they agree before t.
+
+    Attributes:
+        classes: Staff ids of each equivalence class, sorted by staff id
+        columns: Service assignment ids of each class, in the same order
+    """
+    def __init__(self, classes: List[List[int]], columns: List[List[int]]):
+        self.classes = classes
+        self.columns = columns
+
+    def apply(self, model: CpModel, assignments: Dict[Tuple[int, int], IntVar]) -> None:
+        start_time = time()
+        logging.info("Applying SymmetryBreakingConstraint...")
+
+        for staff_ids, sa_ids in zip(self.classes, self.columns):
+            for staff_a, staff_b in zip(staff_ids, staff_ids[1:]):
+                self._lex_greater_equal(
+                    model,
+                    [assignments[(staff_a, sa_id)] for sa_id in sa_ids],
+                    [assignments[(staff_b, sa_id)] for sa_id in sa_ids],
+                    f"{staff_a}_{staff_b}"
+                )
+
+        logging.info(f"Applied SymmetryBreakingConstraint ({len(self.classes)} classes) in {time() - start_time:.2f}s")
+
+    def _lex_greater_equal(self, model: CpModel, vars_a: List[IntVar], vars_b: List[IntVar], name: str) -> None:
+        prefix = None
+        for t, (a, b) in enumerate(zip(vars_a, vars_b)):
+            # Literals falsifying the prefix (none while it is empty)
+            unless_prefix = [prefix.Not()] if prefix is not None else []
+
+            # a >= b while the vectors agree on the previous columns
+            model.AddBoolOr(unless_prefix + [a, b.Not()])
+
+            # The last column needs no prefix
+            if t == len(vars_a) - 1:
+                break
+
+            # equal <=> prefix and a == b
+            equal = model.NewBoolVar(f"lex_prefix_{name}_{t}")
+            if prefix is not None:
+                model.AddImplication(equal, prefix)
+            model.AddBoolOr([equal.Not(), a, b.Not()])
+            model.AddBoolOr([equal.Not(), a.Not(), b])
+            model.AddBoolOr(unless_prefix + [equal, a.Not(), b.Not()])
+            model.AddBoolOr(unless_prefix + [equal, a, b])
+            prefix = equal
@@ -1,6 +1,17 @@
 from .scheduler import Scheduler
 from .scheduler_result import SchedulerResult
+from .incremental_scheduler import IncrementalScheduler
+from .rolling_horizon_scheduler import RollingHorizonScheduler
+from .lns_scheduler import LnsScheduler
+from .decomposed_scheduler import DecomposedScheduler
+from .greedy_scheduler import GreedyScheduler
+from .termination_reason import TerminationReason
+from .solver_report import SolverReport
+from .objective_stage_report import ObjectiveStageReport
+from .stage_metrics import StageMetrics
+from .scheduler_metrics import SchedulerMetrics
+from .solution_stream_callback import SolutionStreamCallback
 
 __all__ = [
-    'Scheduler', 'SchedulerResult',
-]
\ No newline at end of file
+    'DecomposedScheduler', 'GreedyScheduler', 'IncrementalScheduler', 'LnsScheduler', 'ObjectiveStageReport', 'RollingHorizonScheduler', 'Scheduler', 'SchedulerMetrics', 'SchedulerResult', 'SolutionStreamCallback', 'SolverReport', 'StageMetrics', 'TerminationReason',
+]
@@ -0,0 +1,155 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Dict, Set, Tuple
+from opspilot.core.scheduler import Scheduler
+from opspilot.core.scheduler_result import SchedulerResult
+from opspilot.models import Staff, Service, Flight, ServiceAssignment, TravelTime, Settings, Location
+from opspilot.services import FeasibilityService, ComponentService
+from opspilot.plans import AllocationPlan
+from time import time
+import logging
+
+def solve_component(
+    roster: List[Staff],
+    services: List[Service],
+    flights: List[Flight],
+    service_assignments: List[ServiceAssignment],
+    locations: List[Location],
+    settings: Settings,
+    travel_times: List[TravelTime],
+    priority_ceiling: float
+) -> Tuple[SchedulerResult, float, Dict[int, Set[int]]]:
+    """Solve one component with its own Scheduler. Module level so it can run in a worker process."""
+    scheduler = Scheduler(
+        roster=roster,
+        services=services,
+        flights=flights,
+        service_assignments=service_assignments,
+        locations=locations,
+        settings=settings,
+        travel_times=travel_times,
+        priority_ceiling=priority_ceiling
+    )
+    result = scheduler.run()
+
+    allocations: Dict[int, Set[int]] = {}
+    for (staff_id, sa_id), assigned in scheduler.solution.items():
+        if assigned:
+            allocations.setdefault(sa_id, set()).add(staff_id)
+
+    return result, scheduler.objective_value, allocations
+
+class DecomposedScheduler:
+    """
+    Solves independent parts of the day in parallel. Staff and service assignments are split into
+    connected components of the feasibility graph (see ComponentService), each component
+    is solved by its own Scheduler in a ProcessPoolExecutor, and the results are merged into one plan.
+
+    As no constraint or objective term links two components, `objective_value` (the sum of the
+    component objectives) equals the objective a single Scheduler run reports for the whole day.
+    The turnaround workload strategy gets the priority ceiling of the whole day for that reason.
+    """
+
+    def __init__(
+        self,
+        roster: List[Staff],
+        services: List[Service],
+        flights: List[Flight],
+        service_assignments: List[ServiceAssignment],
+        locations: List[Location],
+        settings: Settings,
+        travel_times: Optional[List[TravelTime]] = [],
+        max_workers: Optional[int] = None
+    ):
+        self.roster = roster
+        self.services = services
+        self.flights = flights
+        self.service_assignments = service_assignments
+        self.locations = locations
+        self.settings = settings
+        self.travel_times = travel_times
+        self.max_workers = max_workers
+
+        self.staff_map = {staff.id: staff for staff in roster}
+        self.service_assignment_map = {sa.id: sa for sa in service_assignments}
+        self.service_map = {service.id: service for service in services}
+        self.flight_map = {flight.number: flight for flight in flights}
+        self.location_map = {location.id: location for location in locations}
+        self.priority_ceiling = max((sa.priority for sa in service_assignments), default=0) + 1
+
+        # Results and metrics
+        self.components: List[Tuple[List[int], List[int]]] = []
+        self.allocations: Dict[int, Set[int]] = {}
+        self.solution_status: Optional[SchedulerResult] = None
+        self.objective_value: float = 0.0
+        self.solve_time: float = 0.0
+
+    def detect_components(self) -> List[Tuple[List[int], List[int]]]:
+        capability_matrix = FeasibilityService(
+            roster=self.roster,
+            service_assignments=self.service_assignments,
+            service_map=self.service_map,
+            flight_map=self.flight_map
+        ).capability_matrix()
+
+        return ComponentService(capability_matrix).detect_components()
+
+    def run(self) -> SchedulerResult:
+        start_time = time()
+
+        self.components = self.detect_components()
+        logging.info(f"Solving {len(self.components)} independent components...")
+
+        jobs = [self._component_arguments(staff_ids, sa_ids) for staff_ids, sa_ids in self.components]
+
+        if len(jobs) <= 1 or self.max_workers == 1:
+            results = [solve_component(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(solve_component, *zip(*jobs)))
+
+        self.allocations = {}
+        self.objective_value = 0.0
+        self.solution_status = SchedulerResult.FOUND
+        for result, objective_value, allocations in results:
+            if result != SchedulerResult.FOUND:
+                self.solution_status = SchedulerResult.NOT_FOUND
+                continue
+
+            self.objective_value += objective_value
+            self.allocations.update(allocations)
+
+        self.solve_time = time() - start_time
+        logging.info(
+            f"Decomposed solve finished with status: {self.solution_status} "
+            f"in {self.solve_time:.2f}s (objective: {self.objective_value})"
+        )
+
+        return self.solution_status
+
+    def get_allocation_plan(self) -> AllocationPlan:
+        plan = AllocationPlan(
+            service_assignment_map=self.service_assignment_map,
+            service_map=self.service_map,
+            staff_map=self.staff_map,
+            flight_map=self.flight_map,
+            location_map=self.location_map,
+        )
+        for sa_id, staff_ids in self.allocations.items():
+            for staff_id in staff_ids:
+                plan.add_allocation(service_assignment_id=sa_id, staff_id=staff_id)
+        return plan
+
+    def _component_arguments(self, staff_ids: List[int], sa_ids: List[int]) -> tuple:
+        service_assignments = [self.service_assignment_map[sa_id] for sa_id in sa_ids]
+        flight_numbers = {sa.flight_number for sa in service_assignments if sa.flight_number}
+
+        return (
+            [self.staff_map[staff_id] for staff_id in staff_ids],
+            self.services,
+            [flight for flight in self.flights if flight.number in flight_numbers],
+            service_assignments,
+            self.locations,
+            self.settings,
+            self.travel_times,
+            self.priority_ceiling,
+        )
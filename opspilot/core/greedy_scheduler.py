@@ -0,0 +1,203 @@
+from collections import defaultdict
+from typing import Optional, List, Dict, Set
+from opspilot.models import Staff, Service, Flight, ServiceAssignment, TravelTime, Settings, Location, ServiceType
+from opspilot.services import OverlapDetectionService, FeasibilityService
+from opspilot.plans import AllocationPlan
+from time import time
+import logging
+
+class GreedyScheduler:
+    """
+    Priority-ordered greedy fast path for answers in well under a second (e.g. what-if queries),
+    without building a CP-SAT model.
+
+    Service assignments are visited by priority (lowest value first) and filled with the best free staff,
+    ranked with the per-assignment score of BalanceWorkloadStrategy (preferred service, rank level,
+    certification count) and, on ties, preferring staff not used yet. A staff member is only picked
+    if the allocation keeps the rules of the Scheduler constraints: feasibility (certification,
+    eligibility, shift, role), overlap and travel time, Single, Fixed and Multi-task service rules.
+
+    The plan is not optimal, but it is valid and can seed the Scheduler as a warm start:
+    `Scheduler(..., hints=GreedyScheduler(...).run())`.
+    """
+
+    def __init__(
+        self,
+        roster: List[Staff],
+        services: List[Service],
+        flights: List[Flight],
+        service_assignments: List[ServiceAssignment],
+        locations: List[Location],
+        settings: Settings,
+        travel_times: Optional[List[TravelTime]] = []
+    ):
+        self.roster = roster
+        self.services = services
+        self.flights = flights
+        self.service_assignments = service_assignments
+        self.settings = settings
+
+        self.staff_map = {staff.id: staff for staff in roster}
+        self.service_assignment_map = {sa.id: sa for sa in service_assignments}
+        self.service_map = {service.id: service for service in services}
+        self.flight_map = {flight.number: flight for flight in flights}
+        self.location_map = {location.id: location for location in locations}
+        self.travel_time_map = {(travel_time.origin_location_id, travel_time.destination_location_id): travel_time.travel_minutes for travel_time in travel_times}
+
+        # Results and metrics
+        self.allocations: Dict[int, Set[int]] = {}
+        self.solve_time: float = 0.0
+
+    def run(self) -> AllocationPlan:
+        """Fill the service assignments one after another and return the plan."""
+        start_time = time()
+        logging.info("Starting greedy scheduler...")
+
+        overlap_map = OverlapDetectionService(
+            service_assignments=self.service_assignments,
+            flight_map=self.flight_map,
+            location_map=self.location_map,
+            travel_time_map=self.travel_time_map,
+            settings=self.settings
+        ).detect_overlaps()
+
+        self._neighbours: Dict[int, Set[int]] = defaultdict(set)
+        for sa_id_a, conflicting_ids in overlap_map.items():
+            for sa_id_b in conflicting_ids:
+                self._neighbours[sa_id_a].add(sa_id_b)
+                self._neighbours[sa_id_b].add(sa_id_a)
+
+        candidates: Dict[int, List[int]] = defaultdict(list)
+        # (staff_id, flight_number) -> feasible multi-task service assignments, for the multi-task limits
+        self._feasible_multi_tasks: Dict[tuple, List[ServiceAssignment]] = defaultdict(list)
+        for staff_id, sa_id in FeasibilityService(
+            roster=self.roster,
+            service_assignments=self.service_assignments,
+            service_map=self.service_map,
+            flight_map=self.flight_map
+        ).feasible_pairs():
+            candidates[sa_id].append(staff_id)
+            sa = self.service_assignment_map[sa_id]
+            if sa.service_type == ServiceType.MULTI_TASK and sa.flight_number:
+                self._feasible_multi_tasks[(staff_id, sa.flight_number)].append(sa)
+
+        # Allocation state per staff
+        self._assigned: Dict[int, Set[int]] = defaultdict(set)
+        self._assigned_by_flight: Dict[int, Dict[str, List[ServiceAssignment]]] = defaultdict(lambda: defaultdict(list))
+        self._fixed_service: Dict[int, int] = {}  # staff_id -> the Fixed service_id of the day
+        self._has_non_fixed: Set[int] = set()
+
+        self.allocations = {}
+        for sa in sorted(self.service_assignments, key=lambda sa: (sa.priority, sa.id)):
+            ranked = sorted(candidates.get(sa.id, []), key=lambda staff_id: self._score(staff_id, sa), reverse=True)
+            for staff_id in ranked:
+                if len(self.allocations.get(sa.id, ())) >= sa.staff_count:
+                    break
+                if self._can_assign(staff_id, sa):
+                    self._assign(staff_id, sa)
+
+        self.solve_time = time() - start_time
+        logging.info(
+            f"Greedy scheduler allocated {sum(len(staff_ids) for staff_ids in self.allocations.values())} staff "
+            f"to {len(self.allocations)} service assignments in {self.solve_time:.3f}s"
+        )
+
+        return self.get_allocation_plan()
+
+    def get_allocation_plan(self) -> AllocationPlan:
+        plan = AllocationPlan(
+            service_assignment_map=self.service_assignment_map,
+            service_map=self.service_map,
+            staff_map=self.staff_map,
+            flight_map=self.flight_map,
+            location_map=self.location_map,
+        )
+        for sa_id, staff_ids in self.allocations.items():
+            for staff_id in staff_ids:
+                plan.add_allocation(service_assignment_id=sa_id, staff_id=staff_id)
+        return plan
+
+    def _score(self, staff_id: int, sa: ServiceAssignment) -> tuple:
+        """Per-assignment score of BalanceWorkloadStrategy, then prefer staff not used yet."""
+        staff = self.staff_map[staff_id]
+        priority_match_bonus = 1 if staff.priority_service_id == sa.service_id else 0
+        combined_score = (
+            10_000_000 * priority_match_bonus +
+            1_000 * -(staff.rank_level or 0) +
+            10 * -len(staff.certifications)
+        )
+        return combined_score, not self._assigned[staff_id], -staff_id
+
+    def _can_assign(self, staff_id: int, sa: ServiceAssignment) -> bool:
+        assigned = self._assigned[staff_id]
+
+        # Overlap and travel time
+        if assigned & self._neighbours.get(sa.id, set()):
+            return False
+
+        # Fixed: one Fixed service_id for the whole day and no mix of Fixed and non-Fixed services
+        if sa.service_type == ServiceType.FIXED:
+            if staff_id in self._has_non_fixed:
+                return False
+            if self._fixed_service.get(staff_id, sa.service_id) != sa.service_id:
+                return False
+        elif staff_id in self._fixed_service:
+            return False
+
+        if sa.flight_number is None:
+            return True
+
+        flight_assigned = self._assigned_by_flight[staff_id].get(sa.flight_number, [])
+
+        # Single: nothing else on the same flight
+        if sa.service_type == ServiceType.SINGLE and flight_assigned:
+            return False
+        if any(other.service_type == ServiceType.SINGLE for other in flight_assigned):
+            return False
+
+        # Fixed: at most one Fixed service per flight
+        if sa.service_type == ServiceType.FIXED and any(other.service_type == ServiceType.FIXED for other in flight_assigned):
+            return False
+
+        if sa.service_type == ServiceType.MULTI_TASK:
+            return self._multi_task_allowed(staff_id, sa, flight_assigned)
+
+        return True
+
+    def _multi_task_allowed(self, staff_id: int, sa: ServiceAssignment, flight_assigned: List[ServiceAssignment]) -> bool:
+        """Exclusions and multi_task_limit as in MultiTaskServiceConstraint."""
+        multi_tasks = [other for other in flight_assigned if other.service_type == ServiceType.MULTI_TASK]
+
+        for other in multi_tasks:
+            if other.service_id in sa.exclude_services or sa.service_id in other.exclude_services:
+                return False
+
+        # The limit of every multi-task service the staff could take on this flight
+        # bounds it together with the compatible multi-task services assigned
+        selected = multi_tasks + [sa]
+        for limited in self._feasible_multi_tasks[(staff_id, sa.flight_number)]:
+            if limited.multi_task_limit is None:
+                continue
+
+            count = int(limited.id in {other.id for other in selected}) + sum(
+                1 for other in selected
+                if other.id != limited.id
+                and limited.service_id not in other.exclude_services
+                and other.service_id not in limited.exclude_services
+            )
+            if count > limited.multi_task_limit:
+                return False
+
+        return True
+
+    def _assign(self, staff_id: int, sa: ServiceAssignment) -> None:
+        self.allocations.setdefault(sa.id, set()).add(staff_id)
+        self._assigned[staff_id].add(sa.id)
+
+        if sa.flight_number is not None:
+            self._assigned_by_flight[staff_id][sa.flight_number].append(sa)
+
+        if sa.service_type == ServiceType.FIXED:
+            self._fixed_service[staff_id] = sa.service_id
+        else:
+            self._has_non_fixed.add(staff_id)
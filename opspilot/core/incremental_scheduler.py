@@ -0,0 +1,283 @@
+from typing import Optional, List, Dict, Set, Tuple
+from opspilot.core.scheduler import Scheduler
+from opspilot.core.scheduler_result import SchedulerResult
+from opspilot.models import Staff, Service, Flight, ServiceAssignment, TravelTime, Settings, Location, Disruption
+from opspilot.services import OverlapDetectionService, FeasibilityService, FrozenContextService
+from opspilot.plans import AllocationPlan
+from time import time
+import logging
+
+class IncrementalScheduler:
+    """
+    Re-optimizes an existing allocation plan after disruptions (flight time changes, cancellations,
+    staff removed or added) without rebuilding the model of the whole day.
+
+    Only the neighbourhood of a disruption is re-solved:
+    - service assignments of changed flights,
+    - service assignments that lost staff,
+    - understaffed service assignments an added staff member can perform, or staff released by a
+      cancellation can perform around the cancelled flight,
+    - and every service assignment overlapping one of the above.
+
+    The allocations the neighbourhood interacts with (overlapping, same flight, or Fixed services with
+    their day-wide rules) are passed to the scheduler as frozen context; all other allocations are kept
+    without being part of the model. The current plan is used as a hint. Allocations of a replaced
+    staff record (e.g. a shortened shift) and frozen allocations the staff can no longer perform are
+    released into the re-solve and reported in `released`.
+
+    Each call to resolve() updates the day and the plan, so disruptions can be applied one after another.
+    """
+
+    def __init__(
+        self,
+        roster: List[Staff],
+        services: List[Service],
+        flights: List[Flight],
+        service_assignments: List[ServiceAssignment],
+        locations: List[Location],
+        settings: Settings,
+        plan: AllocationPlan,
+        travel_times: Optional[List[TravelTime]] = []
+    ):
+        self.roster = list(roster)
+        self.services = services
+        self.flights = list(flights)
+        self.service_assignments = list(service_assignments)
+        self.locations = locations
+        self.settings = settings
+        self.travel_times = travel_times
+
+        self.service_map = {service.id: service for service in services}
+        self.location_map = {location.id: location for location in locations}
+        self.travel_time_map = {(travel_time.origin_location_id, travel_time.destination_location_id): travel_time.travel_minutes for travel_time in travel_times}
+
+        # Current allocations: service_assignment_id -> staff_ids
+        self.allocations: Dict[int, Set[int]] = {sa_id: set(staff_ids) for sa_id, staff_ids in plan.allocations.items()}
+
+        # Details of the last re-solve
+        self.neighbourhood: Set[int] = set()
+        self.released: Dict[int, Set[int]] = {}  # Frozen allocations dropped as no longer feasible
+        self.scheduler: Optional[Scheduler] = None
+        self.resolve_time: float = 0.0
+
+    def resolve(self, disruption: Disruption) -> AllocationPlan:
+        """Apply the disruption, re-solve its neighbourhood and return the updated plan."""
+        start_time = time()
+        logging.info("Re-solving disrupted plan...")
+
+        old_flight_map = {flight.number: flight for flight in self.flights}
+        cancelled_windows, released_staff_ids = self._cancelled_allocations(disruption.cancelled_flights, old_flight_map)
+
+        changed_ids, orphaned_ids = self._apply_disruption(disruption)
+
+        flight_map = {flight.number: flight for flight in self.flights}
+        staff_map = {staff.id: staff for staff in self.roster}
+        released_staff = [staff_map[staff_id] for staff_id in sorted(released_staff_ids) if staff_id in staff_map]
+        service_assignment_map = {sa.id: sa for sa in self.service_assignments}
+
+        overlap_map = OverlapDetectionService(
+            service_assignments=self.service_assignments,
+            flight_map=flight_map,
+            location_map=self.location_map,
+            travel_time_map=self.travel_time_map,
+            settings=self.settings
+        ).detect_overlaps()
+
+        context_service = FrozenContextService(service_assignment_map, overlap_map)
+
+        # Allocations of replaced staff records (e.g. a shortened shift) the staff can no longer perform
+        self.released = {}
+        added_staff_ids = {staff.id for staff in disruption.added_staff}
+        replaced = {
+            sa_id: staff_ids & added_staff_ids
+            for sa_id, staff_ids in self.allocations.items()
+            if staff_ids & added_staff_ids
+        }
+        seeds = changed_ids | orphaned_ids
+        seeds |= self._release(self._infeasible_allocations(replaced, flight_map))
+        seeds |= self._understaffed_candidates(disruption.added_staff, flight_map)
+        seeds |= self._understaffed_candidates(released_staff, flight_map, cancelled_windows)
+
+        # Frozen allocations that are no longer feasible cannot be pinned: they are released and their
+        # service assignments re-solved, which can bring further allocations into the frozen context
+        while True:
+            self.neighbourhood = context_service.overlapping(seeds)
+            frozen = context_service.frozen_context(self.neighbourhood, self.allocations)
+            infeasible = self._infeasible_allocations(frozen, flight_map)
+            if not infeasible:
+                break
+            seeds |= self._release(infeasible)
+
+        # Allocations of the neighbourhood are re-solved, hinted with the current ones
+        hints = self._plan(self.allocations, flight_map)
+        for sa_id in self.neighbourhood:
+            self.allocations.pop(sa_id, None)
+
+        self.scheduler = Scheduler(
+            roster=self.roster,
+            services=self.services,
+            flights=self.flights,
+            service_assignments=[sa for sa in self.service_assignments if sa.id in self.neighbourhood or sa.id in frozen],
+            locations=self.locations,
+            settings=self.settings,
+            travel_times=self.travel_times,
+            hints=hints,
+            frozen=frozen,
+            priority_ceiling=max((sa.priority for sa in self.service_assignments), default=0) + 1
+        )
+
+        if self.scheduler.run() == SchedulerResult.FOUND:
+            sub_plan = self.scheduler.get_allocation_plan(self.location_map)
+            for sa_id, staff_ids in sub_plan.allocations.items():
+                if sa_id in self.neighbourhood:
+                    self.allocations[sa_id] = set(staff_ids)
+        else:
+            logging.warning("No solution found for the disrupted neighbourhood, its service assignments are left unallocated")
+
+        self.resolve_time = time() - start_time
+        logging.info(
+            f"Re-solved {len(self.neighbourhood)} of {len(self.service_assignments)} service assignments "
+            f"({len(frozen)} frozen, {len(self.released)} released) in {self.resolve_time:.2f}s"
+        )
+
+        return self._plan(self.allocations, flight_map)
+
+    def _apply_disruption(self, disruption: Disruption) -> Tuple[Set[int], Set[int]]:
+        """Update flights, service assignments, roster and allocations. Returns the changed and orphaned ids."""
+        cancelled = set(disruption.cancelled_flights)
+        changed_flights = {flight.number: flight for flight in disruption.changed_flights}
+        removed_staff_ids = set(disruption.removed_staff_ids)
+        added_staff_ids = {staff.id for staff in disruption.added_staff}
+
+        self.flights = [
+            changed_flights.get(flight.number, flight)
+            for flight in self.flights
+            if flight.number not in cancelled
+        ]
+        self.service_assignments = [sa for sa in self.service_assignments if sa.flight_number not in cancelled]
+        self.roster = [
+            staff for staff in self.roster
+            if staff.id not in removed_staff_ids and staff.id not in added_staff_ids
+        ] + list(disruption.added_staff)
+
+        remaining_ids = {sa.id for sa in self.service_assignments}
+        changed_ids = {sa.id for sa in self.service_assignments if sa.flight_number in changed_flights}
+        orphaned_ids = set()
+
+        for sa_id in list(self.allocations):
+            if sa_id not in remaining_ids:
+                del self.allocations[sa_id]
+                continue
+
+            staff_ids = self.allocations[sa_id]
+            if staff_ids & removed_staff_ids:
+                staff_ids -= removed_staff_ids
+                orphaned_ids.add(sa_id)
+                if not staff_ids:
+                    del self.allocations[sa_id]
+
+        return changed_ids, orphaned_ids
+
+    def _cancelled_allocations(
+        self,
+        cancelled_flights: List[str],
+        flight_map: Dict[str, Flight]
+    ) -> Tuple[List[Tuple[int, int]], Set[int]]:
+        """Time windows of the cancelled service assignments and the staff allocated to them."""
+        cancelled = set(cancelled_flights)
+        windows = []
+        released_staff_ids = set()
+
+        for sa in self.service_assignments:
+            if sa.flight_number not in cancelled:
+                continue
+
+            windows.extend(sa.minute_intervals(flight_map))
+            released_staff_ids |= self.allocations.get(sa.id, set())
+
+        return windows, released_staff_ids
+
+    def _understaffed_candidates(
+        self,
+        staff: List[Staff],
+        flight_map: Dict[str, Flight],
+        windows: Optional[List[Tuple[int, int]]] = None
+    ) -> Set[int]:
+        """
+        Understaffed service assignments at least one of the given staff can perform,
+        limited to the ones intersecting the given time windows if any.
+        """
+        if not staff:
+            return set()
+
+        understaffed = [
+            sa for sa in self.service_assignments
+            if len(self.allocations.get(sa.id, ())) < sa.staff_count
+        ]
+        if windows is not None:
+            understaffed = [
+                sa for sa in understaffed
+                if any(
+                    max(start, window_start) < min(end, window_end)
+                    for start, end in sa.minute_intervals(flight_map)
+                    for window_start, window_end in windows
+                )
+            ]
+
+        capability_matrix = FeasibilityService(
+            roster=staff,
+            service_assignments=understaffed,
+            service_map=self.service_map,
+            flight_map=flight_map
+        ).capability_matrix()
+
+        return {
+            sa_id
+            for sa_id, can_perform in zip(capability_matrix.service_assignment_ids, capability_matrix.matrix.any(axis=0).tolist())
+            if can_perform
+        }
+
+    def _infeasible_allocations(self, allocations: Dict[int, Set[int]], flight_map: Dict[str, Flight]) -> Dict[int, Set[int]]:
+        """The given allocations (service_assignment_id -> staff_ids) the staff can no longer perform."""
+        if not allocations:
+            return {}
+
+        capability_matrix = FeasibilityService(
+            roster=self.roster,
+            service_assignments=[sa for sa in self.service_assignments if sa.id in allocations],
+            service_map=self.service_map,
+            flight_map=flight_map
+        ).capability_matrix()
+
+        infeasible = {}
+        for sa_id, staff_ids in allocations.items():
+            j = capability_matrix.service_assignment_index[sa_id]
+            dropped = {
+                staff_id for staff_id in staff_ids
+                if staff_id not in capability_matrix.staff_index
+                or not capability_matrix.matrix[capability_matrix.staff_index[staff_id], j]
+            }
+            if dropped:
+                infeasible[sa_id] = dropped
+        return infeasible
+
+    def _release(self, infeasible: Dict[int, Set[int]]) -> Set[int]:
+        """Remove the infeasible allocations from the plan and record them. Returns their service assignment ids."""
+        for sa_id, staff_ids in infeasible.items():
+            logging.warning(f"Releasing staff {sorted(staff_ids)} from service assignment {sa_id}, no longer feasible")
+            self.released.setdefault(sa_id, set()).update(staff_ids)
+            self.allocations[sa_id] -= staff_ids
+        return set(infeasible)
+
+    def _plan(self, allocations: Dict[int, Set[int]], flight_map: Dict[str, Flight]) -> AllocationPlan:
+        plan = AllocationPlan(
+            service_assignment_map={sa.id: sa for sa in self.service_assignments},
+            service_map=self.service_map,
+            staff_map={staff.id: staff for staff in self.roster},
+            flight_map=flight_map,
+            location_map=self.location_map,
+        )
+        for sa_id, staff_ids in allocations.items():
+            for staff_id in staff_ids:
+                plan.add_allocation(service_assignment_id=sa_id, staff_id=staff_id)
+        return plan
@@ -0,0 +1,337 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Dict, Set, Tuple, Union
+from opspilot.core.scheduler import Scheduler
+from opspilot.core.scheduler_result import SchedulerResult
+from opspilot.models import Staff, Service, Flight, ServiceAssignment, TravelTime, Settings, Location, NeighbourhoodType, ObjectiveMode
+from opspilot.services import OverlapDetectionService, FeasibilityService, FrozenContextService
+from opspilot.plans import AllocationPlan
+from opspilot.problem import CompiledProblem
+from time import time
+import logging
+import random
+
+def solve_neighbourhood(
+    roster: List[Staff],
+    services: List[Service],
+    flights: List[Flight],
+    service_assignments: List[ServiceAssignment],
+    locations: List[Location],
+    settings: Settings,
+    travel_times: List[TravelTime],
+    allocations: Dict[int, Set[int]],
+    free_ids: Set[int],
+    frozen: Dict[int, Set[int]],
+    priority_ceiling: float,
+    time_limit: float
+) -> Optional[Dict[int, Set[int]]]:
+    """
+    Re-solve the free service assignments with the frozen context fixed and return the merged
+    allocations of the day. Module level so it can run in a worker process.
+    """
+    location_map = {location.id: location for location in locations}
+    hints = AllocationPlan(
+        service_assignment_map={sa.id: sa for sa in service_assignments},
+        service_map={service.id: service for service in services},
+        staff_map={staff.id: staff for staff in roster},
+        flight_map={flight.number: flight for flight in flights},
+        location_map=location_map,
+    )
+    for sa_id, staff_ids in allocations.items():
+        for staff_id in staff_ids:
+            hints.add_allocation(service_assignment_id=sa_id, staff_id=staff_id)
+
+    scheduler = Scheduler(
+        roster=roster,
+        services=services,
+        flights=flights,
+        service_assignments=[sa for sa in service_assignments if sa.id in free_ids or sa.id in frozen],
+        locations=locations,
+        settings=settings,
+        travel_times=travel_times,
+        hints=hints,
+        frozen=frozen,
+        priority_ceiling=priority_ceiling
+    )
+    scheduler.solver.parameters.max_time_in_seconds = time_limit
+
+    if scheduler.run() != SchedulerResult.FOUND:
+        return None
+
+    solution = scheduler.get_allocation_plan(location_map).allocations
+    merged = {sa_id: staff_ids for sa_id, staff_ids in allocations.items() if sa_id not in free_ids}
+    for sa_id in free_ids:
+        if solution.get(sa_id):
+            merged[sa_id] = set(solution[sa_id])
+
+    return merged
+
+class LnsScheduler:
+    """
+    Large Neighbourhood Search: keeps improving an existing plan within a time budget.
+
+    Each iteration picks neighbourhoods (a flight, a time window, a department or a set of staff,
+    see NeighbourhoodType), re-solves their service assignments in a small CP-SAT model with the
+    allocations around them frozen (see FrozenContextService) and the current plan as hint. The
+    merged plan is scored directly on the objective of the full day (Strategy.evaluate on the compiled
+    day), without building or solving a full-day model; it is feasible by construction since the
+    frozen context holds every allocation the free service assignments interact with. The best
+    improving neighbourhood of an iteration is accepted. With more than one worker, the
+    neighbourhoods of an iteration are solved in parallel in a ProcessPoolExecutor.
+
+    Plans are compared on the weighted objective, or on the values of the objective stages in order
+    with the lexicographic objective mode, so a lower stage never trades off a higher one.
+
+    `trajectory` records (elapsed seconds, objective value, neighbourhood type) for the start and every
+    accepted improvement. The objective value is the weighted objective, or the tuple of the stage
+    values with the lexicographic objective mode.
+    """
+
+    def __init__(
+        self,
+        roster: List[Staff],
+        services: List[Service],
+        flights: List[Flight],
+        service_assignments: List[ServiceAssignment],
+        locations: List[Location],
+        settings: Settings,
+        plan: AllocationPlan,
+        travel_times: Optional[List[TravelTime]] = [],
+        time_budget_seconds: float = 60.0,
+        max_iterations: Optional[int] = None,
+        max_workers: int = 1,
+        neighbourhood_time_limit: float = 10.0,
+        window_minutes: int = 120,
+        staff_per_neighbourhood: int = 5,
+        seed: int = 0
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.roster = roster
+        self.services = services
+        self.flights = flights
+        self.service_assignments = service_assignments
+        self.locations = locations
+        self.settings = settings
+        self.travel_times = travel_times
+        self.time_budget_seconds = time_budget_seconds
+        self.max_iterations = max_iterations
+        self.max_workers = max_workers
+        self.neighbourhood_time_limit = neighbourhood_time_limit
+        self.window_minutes = window_minutes
+        self.staff_per_neighbourhood = staff_per_neighbourhood
+        self.random = random.Random(seed)
+
+        self.service_assignment_map = {sa.id: sa for sa in service_assignments}
+        self.service_map = {service.id: service for service in services}
+        self.staff_map = {staff.id: staff for staff in roster}
+        self.flight_map = {flight.number: flight for flight in flights}
+        self.location_map = {location.id: location for location in locations}
+        self.travel_time_map = {(travel_time.origin_location_id, travel_time.destination_location_id): travel_time.travel_minutes for travel_time in travel_times}
+        self.priority_ceiling = max((sa.priority for sa in service_assignments), default=0) + 1
+
+        # Current allocations: service_assignment_id -> staff_ids
+        self.allocations: Dict[int, Set[int]] = {sa_id: set(staff_ids) for sa_id, staff_ids in plan.allocations.items()}
+
+        # Results and metrics
+        self.objective_value: Optional[Union[float, Tuple[int, ...]]] = None
+        self.trajectory: List[Tuple[float, Optional[Union[float, Tuple[int, ...]]], Optional[NeighbourhoodType]]] = []
+        self.iterations: int = 0
+        self.improvements: int = 0
+        self.solve_time: float = 0.0
+
+    def run(self) -> AllocationPlan:
+        """Improve the plan until the time budget (or max_iterations) is used up and return it."""
+        start_time = time()
+        logging.info(f"Starting LNS ({self.time_budget_seconds:.0f}s budget, {self.max_workers} workers)...")
+
+        overlap_map = OverlapDetectionService(
+            service_assignments=self.service_assignments,
+            flight_map=self.flight_map,
+            location_map=self.location_map,
+            travel_time_map=self.travel_time_map,
+            settings=self.settings
+        ).detect_overlaps()
+        self.context_service = FrozenContextService(self.service_assignment_map, overlap_map)
+
+        capability_matrix = FeasibilityService(
+            roster=self.roster,
+            service_assignments=self.service_assignments,
+            service_map=self.service_map,
+            flight_map=self.flight_map
+        ).capability_matrix()
+
+        self.feasible_ids: Dict[int, Set[int]] = {}  # staff_id -> feasible service assignment ids
+        for staff_id, sa_id in capability_matrix.pairs():
+            self.feasible_ids.setdefault(staff_id, set()).add(sa_id)
+
+        # Objective of the full day, evaluated on the compiled day instead of a full-day model
+        self.strategy = Scheduler.create_strategy(
+            self.settings.assignment_strategy,
+            CompiledProblem.compile(
+                roster=self.roster,
+                services=self.services,
+                flights=self.flights,
+                service_assignments=self.service_assignments,
+                capability_matrix=capability_matrix
+            ),
+            priority_ceiling=self.priority_ceiling
+        )
+
+        self.score = self._score(self.allocations)
+        self.objective_value = self._objective_value(self.score)
+        self.trajectory = [(0.0, self.objective_value, None)]
+        self.iterations = 0
+        self.improvements = 0
+
+        executor = ProcessPoolExecutor(max_workers=self.max_workers) if self.max_workers > 1 else None
+        try:
+            while not self._budget_used(start_time):
+                neighbourhoods = [self._pick_neighbourhood() for _ in range(self.max_workers)]
+                neighbourhoods = [(kind, free_ids) for kind, free_ids in neighbourhoods if free_ids]
+                if not neighbourhoods:
+                    break
+
+                jobs = [self._neighbourhood_arguments(free_ids) for _, free_ids in neighbourhoods]
+                if executor is None:
+                    results = [solve_neighbourhood(*job) for job in jobs]
+                else:
+                    results = list(executor.map(solve_neighbourhood, *zip(*jobs)))
+
+                self.iterations += 1
+                self._accept_best(neighbourhoods, results, start_time)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.solve_time = time() - start_time
+        logging.info(
+            f"LNS finished {self.iterations} iterations with {self.improvements} improvements "
+            f"in {self.solve_time:.2f}s (objective: {self.objective_value})"
+        )
+
+        return self.get_allocation_plan()
+
+    def get_allocation_plan(self) -> AllocationPlan:
+        plan = AllocationPlan(
+            service_assignment_map=self.service_assignment_map,
+            service_map=self.service_map,
+            staff_map=self.staff_map,
+            flight_map=self.flight_map,
+            location_map=self.location_map,
+        )
+        for sa_id, staff_ids in self.allocations.items():
+            for staff_id in staff_ids:
+                plan.add_allocation(service_assignment_id=sa_id, staff_id=staff_id)
+        return plan
+
+    def _budget_used(self, start_time: float) -> bool:
+        if self.max_iterations is not None and self.iterations >= self.max_iterations:
+            return True
+        return time() - start_time >= self.time_budget_seconds
+
+    def _accept_best(
+        self,
+        neighbourhoods: List[Tuple[NeighbourhoodType, Set[int]]],
+        results: List[Optional[Dict[int, Set[int]]]],
+        start_time: float
+    ) -> None:
+        best = None
+        for (kind, _), allocations in zip(neighbourhoods, results):
+            if allocations is None:
+                continue
+            score = self._score(allocations)
+            if best is None or score > best[2]:
+                best = (kind, allocations, score)
+
+        if best is None:
+            return
+
+        kind, allocations, score = best
+        if score <= self.score:
+            return
+
+        self.allocations = allocations
+        self.score = score
+        self.objective_value = self._objective_value(score)
+        self.improvements += 1
+
+        elapsed = time() - start_time
+        self.trajectory.append((elapsed, self.objective_value, kind))
+        logging.info(f"LNS objective {self.objective_value} at {elapsed:.2f}s ({kind.value} neighbourhood)")
+
+    def _score(self, allocations: Dict[int, Set[int]]) -> Tuple[int, ...]:
+        """Comparable score of a plan: the stage values in order with the lexicographic objective mode."""
+        stage_values = self.strategy.evaluate(
+            (staff_id, sa_id) for sa_id, staff_ids in allocations.items() for staff_id in staff_ids
+        )
+        if self.settings.objective_mode == ObjectiveMode.LEXICOGRAPHIC:
+            return stage_values
+        return (self.strategy.weighted_value(stage_values),)
+
+    def _objective_value(self, score: Tuple[int, ...]) -> Union[float, Tuple[int, ...]]:
+        if self.settings.objective_mode == ObjectiveMode.LEXICOGRAPHIC:
+            return score
+        return score[0]
+
+    def _pick_neighbourhood(self) -> Tuple[NeighbourhoodType, Set[int]]:
+        kind = self.random.choice(list(NeighbourhoodType))
+
+        if kind == NeighbourhoodType.FLIGHT:
+            flight_numbers = sorted({sa.flight_number for sa in self.service_assignments if sa.flight_number})
+            if not flight_numbers:
+                return kind, set()
+            flight_number = self.random.choice(flight_numbers)
+            free_ids = {sa.id for sa in self.service_assignments if sa.flight_number == flight_number}
+            return kind, free_ids | self.context_service.overlapping(free_ids)
+
+        if kind == NeighbourhoodType.TIME_WINDOW:
+            if not self.service_assignments:
+                return kind, set()
+            window_start = self._start_minute(self.random.choice(self.service_assignments))
+            return kind, {
+                sa.id for sa in self.service_assignments
+                if window_start <= self._start_minute(sa) < window_start + self.window_minutes
+            }
+
+        if kind == NeighbourhoodType.DEPARTMENT:
+            department_ids = sorted({sa.department_id for sa in self.service_assignments})
+            if not department_ids:
+                return kind, set()
+            department_id = self.random.choice(department_ids)
+            return kind, {sa.id for sa in self.service_assignments if sa.department_id == department_id}
+
+        staff_ids = set(self.random.sample(sorted(self.staff_map), min(self.staff_per_neighbourhood, len(self.staff_map))))
+        free_ids = {sa_id for sa_id, allocated in self.allocations.items() if allocated & staff_ids}
+        for staff_id in staff_ids:
+            free_ids |= {
+                sa_id for sa_id in self.feasible_ids.get(staff_id, set())
+                if len(self.allocations.get(sa_id, ())) < self.service_assignment_map[sa_id].staff_count
+            }
+        return kind, free_ids
+
+    def _neighbourhood_arguments(self, free_ids: Set[int]) -> tuple:
+        return (
+            *self._day_arguments(),
+            self.allocations,
+            free_ids,
+            self.context_service.frozen_context(free_ids, self.allocations),
+            self.priority_ceiling,
+            self.neighbourhood_time_limit,
+        )
+
+    def _day_arguments(self) -> tuple:
+        return (
+            self.roster,
+            self.services,
+            self.flights,
+            self.service_assignments,
+            self.locations,
+            self.settings,
+            self.travel_times,
+        )
+
+    def _start_minute(self, sa: ServiceAssignment) -> int:
+        if sa.flight_number:
+            return self.flight_map[sa.flight_number].get_service_time_minutes(sa.relative_start, sa.relative_end)[0]
+        return sa.start_time.hour * 60 + sa.start_time.minute
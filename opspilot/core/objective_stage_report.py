@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+class ObjectiveStageReport(BaseModel):
+    """
+    Outcome of one stage of a lexicographic solve.
+
+    Attributes:
+        name: Name of the objective stage (e.g. "coverage")
+        status: CP-SAT status name of the stage solve
+        objective_value: Best value of the stage expression, None without a solution
+        best_objective_bound: Best proven bound on the stage expression
+        solve_time: Wall time of the stage in seconds
+    """
+    name: str
+    status: str
+    objective_value: Optional[float] = None
+    best_objective_bound: Optional[float] = None
+    solve_time: float = Field(default=0.0, ge=0)
@@ -0,0 +1,205 @@
+from typing import Optional, List, Dict, Set
+from opspilot.core.scheduler import Scheduler
+from opspilot.core.scheduler_result import SchedulerResult
+from opspilot.models import Staff, Service, Flight, ServiceAssignment, TravelTime, Settings, Location
+from opspilot.services import OverlapDetectionService, FeasibilityService, FrozenContextService
+from opspilot.plans import AllocationPlan
+from opspilot.problem import CompiledProblem
+from time import time
+import logging
+
+class RollingHorizonScheduler:
+    """
+    Solves the day in overlapping time windows instead of one model, so solve time grows roughly
+    linearly with the length of the day.
+
+    Service assignments are placed in the windows by start time. Each window is solved with the
+    allocations already committed by earlier windows frozen at its boundary (see FrozenContextService).
+    Only the service assignments starting before the next window are committed; the ones in the
+    overlap are solved again by the next window, hinted with the previous solution.
+
+    The stitched plan is scored with the assignment strategy on the compiled full day (weighted
+    objective), so `objective_value` can be compared with the objective of a single Scheduler run
+    without building a full-day model.
+    """
+
+    def __init__(
+        self,
+        roster: List[Staff],
+        services: List[Service],
+        flights: List[Flight],
+        service_assignments: List[ServiceAssignment],
+        locations: List[Location],
+        settings: Settings,
+        travel_times: Optional[List[TravelTime]] = [],
+        window_minutes: int = 180,
+        overlap_minutes: int = 60
+    ):
+        if window_minutes <= 0:
+            raise ValueError("window_minutes must be positive")
+        if not 0 <= overlap_minutes < window_minutes:
+            raise ValueError("overlap_minutes must be at least 0 and smaller than window_minutes")
+
+        self.roster = roster
+        self.services = services
+        self.flights = flights
+        self.service_assignments = service_assignments
+        self.locations = locations
+        self.settings = settings
+        self.travel_times = travel_times
+        self.window_minutes = window_minutes
+        self.overlap_minutes = overlap_minutes
+
+        self.service_assignment_map = {sa.id: sa for sa in service_assignments}
+        self.service_map = {service.id: service for service in services}
+        self.staff_map = {staff.id: staff for staff in roster}
+        self.flight_map = {flight.number: flight for flight in flights}
+        self.location_map = {location.id: location for location in locations}
+        self.travel_time_map = {(travel_time.origin_location_id, travel_time.destination_location_id): travel_time.travel_minutes for travel_time in travel_times}
+        self.priority_ceiling = max((sa.priority for sa in service_assignments), default=0) + 1
+
+        # Results and metrics
+        self.allocations: Dict[int, Set[int]] = {}
+        self.window_count: int = 0
+        self.solve_time: float = 0.0
+        self.objective_value: Optional[float] = None
+
+    def run(self) -> AllocationPlan:
+        """Solve the windows one after another and return the stitched plan."""
+        start_time = time()
+        logging.info(f"Starting rolling horizon ({self.window_minutes} min windows, {self.overlap_minutes} min overlap)...")
+
+        overlap_map = OverlapDetectionService(
+            service_assignments=self.service_assignments,
+            flight_map=self.flight_map,
+            location_map=self.location_map,
+            travel_time_map=self.travel_time_map,
+            settings=self.settings
+        ).detect_overlaps()
+        context_service = FrozenContextService(self.service_assignment_map, overlap_map)
+
+        starts = {sa.id: self._start_minute(sa) for sa in self.service_assignments}
+        ordered = sorted(self.service_assignments, key=lambda sa: (starts[sa.id], sa.id))
+
+        self.allocations = {}
+        self.window_count = 0
+        previous: Dict[int, Set[int]] = {}  # Uncommitted allocations of the previous window, used as hints
+        step = self.window_minutes - self.overlap_minutes
+        position = 0  # Index in ordered of the first service assignment not committed yet
+
+        window_start = 0
+        while position < len(ordered):
+            # Skip ahead over periods without service assignments
+            window_start = max(window_start, starts[ordered[position].id])
+            window_end = window_start + self.window_minutes
+            commit_end = window_start + step
+
+            window_ids = set()
+            for sa in ordered[position:]:
+                if starts[sa.id] >= window_end:
+                    break
+                window_ids.add(sa.id)
+
+            is_last = position + len(window_ids) == len(ordered)
+            solution = self._solve_window(window_ids, context_service, previous)
+            self.window_count += 1
+
+            # Commit the service assignments starting before the next window
+            previous = {}
+            while position < len(ordered) and (is_last or starts[ordered[position].id] < commit_end):
+                sa_id = ordered[position].id
+                if solution.get(sa_id):
+                    self.allocations[sa_id] = solution[sa_id]
+                position += 1
+
+            for sa_id in window_ids:
+                if sa_id not in self.allocations and solution.get(sa_id):
+                    previous[sa_id] = solution[sa_id]
+
+            window_start += step
+
+        self.objective_value = self._evaluate(self.allocations)
+        self.solve_time = time() - start_time
+
+        logging.info(
+            f"Rolling horizon finished {self.window_count} windows in {self.solve_time:.2f}s "
+            f"(objective: {self.objective_value})"
+        )
+
+        return self._plan(self.allocations)
+
+    def objective_gap(self, full_objective_value: float) -> float:
+        """Relative objective given up compared with a full solve (objectives are maximized)."""
+        if self.objective_value is None:
+            raise ValueError("Rolling horizon has not been run")
+        return (full_objective_value - self.objective_value) / max(1.0, abs(full_objective_value))
+
+    def _solve_window(
+        self,
+        window_ids: Set[int],
+        context_service: FrozenContextService,
+        previous: Dict[int, Set[int]]
+    ) -> Dict[int, Set[int]]:
+        frozen = context_service.frozen_context(window_ids, self.allocations)
+
+        scheduler = Scheduler(
+            roster=self.roster,
+            services=self.services,
+            flights=self.flights,
+            service_assignments=[sa for sa in self.service_assignments if sa.id in window_ids or sa.id in frozen],
+            locations=self.locations,
+            settings=self.settings,
+            travel_times=self.travel_times,
+            hints=self._plan(previous) if previous else None,
+            frozen=frozen,
+            priority_ceiling=self.priority_ceiling
+        )
+
+        if scheduler.run() != SchedulerResult.FOUND:
+            logging.warning(f"No solution found for window of {len(window_ids)} service assignments")
+            return {}
+
+        allocations = scheduler.get_allocation_plan(self.location_map).allocations
+        return {sa_id: set(staff_ids) for sa_id, staff_ids in allocations.items() if sa_id in window_ids}
+
+    def _evaluate(self, allocations: Dict[int, Set[int]]) -> float:
+        """Weighted objective of the full day for the given allocations."""
+        capability_matrix = FeasibilityService(
+            roster=self.roster,
+            service_assignments=self.service_assignments,
+            service_map=self.service_map,
+            flight_map=self.flight_map
+        ).capability_matrix()
+        strategy = Scheduler.create_strategy(
+            self.settings.assignment_strategy,
+            CompiledProblem.compile(
+                roster=self.roster,
+                services=self.services,
+                flights=self.flights,
+                service_assignments=self.service_assignments,
+                capability_matrix=capability_matrix
+            ),
+            priority_ceiling=self.priority_ceiling
+        )
+        stage_values = strategy.evaluate(
+            (staff_id, sa_id) for sa_id, staff_ids in allocations.items() for staff_id in staff_ids
+        )
+        return float(strategy.weighted_value(stage_values))
+
+    def _start_minute(self, sa: ServiceAssignment) -> int:
+        if sa.flight_number:
+            return self.flight_map[sa.flight_number].get_service_time_minutes(sa.relative_start, sa.relative_end)[0]
+        return sa.start_time.hour * 60 + sa.start_time.minute
+
+    def _plan(self, allocations: Dict[int, Set[int]]) -> AllocationPlan:
+        plan = AllocationPlan(
+            service_assignment_map=self.service_assignment_map,
+            service_map=self.service_map,
+            staff_map=self.staff_map,
+            flight_map=self.flight_map,
+            location_map=self.location_map,
+        )
+        for sa_id, staff_ids in allocations.items():
+            for staff_id in staff_ids:
+                plan.add_allocation(service_assignment_id=sa_id, staff_id=staff_id)
+        return plan
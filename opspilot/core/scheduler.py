@@ -1,14 +1,25 @@
 from ortools.sat.python import cp_model
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Iterator, AsyncIterator, Iterable, Set
 from opspilot.core.scheduler_result import SchedulerResult
-from opspilot.models import Staff, Service, Flight, ServiceAssignment, TravelTime, Settings, AssignmentStrategy, Location
-from opspilot.services import OverlapDetectionService
-from opspilot.constraints import StaffCertificationConstraint, StaffEligibilityConstraint, StaffCountConstraint, StaffAvailabilityConstraint, StaffRoleConstraint
-from opspilot.constraints import ServiceTransitionConstraint, SingleServiceConstraint, FixedServiceConstraint, MultiTaskServiceConstraint
-from opspilot.strategies import MinimizeStaffStrategy, BalanceWorkloadStrategy, TurnaroundWorkloadStrategy
+from opspilot.core.solver_report import SolverReport
+from opspilot.core.objective_stage_report import ObjectiveStageReport
+from opspilot.core.scheduler_metrics import SchedulerMetrics
+from opspilot.core.solution_stream_callback import SolutionStreamCallback
+from opspilot.models import Staff, Service, Flight, ServiceAssignment, TravelTime, Settings, AssignmentStrategy, Location, TransitionEncoding, SchedulingEngine, ObjectiveMode, SolverProfile
+from opspilot.services import OverlapDetectionService, OverlapCliqueService, FeasibilityService, HintRepairService, StaffEquivalenceService
+from opspilot.constraints import Constraint, StaffCountConstraint
+from opspilot.constraints import ServiceTransitionConstraint, NoOverlapTransitionConstraint, SingleServiceConstraint, FixedServiceConstraint, MultiTaskServiceConstraint
+from opspilot.constraints import FrozenAllocationConstraint, SymmetryBreakingConstraint
+from opspilot.problem import CompiledProblem
+from opspilot.strategies import Strategy, MinimizeStaffStrategy, BalanceWorkloadStrategy, TurnaroundWorkloadStrategy, ObjectiveStage
 from opspilot.plans import AllocationPlan
+from opspilot.utils import AssignmentVarIndex
 from time import time
+from collections import defaultdict
+import asyncio
 import logging
+import queue
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -23,7 +34,9 @@ class Scheduler:
         locations: List[Location],
         settings: Settings,
         travel_times: Optional[List[TravelTime]] = [],
-        hints: Optional[AllocationPlan] = None
+        hints: Optional[AllocationPlan] = None,
+        frozen: Optional[Dict[int, Set[int]]] = None,
+        priority_ceiling: Optional[float] = None
     ):
         """
         Initialize the scheduler with input data.
@@ -34,6 +47,10 @@ class Scheduler:
             services: List of services with their certification requirements
             settings: Configuration parameters for scheduling
             previous_assignments: Optional previous assignments for continuity (staff_id -> service_assignment_id -> assigned)
+            frozen: Optional allocations to keep as they are (service_assignment_id -> staff_ids);
+                    no other staff can be assigned to these service assignments
+            priority_ceiling: Optional priority ceiling of the whole day for the turnaround workload strategy,
+                              used when only a part of the day is scheduled
         """
         self.roster = roster
         self.services = services
@@ -41,13 +58,23 @@ class Scheduler:
         self.service_assignments = service_assignments
         self.settings = settings
         self.hints = hints
+        self.frozen = frozen or {}
+        self.priority_ceiling = priority_ceiling
         
         # OR-Tools model
         self.model = cp_model.CpModel()
         self.solver = cp_model.CpSolver()
+        self.settings.solver_profile.apply(self.solver.parameters)
+
+        # Wall time, memory and model size of every build and solve stage
+        self.metrics = SchedulerMetrics()
         
         # Decision variables: (staff_id, service_assignment_id) -> BoolVar
         self.assignment_vars: Dict[Tuple[int, int], cp_model.IntVar] = {}
+
+        # Shared index of the decision variables by service assignment and by staff,
+        # filled while creating the variables and read by constraints and strategies
+        self.var_index = AssignmentVarIndex()
         
         # Lookup maps
         self.staff_map = {staff.id: staff for staff in roster}
@@ -66,81 +93,184 @@ class Scheduler:
             settings=self.settings
         )
 
-        self.overlap_map = overlap_detector.detect_overlaps()
+        with self._measure("overlap_detection"):
+            self.overlap_map = overlap_detector.detect_overlaps()
+
+        # Group overlapping assignments into cliques for the clique transition encoding
+        self.overlap_cliques = None
+        if self.settings.scheduling_engine == SchedulingEngine.OVERLAP_MAP \
+                and self.settings.transition_encoding == TransitionEncoding.CLIQUE:
+            with self._measure("overlap_cliques"):
+                self.overlap_cliques = OverlapCliqueService(
+                    overlap_map=self.overlap_map,
+                    service_assignments=self.service_assignments,
+                    flight_map=self.flight_map
+                ).detect_cliques()
+
+        # Interval padding per assignment for the interval engine
+        self.transition_paddings = None
+        if self.settings.scheduling_engine == SchedulingEngine.INTERVAL:
+            with self._measure("transition_paddings"):
+                self.transition_paddings = overlap_detector.transition_paddings()
+
+        # Certification, eligibility, shift availability and role match are resolved here once,
+        # so variables are only created for feasible pairs and no constraint needs to pin them to zero
+        feasibility_service = FeasibilityService(
+            roster=self.roster,
+            service_assignments=self.service_assignments,
+            service_map=self.service_map,
+            flight_map=self.flight_map
+        )
+
+        with self._measure("feasibility"):
+            self.capability_matrix = feasibility_service.capability_matrix()
+            self._restrict_frozen_capability()
+            self.feasible_pairs = self.capability_matrix.pairs()
+
+        # Compile the inputs once into the array-backed problem the constraints and strategies read
+        with self._measure("compile"):
+            self.problem = CompiledProblem.compile(
+                roster=self.roster,
+                services=self.services,
+                flights=self.flights,
+                service_assignments=self.service_assignments,
+                capability_matrix=self.capability_matrix
+            )
         
         # Create constraints
         self.constraints = [
-            StaffCertificationConstraint(
-                staff_map=self.staff_map,
-                service_assignment_map=self.service_assignment_map,
-                service_map=self.service_map,
-            ),
-            StaffEligibilityConstraint(
-                staff_map=self.staff_map,
-                service_assignment_map=self.service_assignment_map,
-            ),
-            StaffCountConstraint(service_assignments=self.service_assignments),
-            StaffAvailabilityConstraint(
-                roster=self.roster,
-                service_assignments=self.service_assignments,
-                flight_map=self.flight_map
-            ),
-            StaffRoleConstraint(
-                staff_map=self.staff_map,
-                service_assignment_map=self.service_assignment_map,
-            ),
-            ServiceTransitionConstraint(
-                roster=self.roster,
-                overlap_map=self.overlap_map,
-                service_assignment_map=self.service_assignment_map,
-                service_map=self.service_map,
-                flight_map=self.flight_map
+            StaffCountConstraint(
+                problem=self.problem,
+                var_index=self.var_index,
             ),
+            self._transition_constraint(),
             SingleServiceConstraint(
-                service_assignment_map=self.service_assignment_map,
+                problem=self.problem,
             ),
             FixedServiceConstraint(
-                service_assignment_map=self.service_assignment_map,
+                problem=self.problem,
             ),
             MultiTaskServiceConstraint(
-                service_assignments=self.service_assignments,
-                roster=self.roster,
-                service_map=self.service_map,
+                problem=self.problem,
             ),
         ]
+
+        if self.frozen:
+            self.constraints.append(FrozenAllocationConstraint(frozen=self.frozen))
+
+        # Equivalence classes of interchangeable staff, only used to break their symmetry
+        self.staff_classes: List[List[int]] = []
+        if self.settings.break_symmetry:
+            with self._measure("staff_equivalence"):
+                self.equivalence_service = StaffEquivalenceService(roster=self.roster, problem=self.problem)
+                self.staff_classes = self.equivalence_service.classes()
+            self.constraints.append(SymmetryBreakingConstraint(
+                classes=self.staff_classes,
+                columns=[self.equivalence_service.columns(staff_ids) for staff_ids in self.staff_classes],
+            ))
+        self.model_built = False
+
+        # Objective stages of the lexicographic objective mode, solved one after another
+        self.objective_stages: List[ObjectiveStage] = []
+
         # Results and metrics
         self.solution: Dict[Tuple[int, int], bool] = {}
+        self.assigned_staff: Dict[int, List[int]] = {}  # service_assignment_id -> assigned staff ids of the solution
         self.solution_status: Optional[SchedulerResult] = None
         self.solve_time: float = 0.0
         self.objective_value: float = 0.0
+        self.solver_report: Optional[SolverReport] = None
+        self.stage_reports: List[ObjectiveStageReport] = []
+        self._stage_solution: Optional[Dict[Tuple[int, int], bool]] = None  # Assignment values of the last solved stage
+
+        # Set when a solution stream is closed early, so no further lexicographic stage starts
+        self._stop_requested = threading.Event()
+
+    def _restrict_frozen_capability(self) -> None:
+        """Only the frozen staff keep a variable on a frozen service assignment."""
+        for sa_id, staff_ids in self.frozen.items():
+            j = self.capability_matrix.service_assignment_index.get(sa_id)
+            if j is None:
+                continue
+
+            column = self.capability_matrix.matrix[:, j]
+            keep = [self.capability_matrix.staff_index[staff_id] for staff_id in staff_ids if staff_id in self.capability_matrix.staff_index]
+            kept = column[keep].copy()
+            column[:] = False
+            column[keep] = kept
+
+    def _measure(self, name: str):
+        """Measure a build or solve stage into self.metrics."""
+        return self.metrics.measure(name, self.model, self.settings.trace_memory)
+
+    def _transition_constraint(self) -> Constraint:
+        """Transition constraint for the configured scheduling engine."""
+        if self.settings.scheduling_engine == SchedulingEngine.INTERVAL:
+            return NoOverlapTransitionConstraint(
+                service_assignments=self.service_assignments,
+                overlap_map=self.overlap_map,
+                flight_map=self.flight_map,
+                transition_paddings=self.transition_paddings,
+                capability_matrix=self.capability_matrix,
+            )
+
+        return ServiceTransitionConstraint(
+            overlap_map=self.overlap_map,
+            capability_matrix=self.capability_matrix,
+            cliques=self.overlap_cliques,
+        )
 
     def create_assignment_variables(self) -> None:
-        """Create decision variables for all possible staff-service assignment combinations."""
+        """Create decision variables for the feasible staff-service assignment pairs only."""
         start_time = time()
         logging.info("Creating assignment variables...")
         
-        for staff in self.roster:
-            for service_assignment in self.service_assignments:
-                key = (staff.id, service_assignment.id)
-                var_name = f"staff_{staff.id}_service_assignment_{service_assignment.id}"
-                self.assignment_vars[key] = self.model.NewBoolVar(var_name)
-                
-                # Apply hints if provided
-                if self.hints:
-                    hint = self.hints.get_allocation(service_assignment.id, staff.id)
-                    if hint:
-                        logging.debug(f"Applying hint: {hint} for key: {key}")
-                        self.model.AddHint(self.assignment_vars[key], 1)
-        
+        for staff_id, service_assignment_id in self.feasible_pairs:
+            key = (staff_id, service_assignment_id)
+            var_name = f"staff_{staff_id}_service_assignment_{service_assignment_id}"
+            self.assignment_vars[key] = self.model.NewBoolVar(var_name)
+            self.var_index.add(staff_id, service_assignment_id, self.assignment_vars[key])
+
+        # Apply hints if provided
+        if self.hints:
+            self.apply_hints(self.hints)
+
         logging.info(f"Created {len(self.assignment_vars)} assignment variables in {time() - start_time:.2f}s")
 
+    def apply_hints(self, hints: AllocationPlan) -> None:
+        """
+        Hint every assignment variable: 1 for the allocations of the plan, 0 for all others, so the
+        solver gets a complete warm start. With settings.repair_hints, conflicting allocations are
+        dropped first and the solver repairs the rest of the hint.
+        """
+        hinted = {
+            (staff_id, sa_id)
+            for sa_id, staff_ids in hints.allocations.items()
+            for staff_id in staff_ids
+        }
+
+        if self.settings.repair_hints:
+            hinted = HintRepairService(self.service_assignment_map, self.overlap_map).repair(hinted, self.assignment_vars.keys())
+            self.solver.parameters.repair_hint = True
+
+        # Hinted schedules of equivalent staff must follow the order of the symmetry breaking
+        if self.staff_classes:
+            hinted = self.equivalence_service.canonical(hinted, self.staff_classes)
+
+        self.model.ClearHints()
+        for key, var in self.assignment_vars.items():
+            self.model.AddHint(var, key in hinted)
+
+        logging.debug(f"Applied hints ({len(hinted)} allocations)")
+
     def apply_constraints(self) -> None:
         """Apply all constraints to the model."""
         start_time = time()
         logging.info("Applying constraints...")
 
         for constraint in self.constraints:
-            constraint.apply(self.model, self.assignment_vars)
+            with self._measure(type(constraint).__name__):
+                constraint.apply(self.model, self.assignment_vars)
 
         logging.info(f"Applied constraints in {time() - start_time:.2f}s")
 
@@ -155,39 +285,62 @@ class Scheduler:
         logging.info("Applying assignment strategy...")
 
         assignment_strategy = self.settings.assignment_strategy
+        strategy = self.create_strategy(assignment_strategy, self.problem, self.var_index, self.priority_ceiling)
 
-        if assignment_strategy == AssignmentStrategy.MINIMIZE_STAFF:
-            strategy = MinimizeStaffStrategy(
-                roster=self.roster,
-                service_assignment_map=self.service_assignment_map,)
-        elif assignment_strategy == AssignmentStrategy.BALANCE_WORKLOAD:
-            strategy = BalanceWorkloadStrategy(
-                roster=self.roster,
-                service_assignment_map=self.service_assignment_map,
-                staff_map=self.staff_map,
-            ) 
-        elif assignment_strategy == AssignmentStrategy.TURNAROUND_WORKLOAD:
-            strategy = TurnaroundWorkloadStrategy(
-                roster=self.roster,
-                service_assignment_map=self.service_assignment_map,
-                staff_map=self.staff_map,
-            )
+        if self.settings.objective_mode == ObjectiveMode.LEXICOGRAPHIC:
+            self.objective_stages = strategy.objective_stages(self.model, self.assignment_vars)
         else:
-            raise ValueError(f"Unknown assignment strategy: {strategy}")
-        
-        strategy.apply(self.model, self.assignment_vars)
+            strategy.apply(self.model, self.assignment_vars)
         logging.info(f"Assignment strategy set to {assignment_strategy.name} in {time() - start_time:.2f}s")
 
-    def run(self) -> SchedulerResult:
-        """Run the optimization and store results."""
-        self.create_assignment_variables()
+    @staticmethod
+    def create_strategy(
+        assignment_strategy: AssignmentStrategy,
+        problem: CompiledProblem,
+        var_index: Optional[AssignmentVarIndex] = None,
+        priority_ceiling: Optional[float] = None
+    ) -> Strategy:
+        """Strategy of the assignment strategy setting for the compiled problem."""
+        if assignment_strategy == AssignmentStrategy.MINIMIZE_STAFF:
+            return MinimizeStaffStrategy(
+                problem=problem,
+                var_index=var_index,
+            )
+        if assignment_strategy == AssignmentStrategy.BALANCE_WORKLOAD:
+            return BalanceWorkloadStrategy(
+                problem=problem,
+                var_index=var_index,
+            )
+        if assignment_strategy == AssignmentStrategy.TURNAROUND_WORKLOAD:
+            return TurnaroundWorkloadStrategy(
+                problem=problem,
+                priority_ceiling=priority_ceiling,
+            )
+        raise ValueError(f"Unknown assignment strategy: {assignment_strategy}")
+
+    def build_model(self) -> None:
+        """Create the variables, constraints and objective once."""
+        if self.model_built:
+            return
+
+        with self._measure("variables"):
+            self.create_assignment_variables()
         self.apply_constraints()
-        self.set_objective()
-        
+        with self._measure("strategy"):
+            self.set_objective()
+        self.model_built = True
+
+    def solve(self, callback: Optional[cp_model.CpSolverSolutionCallback] = None) -> SchedulerResult:
+        """Solve the built model and store results."""
         logging.info("Starting solver...")
         start_time = time()
 
-        status = self.solver.Solve(self.model)
+        with self._measure("solve"):
+            if self.objective_stages:
+                status = self._solve_stages(callback)
+            else:
+                status = self.solver.Solve(self.model, callback)
+                self.solver_report = SolverReport.from_solver(self.solver, status, self.settings.solver_profile)
         self.solve_time = time() - start_time
 
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
@@ -197,22 +350,196 @@ class Scheduler:
             self.solution_status = SchedulerResult.NOT_FOUND
         
         if self.solution_status == SchedulerResult.FOUND:
-            self._store_solution()
-            self.objective_value = self.solver.ObjectiveValue()
+            with self._measure("extraction"):
+                self._store_solution(self._stage_solution if self.objective_stages else None)
+            self.objective_value = self.solver_report.objective_value
 
         logging.info(
                 f"Solver finished with status: {self.solution_status} "
                 f"in {self.solve_time:.2f}s "
-                f"(objective: {self.objective_value})"
+                f"(objective: {self.objective_value}, "
+                f"bound: {self.solver_report.best_objective_bound}, "
+                f"termination: {self.solver_report.termination_reason.value})"
             )
         return self.solution_status
 
-    def _store_solution(self) -> None:
-        """Extract and store the solution from the solver."""
-        self.solution = {
-            (staff_id, service_assignment_id): bool(self.solver.Value(var))
-            for (staff_id, service_assignment_id), var in self.assignment_vars.items()
-        }
+    def _solve_stages(self, callback: Optional[cp_model.CpSolverSolutionCallback] = None) -> int:
+        """
+        Lexicographic solve: maximize each objective stage in turn, fix the value reached as a
+        constraint and hint the next stage with the solution found. The stages share the time limit
+        of the solver parameters: each stage gets the time left.
+
+        A later stage ending without a solution (e.g. on the time limit) keeps the solution of the
+        last stage that had one: its status is returned, its assignment values are kept in
+        _stage_solution and solver_report describes it, so the objective value of the scheduler is
+        the one of that stage. stage_reports holds every stage. Closing a solution stream stops the
+        stage running and skips the remaining ones.
+
+        The stages run on a copy of the built model, so their objectives, bounds and hints do not
+        carry over to a later solve.
+        """
+        self.stage_reports = []
+        self._stage_solution = None
+        status = cp_model.UNKNOWN
+        model = self.model.Clone()
+
+        parameters = self.solver.parameters
+        time_limit = parameters.max_time_in_seconds
+        deadline = time() + time_limit
+
+        try:
+            for k, stage in enumerate(self.objective_stages):
+                remaining = max(deadline - time(), 0.0)
+                if k > 0 and remaining == 0.0:
+                    logging.info(f"Time limit reached before objective stage {stage.name}")
+                    break
+                if k > 0 and self._stop_requested.is_set():
+                    logging.info(f"Search stopped before objective stage {stage.name}")
+                    break
+
+                stage_start = time()
+                model.ClearObjective()
+                model.Maximize(stage.expression)
+
+                parameters.max_time_in_seconds = remaining
+                stage_status = self.solver.Solve(model, callback)
+                has_solution = stage_status == cp_model.OPTIMAL or stage_status == cp_model.FEASIBLE
+
+                report = ObjectiveStageReport(
+                    name=stage.name,
+                    status=self.solver.StatusName(stage_status),
+                    objective_value=self.solver.ObjectiveValue() if has_solution else None,
+                    best_objective_bound=self.solver.BestObjectiveBound() if has_solution else None,
+                    solve_time=time() - stage_start,
+                )
+                self.stage_reports.append(report)
+                logging.info(f"Solved objective stage {stage.name} with status {report.status} in {report.solve_time:.2f}s (objective: {report.objective_value})")
+
+                if not has_solution and self._stage_solution is not None:
+                    logging.info(f"Keeping the solution of objective stage {self.stage_reports[-2].name}")
+                    break
+
+                status = stage_status
+                self.solver_report = SolverReport.from_solver(self.solver, stage_status, self._stage_profile(remaining))
+                if not has_solution:
+                    break
+
+                self._stage_solution = {key: self.solver.BooleanValue(var) for key, var in self.assignment_vars.items()}
+
+                if k < len(self.objective_stages) - 1:
+                    # Keep this stage at its optimum (or the best value found within the limits)
+                    if not isinstance(stage.expression, (int, float)):
+                        model.Add(stage.expression >= round(report.objective_value))
+
+                    model.ClearHints()
+                    for key, var in self.assignment_vars.items():
+                        model.AddHint(var, self._stage_solution[key])
+        finally:
+            parameters.max_time_in_seconds = time_limit
+
+        return status
+
+    def _stage_profile(self, time_limit: float) -> SolverProfile:
+        """Solver profile with the time limit a stage got, to tell a stage that ran out of time."""
+        profile = self.settings.solver_profile
+        if profile.max_time_in_seconds is None:
+            return profile
+        return profile.model_copy(update={"max_time_in_seconds": time_limit})
+
+    def run(self) -> SchedulerResult:
+        """Run the optimization and store results."""
+        self.build_model()
+        return self.solve()
+
+    def stream_solutions(self) -> Iterator[AllocationPlan]:
+        """
+        Solve on a background thread and yield an AllocationPlan for every improving solution.
+
+        Results are stored as with run() once the search ends. Closing the generator early
+        (e.g. breaking out of the loop) stops the search and keeps the best solution so far.
+        """
+        self.build_model()
+
+        solutions: queue.Queue = queue.Queue()
+        done = object()
+        errors: List[BaseException] = []
+        callback = SolutionStreamCallback(
+            assignment_vars=self.assignment_vars,
+            on_solution=lambda assigned, objective: solutions.put(assigned),
+        )
+
+        def solve() -> None:
+            try:
+                self.solve(callback)
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                solutions.put(done)
+
+        self._stop_requested.clear()
+        thread = threading.Thread(target=solve, name="scheduler-solve", daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                assigned = solutions.get()
+                if assigned is done:
+                    break
+                yield self._allocation_plan(assigned, self.location_map)
+        finally:
+            if thread.is_alive():
+                self._stop_requested.set()
+                callback.StopSearch()
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+    async def stream_solutions_async(self) -> AsyncIterator[AllocationPlan]:
+        """
+        Asyncio variant of stream_solutions: the solve runs in the loop's default executor and
+        improving solutions are handed over through an asyncio.Queue.
+        """
+        self.build_model()
+
+        loop = asyncio.get_running_loop()
+        solutions: asyncio.Queue = asyncio.Queue()
+        done = object()
+        callback = SolutionStreamCallback(
+            assignment_vars=self.assignment_vars,
+            on_solution=lambda assigned, objective: loop.call_soon_threadsafe(solutions.put_nowait, assigned),
+        )
+
+        self._stop_requested.clear()
+        solve_future = loop.run_in_executor(None, self.solve, callback)
+        solve_future.add_done_callback(lambda _: solutions.put_nowait(done))
+
+        try:
+            while True:
+                assigned = await solutions.get()
+                if assigned is done:
+                    break
+                yield self._allocation_plan(assigned, self.location_map)
+        finally:
+            if not solve_future.done():
+                self._stop_requested.set()
+                callback.StopSearch()
+            await solve_future
+
+    def _store_solution(self, values: Optional[Dict[Tuple[int, int], bool]] = None) -> None:
+        """Extract and store the solution from the solver, or from the given assignment values."""
+        if values is not None:
+            self.solution = dict(values)
+        else:
+            self.solution = {
+                (staff_id, service_assignment_id): bool(self.solver.Value(var))
+                for (staff_id, service_assignment_id), var in self.assignment_vars.items()
+            }
+
+        self.assigned_staff = defaultdict(list)
+        for (staff_id, service_assignment_id), assigned in self.solution.items():
+            if assigned:
+                self.assigned_staff[service_assignment_id].append(staff_id)
 
     def get_assignments(self) -> Dict[int, List[int]]:
         """
@@ -250,11 +577,7 @@ class Scheduler:
         Returns:
             List of staff IDs who are assigned to this service assignment.
         """
-        return [
-            staff_id
-            for (staff_id, sa_id), assigned in self.solution.items()
-            if sa_id == service_assignment_id and assigned
-        ]
+        return list(self.assigned_staff.get(service_assignment_id, []))
 
     def get_allocation_plan(self, location_map: Dict[int, 'Location'],) -> AllocationPlan:
         """
@@ -263,7 +586,15 @@ class Scheduler:
         Returns:
             AllocationPlan containing all assignments from the current solution
         """
-        # Initialize the allocation plan with all required components
+        # If no solution exists, return empty plan
+        if self.solution_status != SchedulerResult.FOUND:
+            return self._allocation_plan([], location_map)
+
+        assigned = [key for key, is_assigned in self.solution.items() if is_assigned]
+        return self._allocation_plan(assigned, location_map)
+
+    def _allocation_plan(self, assigned: Iterable[Tuple[int, int]], location_map: Dict[int, 'Location']) -> AllocationPlan:
+        """Build an AllocationPlan from assigned (staff_id, service_assignment_id) pairs."""
         allocation_plan = AllocationPlan(
             service_assignment_map=self.service_assignment_map,
             service_map=self.service_map,
@@ -271,17 +602,11 @@ class Scheduler:
             flight_map=self.flight_map,
             location_map=location_map,
         )
-        
-        # If no solution exists, return empty plan
-        if self.solution_status != SchedulerResult.FOUND:
-            return allocation_plan
-        
-        # Populate the allocation plan with assignments from the solution
-        for (staff_id, service_assignment_id), assigned in self.solution.items():
-            if assigned:  # Only add positive assignments
-                allocation_plan.add_allocation(
-                    service_assignment_id=service_assignment_id,
-                    staff_id=staff_id
-                )
-        
+
+        for staff_id, service_assignment_id in assigned:
+            allocation_plan.add_allocation(
+                service_assignment_id=service_assignment_id,
+                staff_id=staff_id
+            )
+
         return allocation_plan
\ No newline at end of file
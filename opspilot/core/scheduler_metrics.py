@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+from pydantic import BaseModel
+from typing import Iterator, List, Optional, Tuple
+from ortools.sat.python import cp_model
+from opspilot.core.stage_metrics import StageMetrics
+from time import time
+import tracemalloc
+
+class SchedulerMetrics(BaseModel):
+    """
+    Build and solve cost of a Scheduler run, one entry per stage in the order the stages ran.
+    Serialized with to_json() to track build cost across releases.
+
+    Attributes:
+        stages: Metrics of every measured stage
+    """
+    stages: List[StageMetrics] = []
+
+    @property
+    def wall_time(self) -> float:
+        return sum(stage.wall_time for stage in self.stages)
+
+    @property
+    def variables(self) -> int:
+        return sum(stage.variables_added for stage in self.stages)
+
+    @property
+    def constraints(self) -> int:
+        return sum(stage.constraints_added for stage in self.stages)
+
+    def stage(self, name: str) -> Optional[StageMetrics]:
+        """Metrics of the last stage with the given name."""
+        return next((stage for stage in reversed(self.stages) if stage.name == name), None)
+
+    @contextmanager
+    def measure(self, name: str, model: Optional[cp_model.CpModel] = None, trace_memory: bool = False) -> Iterator[None]:
+        """
+        Record the wall time, the variables and constraints added to the model and, with trace_memory,
+        the peak memory of the code run inside the block. Tracing is started (and stopped again) for the
+        stage unless tracemalloc is already tracing.
+        """
+        started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        memory_start = None
+        if trace_memory:
+            tracemalloc.reset_peak()
+            memory_start = tracemalloc.get_traced_memory()[0]
+
+        variables_start, constraints_start = self._model_size(model)
+        start_time = time()
+        try:
+            yield
+        finally:
+            wall_time = time() - start_time
+            memory_peak_delta = None
+            if trace_memory:
+                memory_peak_delta = max(0, tracemalloc.get_traced_memory()[1] - memory_start)
+            if started_tracing:
+                tracemalloc.stop()
+
+            variables_end, constraints_end = self._model_size(model)
+            self.stages.append(StageMetrics(
+                name=name,
+                wall_time=wall_time,
+                memory_peak_delta=memory_peak_delta,
+                variables_added=variables_end - variables_start,
+                constraints_added=constraints_end - constraints_start,
+            ))
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return self.model_dump_json(indent=indent)
+
+    @staticmethod
+    def _model_size(model: Optional[cp_model.CpModel]) -> Tuple[int, int]:
+        if model is None:
+            return 0, 0
+        proto = model.Proto()
+        return len(proto.variables), len(proto.constraints)
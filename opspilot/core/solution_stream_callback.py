@@ -0,0 +1,25 @@
+from ortools.sat.python import cp_model
+from typing import Callable, Dict, List, Tuple
+
+class SolutionStreamCallback(cp_model.CpSolverSolutionCallback):
+    """
+    Solution callback handing every improving incumbent to `on_solution` as the list of
+    assigned (staff_id, service_assignment_id) pairs together with its objective value.
+
+    It runs on a solver thread, so it only reads the variable values; building plans
+    is left to the consumer.
+    """
+    def __init__(
+        self,
+        assignment_vars: Dict[Tuple[int, int], cp_model.IntVar],
+        on_solution: Callable[[List[Tuple[int, int]], float], None]
+    ):
+        super().__init__()
+        self.assignment_vars = assignment_vars
+        self.on_solution = on_solution
+        self.solution_count = 0
+
+    def on_solution_callback(self) -> None:
+        self.solution_count += 1
+        assigned = [key for key, var in self.assignment_vars.items() if self.BooleanValue(var)]
+        self.on_solution(assigned, self.ObjectiveValue())
@@ -0,0 +1,68 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from ortools.sat.python import cp_model
+from opspilot.core.termination_reason import TerminationReason
+from opspilot.models import SolverProfile
+
+class SolverReport(BaseModel):
+    """
+    Outcome of a CP-SAT solve: why the search stopped and how close it got to the optimum.
+
+    Attributes:
+        status: CP-SAT status name (OPTIMAL, FEASIBLE, INFEASIBLE, ...)
+        termination_reason: Which limit (if any) terminated the search
+        objective_value: Objective of the best solution found, None without a solution
+        best_objective_bound: Best proven bound on the objective
+        relative_gap: |objective - bound| / max(1, |objective|), None without a solution
+        wall_time: Solver wall time in seconds
+    """
+    status: str
+    termination_reason: TerminationReason
+    objective_value: Optional[float] = None
+    best_objective_bound: Optional[float] = None
+    relative_gap: Optional[float] = None
+    wall_time: float = Field(default=0.0, ge=0)
+    num_conflicts: int = 0
+    num_branches: int = 0
+
+    @classmethod
+    def from_solver(cls, solver: cp_model.CpSolver, status: int, profile: SolverProfile) -> 'SolverReport':
+        has_solution = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+        objective_value = solver.ObjectiveValue() if has_solution else None
+        best_objective_bound = solver.BestObjectiveBound() if has_solution else None
+        relative_gap = None
+        if has_solution:
+            relative_gap = abs(objective_value - best_objective_bound) / max(1.0, abs(objective_value))
+
+        return cls(
+            status=solver.StatusName(status),
+            termination_reason=cls._termination_reason(status, relative_gap, solver.WallTime(), profile),
+            objective_value=objective_value,
+            best_objective_bound=best_objective_bound,
+            relative_gap=relative_gap,
+            wall_time=solver.WallTime(),
+            num_conflicts=solver.NumConflicts(),
+            num_branches=solver.NumBranches(),
+        )
+
+    @staticmethod
+    def _termination_reason(
+        status: int,
+        relative_gap: Optional[float],
+        wall_time: float,
+        profile: SolverProfile
+    ) -> TerminationReason:
+        if status == cp_model.OPTIMAL:
+            # CP-SAT reports OPTIMAL when it stops on the gap limit, so an open gap means the limit hit
+            if relative_gap and profile.relative_gap_limit:
+                return TerminationReason.GAP_LIMIT
+            return TerminationReason.OPTIMAL
+        elif status == cp_model.INFEASIBLE:
+            return TerminationReason.INFEASIBLE
+        elif status == cp_model.MODEL_INVALID:
+            return TerminationReason.MODEL_INVALID
+        elif profile.max_time_in_seconds is not None and wall_time >= profile.max_time_in_seconds * 0.99:
+            return TerminationReason.TIME_LIMIT
+
+        return TerminationReason.UNKNOWN
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+class StageMetrics(BaseModel):
+    """
+    Cost of one stage of building or solving the model.
+
+    Attributes:
+        name: Stage name ("overlap_detection", "variables", a constraint class name, "strategy", "solve", ...)
+        wall_time: Wall time of the stage in seconds
+        memory_peak_delta: Peak traced Python memory above the start of the stage in bytes,
+                           None unless Settings.trace_memory is set
+        variables_added: Number of model variables added by the stage
+        constraints_added: Number of model constraints added by the stage
+    """
+    name: str
+    wall_time: float = Field(default=0.0, ge=0)
+    memory_peak_delta: Optional[int] = None
+    variables_added: int = 0
+    constraints_added: int = 0
@@ -0,0 +1,9 @@
+from enum import Enum
+
+class TerminationReason(str, Enum):
+    OPTIMAL = "Optimal"  # Search completed, solution proven optimal
+    GAP_LIMIT = "Gap Limit"  # Stopped once within the relative gap limit
+    TIME_LIMIT = "Time Limit"  # Stopped by max_time_in_seconds
+    INFEASIBLE = "Infeasible"  # Proven that no solution exists
+    MODEL_INVALID = "Model Invalid"
+    UNKNOWN = "Unknown"  # Stopped for any other reason
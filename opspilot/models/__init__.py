@@ -4,6 +4,11 @@ from .enums import (
     EquipmentType,
     ServiceType,
     AssignmentStrategy,
+    TransitionEncoding,
+    SchedulingEngine,
+    SolverProfileType,
+    ObjectiveMode,
+    NeighbourhoodType,
 )
 from .flight import Flight
 from .location import Location
@@ -11,12 +16,14 @@ from .service_assignment import ServiceAssignment
 from .service import Service
 from .settings import Settings
 from .shift import Shift
+from .solver_profile import SolverProfile
 from .staff import Staff
 from .travel_time import TravelTime
+from .disruption import Disruption
 
 __all__ = [
-    'Certification', 'CertificationRequirement', 'EquipmentType',
-    'ServiceType', 'AssignmentStrategy', 'Flight',
-    'Location', 'ServiceAssignment', 'Service',
-    'Settings', 'Shift', 'Staff', 'TravelTime',
+    'Certification', 'CertificationRequirement', 'Disruption', 'EquipmentType',
+    'ServiceType', 'AssignmentStrategy', 'TransitionEncoding', 'SchedulingEngine', 'Flight',
+    'Location', 'NeighbourhoodType', 'ObjectiveMode', 'ServiceAssignment', 'Service',
+    'Settings', 'Shift', 'SolverProfile', 'SolverProfileType', 'Staff', 'TravelTime',
 ]
\ No newline at end of file
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import List
+from opspilot.models.flight import Flight
+from opspilot.models.staff import Staff
+
+class Disruption(BaseModel):
+    """
+    Changes to the day after a plan was made, re-optimized by the IncrementalScheduler.
+
+    Attributes:
+        changed_flights: Flights with new arrival/departure times (matched by flight number)
+        cancelled_flights: Numbers of the flights that no longer operate
+        removed_staff_ids: Staff no longer available (e.g. sick calls)
+        added_staff: Staff joining the roster
+    """
+    changed_flights: List[Flight] = Field(default_factory=list)
+    cancelled_flights: List[str] = Field(default_factory=list)
+    removed_staff_ids: List[int] = Field(default_factory=list)
+    added_staff: List[Staff] = Field(default_factory=list)
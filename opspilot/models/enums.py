@@ -19,3 +19,26 @@ class AssignmentStrategy(str, Enum):
     MINIMIZE_STAFF = "Minimize Staff"  # Fewest staff possible
     BALANCE_WORKLOAD = "Balance Workload"  # Even distribution
     TURNAROUND_WORKLOAD = "Turnaround Workload"  # Focus on turnaround efficiency
+
+class TransitionEncoding(str, Enum):
+    PAIRWISE = "Pairwise"  # One constraint per staff and overlapping pair
+    CLIQUE = "Clique"  # One AddAtMostOne per staff and clique of mutually overlapping assignments
+
+class SchedulingEngine(str, Enum):
+    OVERLAP_MAP = "Overlap Map"  # Transitions from the precomputed overlap map
+    INTERVAL = "Interval"  # Optional interval variables with NoOverlap per staff
+
+class SolverProfileType(str, Enum):
+    DEFAULT = "Default"  # CP-SAT defaults, no limits
+    REALTIME = "Realtime"  # Short time limit and gap tolerance for interactive use
+    OVERNIGHT = "Overnight"  # Long time limit and stronger search for batch planning
+
+class ObjectiveMode(str, Enum):
+    WEIGHTED = "Weighted"  # One objective combining the strategy terms with weights
+    LEXICOGRAPHIC = "Lexicographic"  # One solve per strategy term, fixing each optimum before the next
+
+class NeighbourhoodType(str, Enum):
+    FLIGHT = "Flight"  # Service assignments of one flight and the ones overlapping them
+    TIME_WINDOW = "Time Window"  # Service assignments starting in a time window
+    DEPARTMENT = "Department"  # Service assignments of one department
+    STAFF = "Staff"  # Service assignments of a set of staff and the understaffed ones they can perform
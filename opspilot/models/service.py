@@ -1,9 +1,15 @@
 from pydantic import BaseModel
 from typing import List
 from opspilot.models.enums import CertificationRequirement
+from opspilot.utils import CertificationMask
 
 class Service(BaseModel):
     id: int
     name: str
     certifications: List[int]  # List of certification IDs
     certification_requirement: CertificationRequirement
+
+    @property
+    def certification_mask(self) -> int:
+        """Bitmask of the required certification ids (see CertificationMask)."""
+        return CertificationMask.encode(tuple(self.certifications))
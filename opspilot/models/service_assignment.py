@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, model_validator, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator, field_validator
 from typing import List, Dict, Tuple, Optional
 from opspilot.models import ServiceType, EquipmentType, Flight
 from datetime import datetime, time
@@ -32,6 +32,9 @@ class ServiceAssignment(BaseModel):
     equipment_type: Optional[EquipmentType] = None # Type of equipment required for the service
     equipment_id: Optional[int] = None  # Id of the equipment to be used (if any)
 
+    # Common zone intervals, stored with the (start_time, end_time) they were resolved from
+    _interval_cache: Optional[Tuple[Tuple[time, time], List[Tuple[int, int]]]] = PrivateAttr(default=None)
+
     @field_validator("start_time", "end_time", mode='before')
     def parse_times(cls, v):
         if v is None:
@@ -47,6 +50,9 @@ class ServiceAssignment(BaseModel):
         - If flight_number is set, resolves intervals using flight_map and relative times.
         - Else returns intervals for common zone service using start_time and end_time.
         - Raises ValueError if no valid time info is found.
+
+        Intervals are resolved once and cached (on the flight for flight zone services) until
+        the underlying times change. The returned list is shared and must not be modified.
         """
         if self.flight_number:
             flight = flight_map.get(self.flight_number)
@@ -56,9 +62,10 @@ class ServiceAssignment(BaseModel):
             return flight.get_service_minute_intervals(self.relative_start, self.relative_end)
 
         if self.start_time and self.end_time:
-            start_str = self.start_time.strftime("%H:%M")
-            end_str = self.end_time.strftime("%H:%M")
-            return TimeRangeUtils.to_minute_ranges(start_str, end_str)
+            times = (self.start_time, self.end_time)
+            if self._interval_cache is None or self._interval_cache[0] != times:
+                self._interval_cache = (times, TimeRangeUtils.to_minute_ranges_from_times(*times))
+            return self._interval_cache[1]
 
     @model_validator(mode='after')
     def validate_time_specification(self):
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from opspilot.models.enums import AssignmentStrategy
+from pydantic import BaseModel, Field, field_validator
+from opspilot.models.enums import AssignmentStrategy, TransitionEncoding, SchedulingEngine, SolverProfileType, ObjectiveMode
+from opspilot.models.solver_profile import SolverProfile
 
 class Settings(BaseModel):
     """
@@ -11,7 +12,35 @@ class Settings(BaseModel):
         default_travel_time: Fallback travel time (minutes) when 
                              no location-to-location travel time is specified.
         assignment_strategy: Strategy for optimizing staff assignments.
+        transition_encoding: How overlapping service assignments are encoded in the model
+                             (pairwise constraints or one at-most-one per clique).
+        scheduling_engine: How staff transitions are modelled (overlap map constraints or
+                           optional interval variables with NoOverlap per staff).
+        solver_profile: CP-SAT search parameters (time limit, workers, gap, ...). Accepts a
+                        SolverProfile or the name of a predefined profile (e.g. "Realtime").
+        objective_mode: How the strategy objective is solved: WEIGHTED (one weighted objective) or
+                        LEXICOGRAPHIC (coverage first, then the next terms with each optimum fixed).
+        repair_hints: Drop hinted allocations that conflict (staff count, overlaps) and let the solver
+                      repair the remaining hint instead of ignoring it when it is infeasible.
+        break_symmetry: Group interchangeable staff into equivalence classes and order their schedules
+                        lexicographically by staff id, so the solver does not explore their permutations
+                        (hints are permuted to match, so warm-started plans may swap equivalent staff).
+        trace_memory: Record the peak memory of every build and solve stage in the scheduler metrics
+                      (uses tracemalloc, which slows the build down).
     """
     overlap_buffer_minutes: int = Field(default=10, ge=0, description="Maximum allowed overlap time in minutes")
     default_travel_time: int = Field(default=10, gt=0, description="Default travel time in minutes")
-    assignment_strategy: AssignmentStrategy = AssignmentStrategy.BALANCE_WORKLOAD
\ No newline at end of file
+    assignment_strategy: AssignmentStrategy = AssignmentStrategy.BALANCE_WORKLOAD
+    transition_encoding: TransitionEncoding = TransitionEncoding.CLIQUE
+    scheduling_engine: SchedulingEngine = SchedulingEngine.OVERLAP_MAP
+    solver_profile: SolverProfile = Field(default_factory=SolverProfile)
+    objective_mode: ObjectiveMode = ObjectiveMode.WEIGHTED
+    repair_hints: bool = False
+    break_symmetry: bool = False
+    trace_memory: bool = False
+
+    @field_validator("solver_profile", mode='before')
+    def parse_solver_profile(cls, v):
+        if isinstance(v, (str, SolverProfileType)):
+            return SolverProfile.preset(SolverProfileType(v))
+        return v
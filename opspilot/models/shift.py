@@ -15,6 +15,4 @@ class Shift(BaseModel):
 
     @property
     def minute_intervals(self) -> List[Tuple[int, int]]:
-        start_str = self.start_time.strftime("%H:%M")
-        end_str = self.end_time.strftime("%H:%M")
-        return TimeRangeUtils.to_minute_ranges(start_str, end_str)
\ No newline at end of file
+        return TimeRangeUtils.to_minute_ranges_from_times(self.start_time, self.end_time)
\ No newline at end of file
@@ -0,0 +1,58 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from ortools.sat.sat_parameters_pb2 import SatParameters
+from opspilot.models.enums import SolverProfileType
+
+class SolverProfile(BaseModel):
+    """
+    CP-SAT search parameters used by the scheduler. Parameters left as None keep the solver default.
+
+    Attributes:
+        max_time_in_seconds: Wall time limit of a solve.
+        num_search_workers: Number of parallel search workers (0 lets the solver decide).
+        relative_gap_limit: Stop once |objective - bound| / |objective| is below this value.
+        linearization_level: How much of the model is linearized for the LP relaxation (0-2).
+        symmetry_level: How much symmetry detection and breaking is done (0-4).
+    """
+    max_time_in_seconds: Optional[float] = Field(default=None, gt=0, description="Wall time limit in seconds")
+    num_search_workers: Optional[int] = Field(default=None, ge=0, description="Number of parallel search workers")
+    relative_gap_limit: Optional[float] = Field(default=None, ge=0, description="Relative optimality gap to stop at")
+    linearization_level: Optional[int] = Field(default=None, ge=0, le=2, description="LP linearization level")
+    symmetry_level: Optional[int] = Field(default=None, ge=0, le=4, description="Symmetry detection level")
+
+    @classmethod
+    def preset(cls, profile_type: SolverProfileType) -> 'SolverProfile':
+        """Predefined profiles."""
+        if profile_type == SolverProfileType.REALTIME:
+            return cls(
+                max_time_in_seconds=5.0,
+                num_search_workers=8,
+                relative_gap_limit=0.01,
+                linearization_level=0,
+                symmetry_level=1,
+            )
+        elif profile_type == SolverProfileType.OVERNIGHT:
+            return cls(
+                max_time_in_seconds=3600.0,
+                num_search_workers=0,
+                relative_gap_limit=0.0,
+                linearization_level=2,
+                symmetry_level=4,
+            )
+        elif profile_type == SolverProfileType.DEFAULT:
+            return cls()
+
+        raise ValueError(f"Unknown solver profile: {profile_type}")
+
+    def apply(self, parameters: SatParameters) -> None:
+        """Copy the configured parameters onto the solver parameters."""
+        if self.max_time_in_seconds is not None:
+            parameters.max_time_in_seconds = self.max_time_in_seconds
+        if self.num_search_workers is not None:
+            parameters.num_workers = self.num_search_workers
+        if self.relative_gap_limit is not None:
+            parameters.relative_gap_limit = self.relative_gap_limit
+        if self.linearization_level is not None:
+            parameters.linearization_level = self.linearization_level
+        if self.symmetry_level is not None:
+            parameters.symmetry_level = self.symmetry_level
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 from typing import List, Optional, Tuple
 from opspilot.models import Shift, Service, CertificationRequirement, ServiceType, ServiceAssignment
-from opspilot.utils import TimeRangeUtils
+from opspilot.utils import TimeRangeUtils, CertificationMask
 
 class Staff(BaseModel):
     id: int
@@ -13,6 +13,11 @@ class Staff(BaseModel):
     priority_service_id: Optional[int] = None       # Strong preference for assignment
     rank_level: Optional[int] = 0                   # Lower number is higher priority
     role_code: Optional[str] = None                 # Role code for staff (e.g., "TL", "CSA")
+
+    @property
+    def certification_mask(self) -> int:
+        """Bitmask of the staff certification ids (see CertificationMask)."""
+        return CertificationMask.encode(tuple(self.certifications))
     
     def is_available_for_service(self, service_intervals: List[Tuple[int, int]]) -> bool:
         """
@@ -31,14 +36,11 @@ class Staff(BaseModel):
         """
         Checks if the staff meets the certification requirements to perform the given service.
         """
-        required = set(service.certifications)
-        staff_certs = set(self.certifications)
-
         if service.certification_requirement == CertificationRequirement.ALL:
-            return required.issubset(staff_certs)
+            return CertificationMask.has_all(self.certification_mask, service.certification_mask)
 
         elif service.certification_requirement == CertificationRequirement.ANY:
-            return bool(required & staff_certs)  # At least one in common
+            return CertificationMask.has_any(self.certification_mask, service.certification_mask)  # At least one in common
 
         return False  # Fallback if service requirement is unknown
     
@@ -59,6 +61,20 @@ class Staff(BaseModel):
         
         return True
 
+    def has_priority_role_for_service(self, service_assignment: ServiceAssignment) -> bool:
+        """
+        Checks if the staff role_code matches one of the priority roles of the service assignment.
+        If the service assignment has no priority roles, any staff role is acceptable.
+        """
+        if not service_assignment.priority_roles:
+            return True
+
+        # If priority roles are specified, staff must have a role_code
+        if self.role_code is None:
+            return False
+
+        return any(self.role_code in role_codes for role_codes in service_assignment.priority_roles)
+
     def can_perform_service(self, service: Service, service_intervals: List[Tuple[int, int]], service_assignment: ServiceAssignment) -> bool:
         """
         Checks if the staff can perform a given service based on availability, certification and eligibility.
@@ -1,6 +1,14 @@
 from .allocation_plan import AllocationPlan
 from .schedule_entry import ScheduleEntry
+from .plan_table import PlanTable
+from .staff_interval_index import StaffIntervalIndex
+from .plan_csr import PlanCsr
+from .plan_record import PlanRecord, PlanRecordKind
+from .plan_codec import PlanCodec
+from .plan_diff import PlanDiff
+from .plan_journal import PlanJournal
 
 __all__ = [
-    'AllocationPlan', 'ScheduleEntry'
+    'AllocationPlan', 'PlanTable', 'ScheduleEntry', 'StaffIntervalIndex',
+    'PlanCsr', 'PlanRecord', 'PlanRecordKind', 'PlanCodec', 'PlanDiff', 'PlanJournal',
 ]
\ No newline at end of file
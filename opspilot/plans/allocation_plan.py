@@ -1,7 +1,16 @@
 import json
-from typing import Dict, List, Set
+from datetime import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
 from opspilot.models import ServiceAssignment, Staff, Flight, Service, Location
 from .schedule_entry import ScheduleEntry
+from .plan_table import PlanTable
+from .staff_interval_index import StaffIntervalIndex
+from .plan_codec import PlanCodec
+from .plan_csr import PlanCsr
+from .plan_journal import PlanJournal
+from .plan_record import PlanRecordKind
+from .plan_diff import PlanDiff
 from collections import defaultdict
 
 class AllocationPlan:
@@ -27,6 +36,18 @@ class AllocationPlan:
         # Build reverse mapping for flight-based lookups
         self._flight_to_assignments = self._build_flight_assignments_map()
 
+        # staff_id -> service assignment ids, and the allocated intervals by time (all staff and per staff)
+        self._staff_to_assignments: Dict[int, Set[int]] = {}
+        self._time_index = StaffIntervalIndex()
+
+        # Resolved table and schedule views, cached until the allocations change
+        self._table: Optional[PlanTable] = None
+        self._views: Dict[str, dict] = {}
+
+    def _allocations_changed(self) -> None:
+        self._table = None
+        self._views = {}
+
     def _build_flight_assignments_map(self) -> Dict[str, Set[int]]:
         """Create a mapping from flight numbers to service assignment IDs"""
         flight_assignments = defaultdict(set)
@@ -52,8 +73,51 @@ class AllocationPlan:
         self.allocations = {
             int(k): set(v) for k, v in json.loads(json_string).items()
         }
-        # Rebuild flight assignments map after deserialization
+        self._allocations_changed()
+        # Rebuild flight assignments map and staff indexes after deserialization
+        self._flight_to_assignments = self._build_flight_assignments_map()
+        self._rebuild_staff_indexes()
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the allocation plan to the compact binary plan format (a PlanCodec snapshot record).
+        """
+        return PlanCodec.encode_snapshot(PlanCsr.from_allocations(self.allocations))
+
+    def from_bytes(self, buffer: bytes) -> None:
+        """
+        Deserialize from the binary plan format, taking the last snapshot of the buffer.
+        """
+        snapshots = [record for record in PlanCodec.records(buffer) if record.kind == PlanRecordKind.SNAPSHOT]
+        if not snapshots:
+            raise ValueError("No plan snapshot in buffer")
+        self.load_csr(snapshots[-1].allocations)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the allocation plan to a file in the binary plan format.
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    def load(self, path: Union[str, Path], use_mmap: bool = True) -> None:
+        """
+        Read the allocation plan from a file in the binary plan format (or a plan journal, taking its
+        last snapshot without the diffs after it; see PlanJournal.replay).
+        """
+        snapshots = [record for record in PlanJournal(path).records(use_mmap) if record.kind == PlanRecordKind.SNAPSHOT]
+        if not snapshots:
+            raise ValueError(f"No plan snapshot in {path}")
+        self.load_csr(snapshots[-1].allocations)
+
+    def load_csr(self, allocations: PlanCsr) -> None:
+        """
+        Replace the allocations with the ones of a CSR table.
+        """
+        self.allocations = allocations.to_allocations()
+        self._allocations_changed()
         self._flight_to_assignments = self._build_flight_assignments_map()
+        self._rebuild_staff_indexes()
 
     def add_allocation(self, service_assignment_id: int, staff_id: int) -> None:
         """
@@ -61,7 +125,12 @@ class AllocationPlan:
         """
         if service_assignment_id not in self.allocations:
             self.allocations[service_assignment_id] = set()
+        if staff_id in self.allocations[service_assignment_id]:
+            return
+
         self.allocations[service_assignment_id].add(staff_id)
+        self._index_allocation(service_assignment_id, staff_id)
+        self._allocations_changed()
 
     def get_allocation(self, service_assignment_id: int, staff_id: int) -> bool:
         """
@@ -77,23 +146,16 @@ class AllocationPlan:
             self.allocations[service_assignment_id].discard(staff_id)
             if not self.allocations[service_assignment_id]:
                 del self.allocations[service_assignment_id]
+            self._unindex_allocation(service_assignment_id, staff_id)
+            self._allocations_changed()
 
     def remove_staff(self, staff_id: int) -> None:
         """
         Remove all allocations for a specific staff member across all service assignments.
-        More efficient implementation that scans all assignments once.
+        Only visits the service assignments of the staff member (staff index).
         """
-        service_assignments_to_clean = []
-        
-        for sa_id, staff_ids in self.allocations.items():
-            if staff_id in staff_ids:
-                staff_ids.discard(staff_id)
-                if not staff_ids:
-                    service_assignments_to_clean.append(sa_id)
-        
-        # Clean up empty service assignments
-        for sa_id in service_assignments_to_clean:
-            del self.allocations[sa_id]
+        for sa_id in list(self._staff_to_assignments.get(staff_id, ())):
+            self.remove_allocation(sa_id, staff_id)
 
     def remove_flight(self, flight_number: str) -> None:
         """
@@ -105,125 +167,152 @@ class AllocationPlan:
             
         for sa_id in self._flight_to_assignments[flight_number]:
             if sa_id in self.allocations:
+                for staff_id in self.allocations[sa_id]:
+                    self._unindex_allocation(sa_id, staff_id)
                 del self.allocations[sa_id]
         
         # Remove from flight mapping as well
         del self._flight_to_assignments[flight_number]
+        self._allocations_changed()
 
-    def _format_minutes_to_time_str(self, minutes: int) -> str:
-        """Convert minutes since midnight into HH:MM format."""
-        hours, mins = divmod(minutes, 60)
-        hours = hours % 24  # Handle wraparound over 24h
-        return f"{hours:02}:{mins:02}"
-
-    def staff_schedule(self) -> Dict[int, List[ScheduleEntry]]:
-        schedule = defaultdict(list)
-
+    def diff(self, other: 'AllocationPlan') -> PlanDiff:
+        """
+        Changes turning this plan into `other`. One set comparison per service assignment; only the
+        service assignments whose staff differ are visited further.
+        """
+        added, removed = {}, {}
         for sa_id, staff_ids in self.allocations.items():
-            sa = self.service_assignment_map[sa_id]
-            service = self.service_map[sa.service_id]
-            location = self.location_map[sa.location_id]
-
-            if sa.flight_number:
-                flight = self.flight_map[sa.flight_number]
-                start_min, end_min = flight.get_service_time_minutes(sa.relative_start, sa.relative_end)
-            else:
-                start_min = sa.start_time.hour * 60 + sa.start_time.minute
-                end_min = sa.end_time.hour * 60 + sa.end_time.minute
-
-            for staff_id in staff_ids:
-                staff = self.staff_map[staff_id]
-
-                entry = ScheduleEntry(
-                    service_assignment_id=sa_id,
-                    staff_id=staff_id,
-                    staff_name=staff.name,
-                    service_name=service.name,
-                    start_time=self._format_minutes_to_time_str(start_min),
-                    end_time=self._format_minutes_to_time_str(end_min),
-                    flight_number=sa.flight_number,
-                    location=location.name,
-                    flight_priority=int(sa.priority),
-                    service_priority=int((sa.priority * 10) % 10) if sa.flight_number else int(sa.priority),
-                )
-
-                schedule[staff_id].append(entry)
+            other_staff_ids = other.allocations.get(sa_id)
+            if other_staff_ids is None:
+                removed[sa_id] = staff_ids
+            elif staff_ids != other_staff_ids:
+                removed[sa_id] = staff_ids - other_staff_ids
+                added[sa_id] = other_staff_ids - staff_ids
 
-        for entries in schedule.values():
-            entries.sort(key=lambda x: x.start_min)
+        for sa_id in other.allocations.keys() - self.allocations.keys():
+            added[sa_id] = other.allocations[sa_id]
 
-        return schedule
-
-    def flight_zone_services_schedule(self) -> Dict[str, List[ScheduleEntry]]:
-        schedule = defaultdict(list)
-
-        for sa_id, staff_ids in self.allocations.items():
-            sa = self.service_assignment_map[sa_id]
-            if not sa.flight_number:
-                continue
-
-            flight = self.flight_map[sa.flight_number]
-            service = self.service_map[sa.service_id]
-            location = self.location_map[sa.location_id]
-            start_min, end_min = flight.get_service_time_minutes(sa.relative_start, sa.relative_end)
+        return PlanDiff(added=added, removed=removed)
 
+    def patch(self, diff: PlanDiff) -> None:
+        """
+        Apply a diff in place through the staff and time indexes, in time proportional to the changes.
+        Raises ValueError (leaving the plan unchanged) if the diff does not apply to this plan: a removed
+        allocation is missing or an added one already exists.
+        """
+        for sa_id, staff_ids in diff.removed.items():
+            missing = staff_ids - self.allocations.get(sa_id, set())
+            if missing:
+                raise ValueError(f"Cannot remove staff {sorted(missing)} from service assignment {sa_id}: not allocated")
+        for sa_id, staff_ids in diff.added.items():
+            existing = staff_ids & self.allocations.get(sa_id, set()) - diff.removed.get(sa_id, set())
+            if existing:
+                raise ValueError(f"Cannot add staff {sorted(existing)} to service assignment {sa_id}: already allocated")
+
+        for sa_id, staff_ids in diff.removed.items():
             for staff_id in staff_ids:
-                staff = self.staff_map[staff_id]
-
-                entry = ScheduleEntry(
-                    service_assignment_id=sa_id,
-                    staff_id=staff_id,
-                    staff_name=staff.name,
-                    service_name=service.name,
-                    start_time=self._format_minutes_to_time_str(start_min),
-                    end_time=self._format_minutes_to_time_str(end_min),
-                    flight_number=sa.flight_number,
-                    location=location.name,
-                    flight_priority=int(sa.priority),
-                    service_priority=int((sa.priority * 10) % 10),
-                )
-
-                schedule[sa.flight_number].append(entry)
+                self.remove_allocation(sa_id, staff_id)
+        for sa_id, staff_ids in diff.added.items():
+            for staff_id in staff_ids:
+                self.add_allocation(sa_id, staff_id)
 
-        for entries in schedule.values():
-            entries.sort(key=lambda x: x.start_min)
+    def _index_allocation(self, service_assignment_id: int, staff_id: int) -> None:
+        self._staff_to_assignments.setdefault(staff_id, set()).add(service_assignment_id)
+        self._time_index.add(staff_id, service_assignment_id, self._minute_intervals(service_assignment_id))
 
-        return schedule
+    def _unindex_allocation(self, service_assignment_id: int, staff_id: int) -> None:
+        assigned = self._staff_to_assignments.get(staff_id)
+        if assigned is not None:
+            assigned.discard(service_assignment_id)
+            if not assigned:
+                del self._staff_to_assignments[staff_id]
 
-    def common_zone_services_schedule(self) -> Dict[int, List[ScheduleEntry]]:
-        schedule = defaultdict(list)
+        self._time_index.remove(staff_id, service_assignment_id)
 
+    def _rebuild_staff_indexes(self) -> None:
+        """Index every allocation at once, resolving the intervals once per service assignment."""
+        self._staff_to_assignments = {}
+        allocated = []
         for sa_id, staff_ids in self.allocations.items():
-            sa = self.service_assignment_map[sa_id]
-            if sa.flight_number:
-                continue
+            intervals = self._minute_intervals(sa_id)
+            for staff_id in staff_ids:
+                self._staff_to_assignments.setdefault(staff_id, set()).add(sa_id)
+                allocated.append((staff_id, sa_id, intervals))
 
-            service = self.service_map[sa.service_id]
-            location = self.location_map[sa.location_id]
-            start_min = sa.start_time.hour * 60 + sa.start_time.minute
-            end_min = sa.end_time.hour * 60 + sa.end_time.minute
+        self._time_index.rebuild(allocated)
 
-            for staff_id in staff_ids:
-                staff = self.staff_map[staff_id]
+    def _minute_intervals(self, service_assignment_id: int) -> List[Tuple[int, int]]:
+        sa = self.service_assignment_map.get(service_assignment_id)
+        return sa.minute_intervals(self.flight_map) if sa is not None else []
 
-                entry = ScheduleEntry(
-                    service_assignment_id=sa_id,
-                    staff_id=staff_id,
-                    staff_name=staff.name,
-                    service_name=service.name,
-                    start_time=self._format_minutes_to_time_str(start_min),
-                    end_time=self._format_minutes_to_time_str(end_min),
-                    flight_number=None,
-                    location=location.name,
-                    flight_priority=None,
-                    service_priority=int(sa.priority),
-                )
+    def staff_assignments(self, staff_id: int) -> Set[int]:
+        """Service assignment ids allocated to the staff member."""
+        return set(self._staff_to_assignments.get(staff_id, ()))
 
-                schedule[sa_id].append(entry)
+    def staff_intervals(self, staff_id: int) -> List[Tuple[int, int, int]]:
+        """(start, end, service_assignment_id) of the staff member in minutes of the day, sorted by start."""
+        return self._time_index.staff_intervals(staff_id)
 
-        for entries in schedule.values():
-            entries.sort(key=lambda x: x.start_min)
+    def staff_activity(self, staff_id: int, start: Union[int, time], end: Union[int, time]) -> List[int]:
+        """
+        Service assignment ids the staff member works on in the window [start, end), in start order.
+        Times are minutes of the day or times; a window ending before it starts crosses midnight.
+        """
+        sa_ids = []
+        for _, _, sa_id in self._time_index.staff_overlapping(staff_id, self._minutes(start), self._minutes(end)):
+            if sa_id not in sa_ids:
+                sa_ids.append(sa_id)
+        return sa_ids
+
+    def busy_staff(self, start: Union[int, time], end: Union[int, time]) -> Set[int]:
+        """Staff ids with an allocation overlapping the window [start, end) (see StaffIntervalIndex)."""
+        return {staff_id for _, _, staff_id, _ in self._time_index.overlapping(self._minutes(start), self._minutes(end))}
+
+    def free_staff(self, start: Union[int, time], end: Union[int, time]) -> Set[int]:
+        """Staff ids of the staff map without any allocation overlapping the window [start, end)."""
+        return set(self.staff_map) - self.busy_staff(start, end)
+
+    @staticmethod
+    def _minutes(value: Union[int, time]) -> int:
+        if isinstance(value, time):
+            return value.hour * 60 + value.minute
+        return value
+
+    def table(self) -> PlanTable:
+        """Every allocation resolved once into a columnar table, shared by the schedule views."""
+        if self._table is None:
+            self._table = PlanTable(
+                allocations=self.allocations,
+                service_assignment_map=self.service_assignment_map,
+                service_map=self.service_map,
+                staff_map=self.staff_map,
+                flight_map=self.flight_map,
+                location_map=self.location_map,
+            )
+        return self._table
+
+    def _view(self, name: str, key, entry=None) -> dict:
+        if name not in self._views:
+            self._views[name] = self.table().group_by(key, entry)
+        # Fresh lists so callers can add, remove or reorder entries without affecting the cache;
+        # the entries themselves are shared with the cache and must not be modified
+        return defaultdict(list, {group: list(entries) for group, entries in self._views[name].items()})
 
-        return schedule
+    def staff_schedule(self) -> Dict[int, List[ScheduleEntry]]:
+        """Entries per staff id, sorted by start time."""
+        table = self.table()
+        return self._view("staff", lambda row: int(table.staff_ids[row]))
 
+    def flight_zone_services_schedule(self) -> Dict[str, List[ScheduleEntry]]:
+        """Entries of flight zone services per flight number, sorted by start time."""
+        table = self.table()
+        return self._view("flight_zone", lambda row: table.flight_numbers[row])
 
+    def common_zone_services_schedule(self) -> Dict[int, List[ScheduleEntry]]:
+        """Entries of common zone services per service assignment id, sorted by start time."""
+        table = self.table()
+        return self._view(
+            "common_zone",
+            lambda row: None if table.flight_numbers[row] else int(table.service_assignment_ids[row]),
+            table.common_zone_entry
+        )
@@ -0,0 +1,135 @@
+from typing import Iterator, List, Tuple, Union
+from .plan_csr import PlanCsr
+from .plan_record import PlanRecord, PlanRecordKind
+import mmap
+import struct
+import numpy as np
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+class PlanCodec:
+    """
+    Versioned binary format of allocation plans: a sequence of records, each a fixed header
+    (magic, version, kind, payload size) followed by its payload, so records can be appended to a
+    journal and read back one after another.
+
+    A snapshot payload is one CSR block of the allocations; a diff payload is two, the added and the
+    removed allocations. A CSR block stores the sorted service assignment ids, the staff count of each
+    of them and the sorted staff ids of each of them. Ids are delta-encoded (service assignment ids
+    against the previous one, staff ids against the previous one in the same row) and every array is
+    stored with the smallest unsigned dtype holding its values (int64 if one is negative). Arrays
+    are 8-byte aligned, so `decode` reads them in place from the buffer (e.g. a memory-mapped file)
+    with np.frombuffer; only the delta decoding allocates.
+    """
+
+    MAGIC = b"OPPL"
+    VERSION = 1
+
+    _RECORD_HEADER = struct.Struct("<4sHHQ")    # magic, version, kind, payload size
+    _BLOCK_HEADER = struct.Struct("<QQBBB5x")   # rows, values, dtype codes of rows, counts and values
+    _DTYPES = [np.dtype("<u1"), np.dtype("<u2"), np.dtype("<u4"), np.dtype("<u8"), np.dtype("<i8")]
+
+    @classmethod
+    def encode_snapshot(cls, allocations: PlanCsr) -> bytes:
+        return cls._record(PlanRecordKind.SNAPSHOT, [allocations])
+
+    @classmethod
+    def encode_diff(cls, added: PlanCsr, removed: PlanCsr) -> bytes:
+        return cls._record(PlanRecordKind.DIFF, [added, removed])
+
+    @classmethod
+    def decode(cls, buffer: Buffer) -> List[PlanRecord]:
+        """Every record of the buffer, in order."""
+        return list(cls.records(buffer))
+
+    @classmethod
+    def records(cls, buffer: Buffer) -> Iterator[PlanRecord]:
+        position = 0
+        while position < len(buffer):
+            if len(buffer) - position < cls._RECORD_HEADER.size:
+                raise ValueError(f"Truncated plan record header at byte {position}")
+
+            magic, version, kind, size = cls._RECORD_HEADER.unpack_from(buffer, position)
+            if magic != cls.MAGIC:
+                raise ValueError(f"Not a plan record at byte {position}")
+            if version != cls.VERSION:
+                raise ValueError(f"Unsupported plan format version {version} (expected {cls.VERSION})")
+
+            position += cls._RECORD_HEADER.size
+            end = position + size
+            if end > len(buffer):
+                raise ValueError(f"Truncated plan record at byte {position}")
+
+            kind = PlanRecordKind(kind)
+            if kind == PlanRecordKind.SNAPSHOT:
+                allocations, position = cls._read_block(buffer, position)
+                yield PlanRecord(kind, allocations=allocations)
+            else:
+                added, position = cls._read_block(buffer, position)
+                removed, position = cls._read_block(buffer, position)
+                yield PlanRecord(kind, added=added, removed=removed)
+
+            position = end
+
+    @classmethod
+    def _record(cls, kind: PlanRecordKind, blocks: List[PlanCsr]) -> bytes:
+        payload = b"".join(cls._block(block) for block in blocks)
+        return cls._RECORD_HEADER.pack(cls.MAGIC, cls.VERSION, kind, len(payload)) + payload
+
+    @classmethod
+    def _block(cls, csr: PlanCsr) -> bytes:
+        counts = csr.counts()
+        row_deltas = np.diff(csr.service_assignment_ids, prepend=0)
+
+        # Staff ids against the previous staff id of the row; the first one of each row is kept as is
+        value_deltas = np.diff(csr.staff_ids, prepend=0)
+        row_starts = csr.offsets[:-1][counts > 0]
+        value_deltas[row_starts] = csr.staff_ids[row_starts]
+
+        arrays = [cls._narrow(row_deltas), cls._narrow(counts), cls._narrow(value_deltas)]
+        header = cls._BLOCK_HEADER.pack(
+            len(csr.service_assignment_ids), len(csr.staff_ids),
+            *(cls._DTYPES.index(array.dtype) for array in arrays)
+        )
+        return header + b"".join(cls._padded(array.tobytes()) for array in arrays)
+
+    @classmethod
+    def _read_block(cls, buffer: Buffer, position: int) -> Tuple[PlanCsr, int]:
+        rows, values, row_code, count_code, value_code = cls._BLOCK_HEADER.unpack_from(buffer, position)
+        position += cls._BLOCK_HEADER.size
+
+        row_deltas, position = cls._read_array(buffer, position, cls._DTYPES[row_code], rows)
+        counts, position = cls._read_array(buffer, position, cls._DTYPES[count_code], rows)
+        value_deltas, position = cls._read_array(buffer, position, cls._DTYPES[value_code], values)
+
+        offsets = np.zeros(rows + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        # Running sum of the deltas, minus the running sum before the start of each row
+        running = np.zeros(values + 1, dtype=np.int64)
+        np.cumsum(value_deltas, out=running[1:])
+        staff_ids = running[1:] - np.repeat(running[offsets[:-1]], counts)
+
+        return PlanCsr(np.cumsum(row_deltas, dtype=np.int64), offsets, staff_ids), position
+
+    @classmethod
+    def _read_array(cls, buffer: Buffer, position: int, dtype: np.dtype, count: int) -> Tuple[np.ndarray, int]:
+        array = np.frombuffer(buffer, dtype=dtype, count=count, offset=position)
+        return array, position + cls._padded_size(dtype.itemsize * count)
+
+    @classmethod
+    def _narrow(cls, values: np.ndarray) -> np.ndarray:
+        if len(values) and values.min() < 0:
+            return values.astype(cls._DTYPES[-1])
+        largest = int(values.max()) if len(values) else 0
+        for dtype in cls._DTYPES[:-1]:
+            if largest <= np.iinfo(dtype).max:
+                return values.astype(dtype)
+
+    @classmethod
+    def _padded(cls, data: bytes) -> bytes:
+        return data + b"\0" * (cls._padded_size(len(data)) - len(data))
+
+    @staticmethod
+    def _padded_size(size: int) -> int:
+        return (size + 7) // 8 * 8
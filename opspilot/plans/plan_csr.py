@@ -0,0 +1,44 @@
+from typing import Dict, Iterable, Set
+import numpy as np
+
+class PlanCsr:
+    """
+    Allocations {service_assignment_id: staff_ids} in a CSR layout: sorted `service_assignment_ids`,
+    `offsets` into `staff_ids` (row k is staff_ids[offsets[k]:offsets[k + 1]]) and the staff ids of
+    each row, sorted. All arrays are int64.
+    """
+
+    def __init__(self, service_assignment_ids: np.ndarray, offsets: np.ndarray, staff_ids: np.ndarray):
+        self.service_assignment_ids = service_assignment_ids
+        self.offsets = offsets
+        self.staff_ids = staff_ids
+
+    @classmethod
+    def from_allocations(cls, allocations: Dict[int, Iterable[int]]) -> 'PlanCsr':
+        service_assignment_ids = sorted(allocations)
+        offsets, staff_ids = [0], []
+        for sa_id in service_assignment_ids:
+            staff_ids.extend(sorted(allocations[sa_id]))
+            offsets.append(len(staff_ids))
+
+        return cls(
+            np.array(service_assignment_ids, dtype=np.int64),
+            np.array(offsets, dtype=np.int64),
+            np.array(staff_ids, dtype=np.int64),
+        )
+
+    def to_allocations(self) -> Dict[int, Set[int]]:
+        staff_ids = self.staff_ids.tolist()
+        offsets = self.offsets.tolist()
+        return {
+            sa_id: set(staff_ids[offsets[k]:offsets[k + 1]])
+            for k, sa_id in enumerate(self.service_assignment_ids.tolist())
+        }
+
+    def counts(self) -> np.ndarray:
+        """Number of staff per row."""
+        return np.diff(self.offsets)
+
+    def __len__(self) -> int:
+        """Number of (service assignment, staff) allocations."""
+        return len(self.staff_ids)
@@ -0,0 +1,70 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from opspilot.models import ServiceAssignment
+
+class PlanDiff:
+    """
+    Changes between two allocation plans: the allocations {service_assignment_id: staff_ids} `added`
+    and `removed`. A service assignment that loses a staff member and gains another one has been
+    moved between them (`moved`).
+
+    Built by AllocationPlan.diff and applied by AllocationPlan.patch; the groupings only visit the
+    changed allocations.
+    """
+
+    def __init__(self, added: Optional[Dict[int, Iterable[int]]] = None, removed: Optional[Dict[int, Iterable[int]]] = None):
+        self.added: Dict[int, Set[int]] = {sa_id: set(staff_ids) for sa_id, staff_ids in (added or {}).items() if staff_ids}
+        self.removed: Dict[int, Set[int]] = {sa_id: set(staff_ids) for sa_id, staff_ids in (removed or {}).items() if staff_ids}
+
+    def __len__(self) -> int:
+        """Number of allocations added or removed."""
+        return sum(map(len, self.added.values())) + sum(map(len, self.removed.values()))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PlanDiff) and self.added == other.added and self.removed == other.removed
+
+    def is_empty(self) -> bool:
+        return not self.added and not self.removed
+
+    def inverse(self) -> 'PlanDiff':
+        """The diff undoing this one."""
+        return PlanDiff(added=self.removed, removed=self.added)
+
+    def moved(self) -> List[Tuple[int, int, int]]:
+        """
+        (staff_id, from_service_assignment_id, to_service_assignment_id) of the staff members that were
+        removed from a service assignment and added to another one, by staff id.
+
+        For each staff member, the service assignments they were removed from and the ones they were
+        added to are paired in ascending id order; the unpaired ones are plain removals or additions.
+        """
+        moves = []
+        for staff_id, diff in self.per_staff().items():
+            moves.extend((staff_id, from_id, to_id) for from_id, to_id in zip(sorted(diff.removed), sorted(diff.added)))
+        return moves
+
+    def per_staff(self) -> Dict[int, 'PlanDiff']:
+        """The changes of each staff member."""
+        added, removed = defaultdict(dict), defaultdict(dict)
+        for changes, grouped in ((self.added, added), (self.removed, removed)):
+            for sa_id, staff_ids in changes.items():
+                for staff_id in staff_ids:
+                    grouped[staff_id][sa_id] = [staff_id]
+
+        return {
+            staff_id: PlanDiff(added=added.get(staff_id), removed=removed.get(staff_id))
+            for staff_id in sorted(added.keys() | removed.keys())
+        }
+
+    def per_flight(self, service_assignment_map: Dict[int, ServiceAssignment]) -> Dict[Optional[str], 'PlanDiff']:
+        """The changes of each flight; changes of common zone services are under None."""
+        added, removed = defaultdict(dict), defaultdict(dict)
+        for changes, grouped in ((self.added, added), (self.removed, removed)):
+            for sa_id, staff_ids in changes.items():
+                sa = service_assignment_map.get(sa_id)
+                grouped[sa.flight_number if sa else None][sa_id] = staff_ids
+
+        return {
+            flight_number: PlanDiff(added=added.get(flight_number), removed=removed.get(flight_number))
+            for flight_number in added.keys() | removed.keys()
+        }
@@ -0,0 +1,52 @@
+from pathlib import Path
+from typing import List, Union, TYPE_CHECKING
+from .plan_codec import PlanCodec
+from .plan_csr import PlanCsr
+from .plan_diff import PlanDiff
+from .plan_record import PlanRecord, PlanRecordKind
+import mmap
+
+if TYPE_CHECKING:
+    from .allocation_plan import AllocationPlan
+
+class PlanJournal:
+    """
+    Append-only journal of plan snapshots and diffs in the binary plan format (see PlanCodec), e.g. a
+    snapshot after each solve followed by the diffs of the manual changes, for audit and replay.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def append_snapshot(self, plan: 'AllocationPlan') -> None:
+        self._append(PlanCodec.encode_snapshot(PlanCsr.from_allocations(plan.allocations)))
+
+    def append_diff(self, diff: PlanDiff) -> None:
+        """Record the allocations added to and removed from the plan since the previous record."""
+        self._append(PlanCodec.encode_diff(PlanCsr.from_allocations(diff.added), PlanCsr.from_allocations(diff.removed)))
+
+    def records(self, use_mmap: bool = True) -> List[PlanRecord]:
+        """Every record of the journal, read from a memory map of the file unless `use_mmap` is False."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return []
+
+        with open(self.path, "rb") as file:
+            if not use_mmap:
+                return PlanCodec.decode(file.read())
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return PlanCodec.decode(buffer)
+
+    def replay(self, plan: 'AllocationPlan', use_mmap: bool = True) -> None:
+        """Set the plan to the last snapshot of the journal with the diffs recorded after it applied."""
+        records = self.records(use_mmap)
+        snapshots = [k for k, record in enumerate(records) if record.kind == PlanRecordKind.SNAPSHOT]
+        if not snapshots:
+            raise ValueError(f"No snapshot in plan journal {self.path}")
+
+        plan.load_csr(records[snapshots[-1]].allocations)
+        for record in records[snapshots[-1] + 1:]:
+            plan.patch(PlanDiff(added=record.added.to_allocations(), removed=record.removed.to_allocations()))
+
+    def _append(self, record: bytes) -> None:
+        with open(self.path, "ab") as file:
+            file.write(record)
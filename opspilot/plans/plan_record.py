@@ -0,0 +1,25 @@
+from enum import IntEnum
+from typing import Optional
+from .plan_csr import PlanCsr
+
+class PlanRecordKind(IntEnum):
+    SNAPSHOT = 0  # The whole plan
+    DIFF = 1      # Allocations added to and removed from the plan of the previous records
+
+class PlanRecord:
+    """
+    One record of the binary plan format: a snapshot carries `allocations`, a diff carries the
+    `added` and `removed` allocations.
+    """
+
+    def __init__(
+        self,
+        kind: PlanRecordKind,
+        allocations: Optional[PlanCsr] = None,
+        added: Optional[PlanCsr] = None,
+        removed: Optional[PlanCsr] = None,
+    ):
+        self.kind = kind
+        self.allocations = allocations
+        self.added = added
+        self.removed = removed
@@ -0,0 +1,124 @@
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, List, Optional, Set
+from opspilot.models import ServiceAssignment, Staff, Flight, Service, Location
+from .schedule_entry import ScheduleEntry
+import numpy as np
+
+class PlanTable:
+    """
+    Columnar table of the allocations of a plan: one row per (service assignment, staff) allocation,
+    with every service assignment resolved once (times, service, location, priorities) and shared
+    by its rows. Times are integer minutes since midnight (flight zone services crossing midnight go
+    beyond 1440), so views sort on ints (the minute of the day, as the formatted times read) instead
+    of parsing formatted times.
+
+    ScheduleEntry objects are only built for the rows a view asks for, once per row (and once more for
+    common zone rows in the common zone view, which shows them without a flight priority). Views share
+    the entries, so they must not be modified.
+    """
+
+    def __init__(
+        self,
+        allocations: Dict[int, Set[int]],
+        service_assignment_map: Dict[int, ServiceAssignment],
+        service_map: Dict[int, Service],
+        staff_map: Dict[int, Staff],
+        flight_map: Dict[str, Flight],
+        location_map: Dict[int, Location],
+    ):
+        self.staff_map = staff_map
+
+        service_assignment_ids, staff_ids, starts, ends = [], [], [], []
+        self.flight_numbers: List[Optional[str]] = []
+        self._resolved: List[dict] = []  # Per row, the resolved fields of its service assignment (shared)
+
+        for sa_id, allocated in allocations.items():
+            sa = service_assignment_map[sa_id]
+
+            if sa.flight_number:
+                start_min, end_min = flight_map[sa.flight_number].get_service_time_minutes(sa.relative_start, sa.relative_end)
+            else:
+                start_min = sa.start_time.hour * 60 + sa.start_time.minute
+                end_min = sa.end_time.hour * 60 + sa.end_time.minute
+
+            resolved = dict(
+                service_assignment_id=sa_id,
+                service_name=service_map[sa.service_id].name,
+                start_time=self._format_minutes_to_time_str(start_min),
+                end_time=self._format_minutes_to_time_str(end_min),
+                flight_number=sa.flight_number,
+                location=location_map[sa.location_id].name,
+                flight_priority=int(sa.priority),
+                service_priority=int((sa.priority * 10) % 10) if sa.flight_number else int(sa.priority),
+            )
+
+            for staff_id in allocated:
+                service_assignment_ids.append(sa_id)
+                staff_ids.append(staff_id)
+                starts.append(start_min)
+                ends.append(end_min)
+                self.flight_numbers.append(sa.flight_number)
+                self._resolved.append(resolved)
+
+        self.service_assignment_ids = np.array(service_assignment_ids, dtype=np.int64)
+        self.staff_ids = np.array(staff_ids, dtype=np.int64)
+        self.start_minutes = np.array(starts, dtype=np.int32)
+        self.end_minutes = np.array(ends, dtype=np.int32)
+
+        # Rows in order of the start minute of the day (ties keep the allocation order)
+        self.order = np.argsort(self.start_minutes % (24 * 60), kind="stable")
+        self._entries: List[Optional[ScheduleEntry]] = [None] * len(staff_ids)
+        self._common_zone_entries: Dict[int, ScheduleEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._resolved)
+
+    def entry(self, row: int) -> ScheduleEntry:
+        entry = self._entries[row]
+        if entry is None:
+            staff_id = int(self.staff_ids[row])
+            entry = ScheduleEntry(
+                **self._resolved[row],
+                staff_id=staff_id,
+                staff_name=self.staff_map[staff_id].name,
+            )
+            self._entries[row] = entry
+        return entry
+
+    def common_zone_entry(self, row: int) -> ScheduleEntry:
+        """Entry of a common zone row as the common zone view shows it, without a flight priority."""
+        entry = self._common_zone_entries.get(row)
+        if entry is None:
+            entry = self.entry(row).model_copy(update={"flight_priority": None})
+            self._common_zone_entries[row] = entry
+        return entry
+
+    def group_by(
+        self,
+        key: Callable[[int], Optional[Hashable]],
+        entry: Optional[Callable[[int], ScheduleEntry]] = None
+    ) -> Dict[Hashable, List[ScheduleEntry]]:
+        """
+        Entries (entry(row), by default self.entry) grouped by key(row) and sorted by start time within
+        each group; rows with a None key are left out. Groups appear in the order of their first allocation.
+        """
+        entry = entry or self.entry
+        keys = [key(row) for row in range(len(self))]
+
+        schedule = defaultdict(list)
+        for group in keys:
+            if group is not None and group not in schedule:
+                schedule[group] = []
+
+        for row in self.order.tolist():
+            if keys[row] is not None:
+                schedule[keys[row]].append(entry(row))
+
+        return schedule
+
+    @staticmethod
+    def _format_minutes_to_time_str(minutes: int) -> str:
+        """Convert minutes since midnight into HH:MM format."""
+        hours, mins = divmod(minutes, 60)
+        hours = hours % 24  # Handle wraparound over 24h
+        return f"{hours:02}:{mins:02}"
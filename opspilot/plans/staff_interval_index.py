@@ -0,0 +1,181 @@
+from bisect import insort
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+from opspilot.utils import TimeRangeUtils
+
+DAY_MINUTES = 24 * 60
+
+class StaffIntervalIndex:
+    """
+    Index of the allocated intervals of a plan, over all staff and per staff, in minutes of the day:
+    intervals crossing midnight are split and intervals after midnight (e.g. 1450-1480 for a service
+    40 minutes after a 23:30 arrival) are folded back into 0-1440.
+
+    All staff are indexed in a segment tree over the minutes of the day. Each interval is stored in
+    the O(log 1440) nodes that exactly cover it (to find the intervals containing a minute) and in the
+    O(log 1440) nodes on the path to its start minute (to find the intervals starting in a range). An
+    interval overlaps a window [start, end) if it contains `start` or starts in (start, end), so a
+    query visits O(log 1440) nodes and only returns overlapping intervals, whatever their lengths:
+    O(log 1440 + k). Adding and removing an interval also visit O(log 1440) nodes.
+
+    Per staff, the intervals (a day of work) are kept in a list sorted by start. `rebuild` indexes a
+    whole plan at once: the start sets are merged bottom-up and the nodes of each distinct interval
+    are computed once for all the allocations sharing it.
+    """
+
+    _SIZE = 2048  # Leaves of the segment tree, a power of two >= the minutes of the day
+
+    def __init__(self):
+        # Node -> (start, end, staff_id, service_assignment_id) stored on it
+        self._covering: Dict[int, Set[Tuple[int, int, int, int]]] = defaultdict(set)
+        self._starting: Dict[int, Set[Tuple[int, int, int, int]]] = defaultdict(set)
+        self._staff_intervals: Dict[int, List[Tuple[int, int, int]]] = {}  # staff_id -> (start, end, service_assignment_id)
+        # Intervals indexed per allocation, so removing it does not depend on the current flight times
+        self._allocated: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+
+    def add(self, staff_id: int, service_assignment_id: int, intervals: Iterable[Tuple[int, int]]) -> None:
+        self.remove(staff_id, service_assignment_id)
+
+        day_intervals = [(start, end) for start, end in self._day_intervals(intervals) if end > start]
+        self._allocated[(staff_id, service_assignment_id)] = day_intervals
+        if not day_intervals:
+            return
+
+        staff_intervals = self._staff_intervals.setdefault(staff_id, [])
+        for start, end in day_intervals:
+            entry = (start, end, staff_id, service_assignment_id)
+            for node in self._cover_nodes(start, end):
+                self._covering[node].add(entry)
+            for node in self._path_nodes(start):
+                self._starting[node].add(entry)
+            insort(staff_intervals, (start, end, service_assignment_id))
+
+    def remove(self, staff_id: int, service_assignment_id: int) -> None:
+        day_intervals = self._allocated.pop((staff_id, service_assignment_id), None)
+        if not day_intervals:
+            return
+
+        staff_intervals = self._staff_intervals[staff_id]
+        for start, end in day_intervals:
+            entry = (start, end, staff_id, service_assignment_id)
+            for node in self._cover_nodes(start, end):
+                self._discard(self._covering, node, entry)
+            for node in self._path_nodes(start):
+                self._discard(self._starting, node, entry)
+            staff_intervals.remove((start, end, service_assignment_id))
+
+        if not staff_intervals:
+            del self._staff_intervals[staff_id]
+
+    def rebuild(self, allocations: Iterable[Tuple[int, int, Iterable[Tuple[int, int]]]]) -> None:
+        """Replace the index with the (staff_id, service_assignment_id, intervals) allocations."""
+        self.clear()
+
+        by_interval = defaultdict(list)  # (start, end) -> entries
+        for staff_id, service_assignment_id, intervals in allocations:
+            day_intervals = [(start, end) for start, end in self._day_intervals(intervals) if end > start]
+            self._allocated[(staff_id, service_assignment_id)] = day_intervals
+            if not day_intervals:
+                continue
+            staff_intervals = self._staff_intervals.setdefault(staff_id, [])
+            for start, end in day_intervals:
+                by_interval[(start, end)].append((start, end, staff_id, service_assignment_id))
+                staff_intervals.append((start, end, service_assignment_id))
+
+        for staff_intervals in self._staff_intervals.values():
+            staff_intervals.sort()
+
+        for (start, end), entries in by_interval.items():
+            for node in self._cover_nodes(start, end):
+                self._covering[node].update(entries)
+            self._starting[start + self._SIZE].update(entries)
+
+        # A node starts the intervals its two children start
+        for node in range(self._SIZE - 1, 0, -1):
+            left, right = self._starting.get(2 * node), self._starting.get(2 * node + 1)
+            if left or right:
+                self._starting[node] = (left or set()) | (right or set())
+
+    def clear(self) -> None:
+        self._covering = defaultdict(set)
+        self._starting = defaultdict(set)
+        self._staff_intervals = {}
+        self._allocated = {}
+
+    def staff_intervals(self, staff_id: int) -> List[Tuple[int, int, int]]:
+        """(start, end, service_assignment_id) of the staff member, sorted by start."""
+        return list(self._staff_intervals.get(staff_id, []))
+
+    def overlapping(self, start: int, end: int) -> Set[Tuple[int, int, int, int]]:
+        """(start, end, staff_id, service_assignment_id) of every interval overlapping the window."""
+        overlapping = set()
+        for window_start, window_end in TimeRangeUtils.to_minute_ranges_from_minutes(start, end):
+            if window_end <= window_start:
+                continue
+
+            # Intervals containing the first minute of the window
+            node = window_start + self._SIZE
+            while node >= 1:
+                overlapping |= self._covering.get(node, set())
+                node >>= 1
+
+            # Intervals starting after it, within the window
+            for node in self._cover_nodes(window_start + 1, window_end):
+                overlapping |= self._starting.get(node, set())
+
+        return overlapping
+
+    def staff_overlapping(self, staff_id: int, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+        """(start, end, service_assignment_id) of the staff member's intervals overlapping the window, by start."""
+        windows = TimeRangeUtils.to_minute_ranges_from_minutes(start, end)
+        for interval in self._staff_intervals.get(staff_id, []):
+            if any(interval[0] < window_end and interval[1] > window_start for window_start, window_end in windows):
+                yield interval
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _cover_nodes(start: int, end: int) -> Tuple[int, ...]:
+        """Nodes of the segment tree exactly covering the minutes [start, end)."""
+        nodes = []
+        low, high = start + StaffIntervalIndex._SIZE, end + StaffIntervalIndex._SIZE
+        while low < high:
+            if low & 1:
+                nodes.append(low)
+                low += 1
+            if high & 1:
+                high -= 1
+                nodes.append(high)
+            low >>= 1
+            high >>= 1
+        return tuple(nodes)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _path_nodes(minute: int) -> Tuple[int, ...]:
+        """Nodes of the segment tree from the leaf of the minute up to the root."""
+        nodes = []
+        node = minute + StaffIntervalIndex._SIZE
+        while node >= 1:
+            nodes.append(node)
+            node >>= 1
+        return tuple(nodes)
+
+    @staticmethod
+    def _day_intervals(intervals: Iterable[Tuple[int, int]]) -> Iterator[Tuple[int, int]]:
+        for start, end in intervals:
+            offset = (start // DAY_MINUTES) * DAY_MINUTES
+            start, end = start - offset, end - offset
+            if end > DAY_MINUTES:
+                yield start, DAY_MINUTES
+                yield 0, min(end - DAY_MINUTES, DAY_MINUTES)
+            else:
+                yield start, end
+
+    @staticmethod
+    def _discard(nodes: Dict[int, set], node: int, entry: tuple) -> None:
+        entries = nodes.get(node)
+        if entries is not None:
+            entries.discard(entry)
+            if not entries:
+                del nodes[node]
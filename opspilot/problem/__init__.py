@@ -0,0 +1,5 @@
+from .compiled_problem import CompiledProblem, SERVICE_TYPE_CODES, REQUIREMENT_CODES
+
+__all__ = [
+    'CompiledProblem', 'SERVICE_TYPE_CODES', 'REQUIREMENT_CODES'
+]
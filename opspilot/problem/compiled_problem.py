@@ -0,0 +1,189 @@
+from typing import Dict, List, Optional, Tuple
+from opspilot.models import Staff, Service, Flight, ServiceAssignment, ServiceType, CertificationRequirement
+from opspilot.utils import CapabilityMatrix, CertificationMask
+import numpy as np
+
+# Integer codes of the service types in task_type
+SERVICE_TYPE_CODES: Dict[ServiceType, int] = {
+    ServiceType.SINGLE: 0,
+    ServiceType.FIXED: 1,
+    ServiceType.MULTI_TASK: 2,
+}
+
+# Integer codes of the certification requirements in service_requirement
+REQUIREMENT_CODES: Dict[CertificationRequirement, int] = {
+    CertificationRequirement.ALL: 0,
+    CertificationRequirement.ANY: 1,
+}
+
+class CompiledProblem:
+    """
+    Immutable, array-backed view of the scheduling inputs, compiled once from the pydantic models so
+    constraints and strategies loop over ints instead of model attributes.
+
+    Staff are rows and service assignments ("tasks") are columns, in the order of the capability
+    matrix; `staff_index` and `task_index` map ids to positions. Per-task and per-staff attributes are
+    NumPy arrays; optional values are -1 when missing. Certifications are bitsets of uint64 words
+    (bit k of `certification_ids[k]`). Variable-length data is stored CSR-style as offsets + values:
+
+    - task intervals: `task_interval_offsets`, `task_interval_starts`, `task_interval_ends`
+    - excluded services of multi-task assignments: `task_exclude_offsets`, `task_exclude_services`
+    - feasible pairs (the capability matrix): `staff_task_offsets`/`staff_tasks` per staff and
+      `task_staff_offsets`/`task_staffs` per task, both sorted by position
+
+    `task_role_factor[j, r]` is the priority role factor of role code `role_codes[r]` on task j
+    (number of priority role lists minus the index of the first list containing the role, 1 otherwise).
+    """
+
+    def __init__(self, **arrays):
+        for name, value in arrays.items():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+            setattr(self, name, value)
+
+    @classmethod
+    def compile(
+        cls,
+        roster: List[Staff],
+        services: List[Service],
+        flights: List[Flight],
+        service_assignments: List[ServiceAssignment],
+        capability_matrix: CapabilityMatrix
+    ) -> 'CompiledProblem':
+        staff_map = {staff.id: staff for staff in roster}
+        service_assignment_map = {sa.id: sa for sa in service_assignments}
+        flight_map = {flight.number: flight for flight in flights}
+
+        staff_ids = list(capability_matrix.staff_ids)
+        task_ids = list(capability_matrix.service_assignment_ids)
+        staff_list = [staff_map[staff_id] for staff_id in staff_ids]
+        tasks = [service_assignment_map[sa_id] for sa_id in task_ids]
+
+        certification_bit = CertificationMask.bit_positions(
+            [staff.certifications for staff in roster],
+            [service.certifications for service in services]
+        )
+        certification_ids = list(certification_bit)
+
+        service_ids = [service.id for service in services]
+        service_index = {service_id: k for k, service_id in enumerate(service_ids)}
+
+        flight_numbers = sorted({sa.flight_number for sa in tasks if sa.flight_number})
+        flight_index = {number: k for k, number in enumerate(flight_numbers)}
+
+        role_codes = sorted(
+            {staff.role_code for staff in staff_list if staff.role_code}
+            | {role for sa in tasks for role_list in sa.priority_roles for role in role_list}
+        )
+        role_index = {role: k for k, role in enumerate(role_codes)}
+
+        # Tasks
+        interval_offsets, interval_starts, interval_ends = [0], [], []
+        exclude_offsets, exclude_services = [0], []
+        task_role_factor = np.ones((len(tasks), len(role_codes)), dtype=np.int32)
+
+        for j, sa in enumerate(tasks):
+            for start, end in sa.minute_intervals(flight_map):
+                interval_starts.append(start)
+                interval_ends.append(end)
+            interval_offsets.append(len(interval_starts))
+
+            exclude_services.extend(sa.exclude_services)
+            exclude_offsets.append(len(exclude_services))
+
+            # Earlier lists win, so fill from the last list to the first
+            for i in reversed(range(len(sa.priority_roles))):
+                for role in sa.priority_roles[i]:
+                    task_role_factor[j, role_index[role]] = len(sa.priority_roles) - i
+
+        # Feasible pairs, CSR by staff and by task
+        rows, cols = np.nonzero(capability_matrix.matrix)
+        staff_task_offsets = np.searchsorted(rows, np.arange(len(staff_ids) + 1)).astype(np.int64)
+        by_task = np.lexsort((rows, cols))
+        task_staff_offsets = np.searchsorted(cols[by_task], np.arange(len(task_ids) + 1)).astype(np.int64)
+
+        return cls(
+            staff_ids=np.array(staff_ids, dtype=np.int64),
+            staff_index={staff_id: i for i, staff_id in enumerate(staff_ids)},
+            staff_department=np.array([staff.department_id for staff in staff_list], dtype=np.int32),
+            staff_rank=np.array([staff.rank_level or 0 for staff in staff_list], dtype=np.int32),
+            staff_priority_service=np.array(
+                [staff.priority_service_id if staff.priority_service_id is not None else -1 for staff in staff_list],
+                dtype=np.int32
+            ),
+            staff_certification_count=np.array([len(staff.certifications) for staff in staff_list], dtype=np.int32),
+            staff_certifications=CertificationMask.bitsets([staff.certifications for staff in staff_list], certification_bit),
+            staff_role=np.array([role_index[staff.role_code] if staff.role_code else -1 for staff in staff_list], dtype=np.int32),
+
+            service_ids=np.array(service_ids, dtype=np.int64),
+            service_certifications=CertificationMask.bitsets([service.certifications for service in services], certification_bit),
+            service_requirement=np.array(
+                [REQUIREMENT_CODES[service.certification_requirement] for service in services], dtype=np.int8
+            ),
+
+            task_ids=np.array(task_ids, dtype=np.int64),
+            task_index={sa_id: j for j, sa_id in enumerate(task_ids)},
+            task_service=np.array([sa.service_id for sa in tasks], dtype=np.int32),
+            task_service_index=np.array([service_index[sa.service_id] for sa in tasks], dtype=np.int32),
+            task_type=np.array([SERVICE_TYPE_CODES[sa.service_type] for sa in tasks], dtype=np.int8),
+            task_staff_count=np.array([sa.staff_count for sa in tasks], dtype=np.int32),
+            task_priority=np.array([sa.priority for sa in tasks], dtype=np.float64),
+            task_priority_score=np.array([-int(sa.priority * 1000) for sa in tasks], dtype=np.int64),
+            task_department=np.array([sa.department_id for sa in tasks], dtype=np.int32),
+            task_location=np.array([sa.location_id for sa in tasks], dtype=np.int32),
+            task_flight=np.array([flight_index[sa.flight_number] if sa.flight_number else -1 for sa in tasks], dtype=np.int32),
+            task_multi_task_limit=np.array(
+                [sa.multi_task_limit if sa.multi_task_limit is not None else -1 for sa in tasks], dtype=np.int32
+            ),
+            task_interval_offsets=np.array(interval_offsets, dtype=np.int64),
+            task_interval_starts=np.array(interval_starts, dtype=np.int32),
+            task_interval_ends=np.array(interval_ends, dtype=np.int32),
+            task_exclude_offsets=np.array(exclude_offsets, dtype=np.int64),
+            task_exclude_services=np.array(exclude_services, dtype=np.int32),
+            task_role_factor=task_role_factor,
+
+            staff_task_offsets=staff_task_offsets,
+            staff_tasks=cols.astype(np.int32),
+            task_staff_offsets=task_staff_offsets,
+            task_staffs=rows[by_task].astype(np.int32),
+
+            certification_ids=certification_ids,
+            flight_numbers=flight_numbers,
+            role_codes=role_codes,
+        )
+
+    @property
+    def staff_count(self) -> int:
+        return len(self.staff_ids)
+
+    @property
+    def task_count(self) -> int:
+        return len(self.task_ids)
+
+    def tasks_of_staff(self, i: int) -> np.ndarray:
+        """Positions of the tasks staff i can perform."""
+        return self.staff_tasks[self.staff_task_offsets[i]:self.staff_task_offsets[i + 1]]
+
+    def staffs_of_task(self, j: int) -> np.ndarray:
+        """Positions of the staff able to perform task j."""
+        return self.task_staffs[self.task_staff_offsets[j]:self.task_staff_offsets[j + 1]]
+
+    def task_intervals(self, j: int) -> List[Tuple[int, int]]:
+        start, end = self.task_interval_offsets[j], self.task_interval_offsets[j + 1]
+        return list(zip(self.task_interval_starts[start:end].tolist(), self.task_interval_ends[start:end].tolist()))
+
+    def task_excludes(self, j: int) -> np.ndarray:
+        """Service ids task j cannot be multi-tasked with."""
+        return self.task_exclude_services[self.task_exclude_offsets[j]:self.task_exclude_offsets[j + 1]]
+
+    def pair_positions(self, keys) -> Tuple[np.ndarray, np.ndarray]:
+        """Staff and task positions of (staff_id, service_assignment_id) keys, e.g. of the assignment variables."""
+        staff_positions, task_positions = [], []
+        for staff_id, sa_id in keys:
+            staff_positions.append(self.staff_index[staff_id])
+            task_positions.append(self.task_index[sa_id])
+        return np.array(staff_positions, dtype=np.int64), np.array(task_positions, dtype=np.int64)
+
+    def flight_number(self, j: int) -> Optional[str]:
+        flight = self.task_flight[j]
+        return self.flight_numbers[flight] if flight >= 0 else None
@@ -1,5 +1,12 @@
 from .overlap_detection_service import OverlapDetectionService
+from .overlap_clique_service import OverlapCliqueService
+from .feasibility_service import FeasibilityService
+from .frozen_context_service import FrozenContextService
+from .component_service import ComponentService
+from .hint_repair_service import HintRepairService
+from .staff_equivalence_service import StaffEquivalenceService
 
 __all__ = [
-    'OverlapDetectionService',
-]
\ No newline at end of file
+    'OverlapDetectionService', 'OverlapCliqueService', 'FeasibilityService', 'FrozenContextService', 'ComponentService', 'HintRepairService',
+    'StaffEquivalenceService',
+]
@@ -0,0 +1,59 @@
+from typing import Dict, List, Tuple
+from opspilot.utils import CapabilityMatrix
+
+class ComponentService:
+    """
+    Splits a scheduling problem into independent parts: the connected components of the bipartite graph
+    of staff and service assignments with an edge for every feasible (staff, service assignment) pair.
+
+    Every constraint and objective term links the variables of a single staff member or of a single
+    service assignment, so no two components share one: each can be solved on its own and the objectives
+    add up to the objective of the whole problem. Overlapping service assignments only constrain staff
+    able to perform both, which already connects them. Components without staff or without service
+    assignments are left out as nothing can be assigned in them.
+
+    Attributes:
+        capability_matrix: Staff x service assignment capability (see FeasibilityService)
+    """
+
+    def __init__(self, capability_matrix: CapabilityMatrix):
+        self.capability_matrix = capability_matrix
+
+    def detect_components(self) -> List[Tuple[List[int], List[int]]]:
+        """Returns (staff_ids, service_assignment_ids) per component, largest first."""
+        staff_ids = self.capability_matrix.staff_ids
+        sa_ids = self.capability_matrix.service_assignment_ids
+
+        # Union-find over staff rows (0..n-1) followed by service assignment columns (n..n+m-1)
+        offset = len(staff_ids)
+        parent = list(range(offset + len(sa_ids)))
+
+        def find(node: int) -> int:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        def union(node_a: int, node_b: int) -> None:
+            root_a, root_b = find(node_a), find(node_b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+
+        rows, cols = self.capability_matrix.matrix.nonzero()
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            union(i, offset + j)
+
+        members: Dict[int, Tuple[List[int], List[int]]] = {}
+        for i, staff_id in enumerate(staff_ids):
+            members.setdefault(find(i), ([], []))[0].append(staff_id)
+        for j, sa_id in enumerate(sa_ids):
+            members.setdefault(find(offset + j), ([], []))[1].append(sa_id)
+
+        components = [
+            (component_staff_ids, component_sa_ids)
+            for component_staff_ids, component_sa_ids in members.values()
+            if component_staff_ids and component_sa_ids
+        ]
+        components.sort(key=lambda component: (-len(component[1]), component[1][0]))
+
+        return components
@@ -0,0 +1,125 @@
+from typing import List, Dict, Tuple
+from opspilot.models import Staff, ServiceAssignment, Service, Flight, CertificationRequirement, ServiceType
+from opspilot.utils import CapabilityMatrix, CertificationMask
+from time import time
+import numpy as np
+import logging
+
+class FeasibilityService:
+    """
+    Computes which staff can perform which service assignment once, considering:
+    - Staff certification against the service certification requirement
+    - Staff eligibility for the service type (S/F/M)
+    - Shift coverage of the service time windows
+    - Staff role match against the service assignment's priority roles
+
+    The result is a staff x service assignment CapabilityMatrix shared by the scheduler and constraints.
+    Only its pairs need decision variables, so the model size scales with the feasible pairs
+    instead of roster x service assignments.
+
+    Attributes:
+        roster: List of available staff members
+        service_assignments: List of service assignments that need staff
+        service_map: Map of service_id to Service for certification requirements
+        flight_map: Map of flight number to flight to help resolve flight timing
+    """
+
+    def __init__(
+        self,
+        roster: List[Staff],
+        service_assignments: List[ServiceAssignment],
+        service_map: Dict[int, Service],
+        flight_map: Dict[str, Flight]
+    ):
+        self.roster = roster
+        self.service_assignments = service_assignments
+        self.service_map = service_map
+        self.flight_map = flight_map
+
+    def capability_matrix(self) -> CapabilityMatrix:
+        start_time = time()
+        logging.info("Computing staff capability matrix...")
+
+        matrix = np.zeros((len(self.roster), len(self.service_assignments)), dtype=bool)
+        shift_starts, shift_ends = self._shift_arrays()
+        certified, service_index = self.certification_matrix()
+
+        # Certification and eligibility only depend on (service_id, service_type),
+        # and role match only on the priority roles, so each distinct key is resolved once
+        eligible_masks: Dict[ServiceType, np.ndarray] = {}
+        group_masks: Dict[Tuple[int, str], np.ndarray] = {}
+        role_masks: Dict[Tuple[Tuple[str, ...], ...], np.ndarray] = {}
+
+        for j, sa in enumerate(self.service_assignments):
+            group_key = (sa.service_id, sa.service_type)
+            if group_key not in group_masks:
+                if sa.service_type not in eligible_masks:
+                    eligible_masks[sa.service_type] = np.array([
+                        sa.service_type in staff.eligible_for_services for staff in self.roster
+                    ], dtype=bool)
+                group_masks[group_key] = eligible_masks[sa.service_type] & certified[:, service_index[sa.service_id]]
+
+            column = group_masks[group_key].copy()
+            if not column.any():
+                continue
+
+            if sa.priority_roles:
+                role_key = tuple(tuple(role_codes) for role_codes in sa.priority_roles)
+                if role_key not in role_masks:
+                    role_masks[role_key] = np.array([
+                        staff.has_priority_role_for_service(sa) for staff in self.roster
+                    ], dtype=bool)
+                column &= role_masks[role_key]
+
+            # Every service interval must be fully covered by one of the staff's shift intervals
+            for service_start, service_end in sa.minute_intervals(self.flight_map):
+                column &= ((shift_starts <= service_start) & (shift_ends >= service_end)).any(axis=1)
+
+            matrix[:, j] = column
+
+        capability = CapabilityMatrix(
+            staff_ids=[staff.id for staff in self.roster],
+            service_assignment_ids=[sa.id for sa in self.service_assignments],
+            matrix=matrix,
+        )
+
+        total = len(self.roster) * len(self.service_assignments)
+        logging.info(f"Found {len(capability)} feasible pairs out of {total} in {time() - start_time:.2f}s")
+
+        return capability
+
+    def feasible_pairs(self) -> List[Tuple[int, int]]:
+        return self.capability_matrix().pairs()
+
+    def certification_matrix(self) -> Tuple[np.ndarray, Dict[int, int]]:
+        """
+        Staff x service certification matches of the roster against the services of service_map,
+        computed with bitsets in one pass (see CertificationMask), and the column of each service_id.
+        """
+        services = list(self.service_map.values())
+        certified = CertificationMask.matrix(
+            staff_certifications=[staff.certifications for staff in self.roster],
+            service_certifications=[service.certifications for service in services],
+            require_all=[service.certification_requirement == CertificationRequirement.ALL for service in services],
+        )
+        return certified, {service.id: k for k, service in enumerate(services)}
+
+    def _shift_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Shift interval starts and ends per staff, padded with empty intervals that cover nothing.
+        """
+        staff_intervals = [
+            [interval for shift in staff.shifts for interval in shift.minute_intervals]
+            for staff in self.roster
+        ]
+        width = max((len(intervals) for intervals in staff_intervals), default=0)
+
+        shift_starts = np.full((len(self.roster), max(width, 1)), np.iinfo(np.int32).max, dtype=np.int32)
+        shift_ends = np.full((len(self.roster), max(width, 1)), np.iinfo(np.int32).min, dtype=np.int32)
+
+        for i, intervals in enumerate(staff_intervals):
+            for k, (start, end) in enumerate(intervals):
+                shift_starts[i, k] = start
+                shift_ends[i, k] = end
+
+        return shift_starts, shift_ends
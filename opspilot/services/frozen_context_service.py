@@ -0,0 +1,55 @@
+from typing import Dict, List, Set
+from opspilot.models import ServiceAssignment, ServiceType
+
+class FrozenContextService:
+    """
+    Finds the existing allocations a partial re-solve has to keep in its model.
+
+    When only a subset of the service assignments (the free set) is re-solved, allocations outside
+    it still constrain the staff that can take them:
+    - allocations overlapping a free service assignment (service transitions),
+    - allocations on the same flight (single and multi-task service rules),
+    - Fixed allocations (one Fixed service per staff for the whole day),
+    - every allocation when the free set has Fixed service assignments (staff on a Fixed service
+      cannot take any other service that day).
+
+    Attributes:
+        service_assignment_map: Map of service assignment id to service assignment
+        overlap_map: Map of service assignment id to the ids it overlaps with
+    """
+
+    def __init__(self, service_assignment_map: Dict[int, ServiceAssignment], overlap_map: Dict[int, List[int]]):
+        self.service_assignment_map = service_assignment_map
+        self.neighbours: Dict[int, Set[int]] = {}
+        for sa_id_a, conflicting_ids in overlap_map.items():
+            for sa_id_b in conflicting_ids:
+                self.neighbours.setdefault(sa_id_a, set()).add(sa_id_b)
+                self.neighbours.setdefault(sa_id_b, set()).add(sa_id_a)
+
+    def overlapping(self, sa_ids: Set[int]) -> Set[int]:
+        """The given service assignments together with every one overlapping them."""
+        result = set(sa_ids)
+        for sa_id in sa_ids:
+            result |= self.neighbours.get(sa_id, set())
+        return result
+
+    def frozen_context(self, free_ids: Set[int], allocations: Dict[int, Set[int]]) -> Dict[int, Set[int]]:
+        """Allocations outside the free set that constrain it (service_assignment_id -> staff_ids)."""
+        flight_numbers = {
+            self.service_assignment_map[sa_id].flight_number
+            for sa_id in free_ids
+            if self.service_assignment_map[sa_id].flight_number
+        }
+        adjacent = self.overlapping(free_ids)
+        has_fixed = any(self.service_assignment_map[sa_id].service_type == ServiceType.FIXED for sa_id in free_ids)
+
+        frozen = {}
+        for sa_id, staff_ids in allocations.items():
+            if sa_id in free_ids:
+                continue
+
+            sa = self.service_assignment_map[sa_id]
+            if has_fixed or sa_id in adjacent or sa.flight_number in flight_numbers or sa.service_type == ServiceType.FIXED:
+                frozen[sa_id] = set(staff_ids)
+
+        return frozen
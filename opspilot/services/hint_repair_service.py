@@ -0,0 +1,51 @@
+from typing import Collection, Dict, Iterable, List, Set, Tuple
+from opspilot.models import ServiceAssignment
+
+class HintRepairService:
+    """
+    Drops the allocations of a hint that can no longer be part of a solution, e.g. after flight times
+    changed, so the solver starts from a hint that is closer to feasible:
+    - allocations without a decision variable (the staff is no longer able to perform the assignment),
+    - staff beyond the required staff count of a service assignment,
+    - allocations overlapping an allocation of the same staff kept before (more important service
+      assignments, i.e. lower priority values, are kept first).
+
+    Remaining conflicts (single, fixed and multi-task service rules) are left to the solver's hint repair.
+
+    Attributes:
+        service_assignment_map: Map of service assignment id to service assignment
+        overlap_map: Map of service assignment id to the ids it overlaps with
+    """
+
+    def __init__(self, service_assignment_map: Dict[int, ServiceAssignment], overlap_map: Dict[int, List[int]]):
+        self.service_assignment_map = service_assignment_map
+        self.neighbours: Dict[int, Set[int]] = {}
+        for sa_id_a, conflicting_ids in overlap_map.items():
+            for sa_id_b in conflicting_ids:
+                self.neighbours.setdefault(sa_id_a, set()).add(sa_id_b)
+                self.neighbours.setdefault(sa_id_b, set()).add(sa_id_a)
+
+    def repair(self, pairs: Iterable[Tuple[int, int]], feasible_pairs: Collection[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """Returns the (staff_id, service_assignment_id) pairs of the hint that are kept."""
+        ordered = sorted(
+            (pair for pair in pairs if pair in feasible_pairs),
+            key=lambda pair: (self.service_assignment_map[pair[1]].priority, pair[1], pair[0])
+        )
+
+        kept: Set[Tuple[int, int]] = set()
+        staff_counts: Dict[int, int] = {}
+        staff_kept: Dict[int, Set[int]] = {}
+
+        for staff_id, sa_id in ordered:
+            if staff_counts.get(sa_id, 0) >= self.service_assignment_map[sa_id].staff_count:
+                continue
+
+            kept_sa_ids = staff_kept.setdefault(staff_id, set())
+            if kept_sa_ids & self.neighbours.get(sa_id, set()):
+                continue
+
+            kept.add((staff_id, sa_id))
+            kept_sa_ids.add(sa_id)
+            staff_counts[sa_id] = staff_counts.get(sa_id, 0) + 1
+
+        return kept
@@ -0,0 +1,139 @@
+from typing import List, Dict, Set, FrozenSet
+from opspilot.models import ServiceAssignment, Flight
+import heapq
+import logging
+
+class OverlapCliqueService:
+    """
+    Groups the overlap graph produced by OverlapDetectionService into cliques of mutually
+    overlapping service assignments, so a staff member's transitions can be encoded with one
+    AddAtMostOne per clique instead of one constraint per overlapping pair.
+
+    - Time-point cliques: the assignments running at each interval start point pairwise overlap in time
+      (the maximal cliques of a pure interval graph are all of this form).
+    - Travel-aware extension: each clique is extended with assignments that overlap every member only
+      once travel time is taken into account.
+    - Any overlapping pair still not covered (e.g. across midnight) is covered greedily.
+
+    Every clique only contains pairs present in the overlap map, and every pair in the
+    overlap map is covered by at least one clique.
+
+    Attributes:
+        overlap_map: Map of service assignment id to the ids it overlaps with
+        service_assignments: List of service assignments the overlap map was built from
+        flight_map: Map of flight number to flight to help resolve flight timing
+    """
+
+    def __init__(
+        self,
+        overlap_map: Dict[int, List[int]],
+        service_assignments: List[ServiceAssignment],
+        flight_map: Dict[str, Flight]
+    ):
+        self.overlap_map = overlap_map
+        self.service_assignments = service_assignments
+        self.flight_map = flight_map
+
+    def detect_cliques(self) -> List[List[int]]:
+        logging.debug("Grouping overlapping service assignments into cliques...")
+
+        neighbours = self._neighbours()
+        uncovered = {sa_id: set(adjacent) for sa_id, adjacent in neighbours.items()}
+        seen: Set[FrozenSet[int]] = set()
+        cliques = []
+
+        for active in self._time_point_groups(neighbours):
+            # Keep the members that overlap every member kept so far (same-flight pairs never overlap)
+            clique = []
+            for sa_id in active:
+                if all(sa_id in neighbours[member] for member in clique):
+                    clique.append(sa_id)
+
+            if len(clique) < 2:
+                continue
+
+            self._extend(clique, neighbours)
+
+            key = frozenset(clique)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            self._mark_covered(clique, uncovered)
+            cliques.append(clique)
+
+        cliques.extend(self._cover_remaining(neighbours, uncovered))
+
+        logging.debug(f"Grouped overlaps into {len(cliques)} cliques")
+        return cliques
+
+    def _neighbours(self) -> Dict[int, Set[int]]:
+        """Undirected adjacency of the overlap map."""
+        neighbours: Dict[int, Set[int]] = {}
+        for sa_id_a, conflicting_ids in self.overlap_map.items():
+            for sa_id_b in conflicting_ids:
+                neighbours.setdefault(sa_id_a, set()).add(sa_id_b)
+                neighbours.setdefault(sa_id_b, set()).add(sa_id_a)
+        return neighbours
+
+    def _time_point_groups(self, neighbours: Dict[int, Set[int]]) -> List[List[int]]:
+        """
+        Sweep over the interval start points of the overlapping assignments and return, for each
+        start point, the assignments whose intervals contain it (starting with the one starting there).
+        """
+        pieces = sorted(
+            (start, end, sa.id)
+            for sa in self.service_assignments if sa.id in neighbours
+            for start, end in sa.minute_intervals(self.flight_map)
+        )
+
+        groups = []
+        active = []  # heap of (end, sa_id)
+        for start, end, sa_id in pieces:
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+
+            group = [sa_id]
+            group.extend(active_id for _, active_id in sorted(active) if active_id != sa_id)
+            groups.append(group)
+
+            heapq.heappush(active, (end, sa_id))
+
+        return groups
+
+    def _extend(self, clique: List[int], neighbours: Dict[int, Set[int]]) -> None:
+        """Grow the clique with assignments overlapping every member (travel-aware overlaps)."""
+        candidates = set.intersection(*(neighbours[member] for member in clique)) - set(clique)
+        while candidates:
+            best = min(candidates)
+            clique.append(best)
+            candidates &= neighbours[best]
+
+    def _cover_remaining(self, neighbours: Dict[int, Set[int]], uncovered: Dict[int, Set[int]]) -> List[List[int]]:
+        """Greedy clique cover of the overlapping pairs not covered yet."""
+        cliques = []
+        for sa_id in sorted(uncovered):
+            while uncovered[sa_id]:
+                clique = [sa_id, min(uncovered[sa_id])]
+                candidates = neighbours[sa_id] & neighbours[clique[1]]
+
+                # Prefer the candidates covering the most still uncovered pairs
+                while candidates:
+                    best = max(
+                        sorted(candidates),
+                        key=lambda candidate: sum(1 for member in clique if member in uncovered[candidate])
+                    )
+                    clique.append(best)
+                    candidates &= neighbours[best]
+
+                self._mark_covered(clique, uncovered)
+                cliques.append(clique)
+
+        return cliques
+
+    @staticmethod
+    def _mark_covered(clique: List[int], uncovered: Dict[int, Set[int]]) -> None:
+        for k, member_a in enumerate(clique):
+            for member_b in clique[k + 1:]:
+                uncovered[member_a].discard(member_b)
+                uncovered[member_b].discard(member_a)
@@ -1,4 +1,6 @@
+from bisect import bisect_left
 from collections import defaultdict
+from itertools import chain
 from typing import List, Dict, Tuple
 from opspilot.models import ServiceAssignment, Flight, Location, Settings
 from opspilot.utils import TimeRangeUtils
@@ -33,22 +35,52 @@ class OverlapDetectionService:
         self.travel_time_map = travel_time_map
         self.buffer_minutes = settings.overlap_buffer_minutes
         self.default_travel_time = settings.default_travel_time
+        self._travel_minutes_cache: Dict[Tuple[int, int], int] = {}
 
     def detect_overlaps(self) -> Dict[int, List[int]]:
+        """
+        Sweep over the assignments sorted by their first start minute. For each assignment A only
+        the assignments starting before A's latest end plus the maximum possible travel gap are
+        examined, together with the midnight-wrapped assignments (multiple intervals) sorted after A,
+        as their intervals after midnight can overlap with A regardless of their sort position.
+        """
         logging.debug("Detecting overlaps between service assignments...")
 
+        # Resolve intervals once per assignment
+        intervals = {
+            sa.id: sa.minute_intervals(self.flight_map)
+            for sa in self.service_assignments
+        }
+
         # Sort assignments by the first minute of their interval
         sorted_assignments = sorted(
             self.service_assignments,
-            key=lambda sa: sa.minute_intervals(self.flight_map)[0][0]
+            key=lambda sa: intervals[sa.id][0][0]
         )
+        starts = [intervals[sa.id][0][0] for sa in sorted_assignments]
+        wrapped_positions = [
+            position for position, sa in enumerate(sorted_assignments)
+            if len(intervals[sa.id]) > 1
+        ]
+
+        # Largest gap any pair can require, used to bound the sweep window
+        max_travel_minutes = max(self.travel_time_map.values(), default=0)
+        max_gap = max(max(max_travel_minutes, self.default_travel_time) - self.buffer_minutes, 0)
 
         overlap_map = defaultdict(list)
 
         for i, sa_a in enumerate(sorted_assignments):
-            a_intervals = sa_a.minute_intervals(self.flight_map)
+            a_intervals = intervals[sa_a.id]
+            window_end = max(end for _, end in a_intervals) + max_gap
+
+            # Candidates starting inside the sweep window, then wrapped ones sorted beyond it
+            window_stop = bisect_left(starts, window_end, i + 1)
+            candidates = chain(
+                range(i + 1, window_stop),
+                wrapped_positions[bisect_left(wrapped_positions, window_stop):]
+            )
 
-            for j in range(i + 1, len(sorted_assignments)):
+            for j in candidates:
                 sa_b = sorted_assignments[j]
 
                 # Skip same-flight comparisons for Flight Zone services
@@ -56,28 +88,11 @@ class OverlapDetectionService:
                     if sa_a.flight_number == sa_b.flight_number:
                         continue
 
-                b_intervals = sa_b.minute_intervals(self.flight_map)
-
-                # Get travel time from A to B (with default fallback)
-                source_location = self.location_map.get(sa_a.location_id, None)
-                destination_location = self.location_map.get(sa_b.location_id, None)
-
-                if not source_location or not destination_location:
-                    travel_minutes = self.default_travel_time
-                elif source_location.parent_id and destination_location.parent_id:
-                    travel_minutes = self.travel_time_map.get(
-                        (source_location.parent_id, destination_location.parent_id),
-                        self.default_travel_time
-                    )
-                else:
-                    travel_minutes = self.travel_time_map.get(
-                        (source_location.id, destination_location.id),
-                        self.default_travel_time
-                    )
+                b_intervals = intervals[sa_b.id]
 
                 # Apply buffer (overlap tolerance)
-                buffer = self.buffer_minutes
-                min_gap = max(travel_minutes - buffer, 0)
+                travel_minutes = self._travel_minutes(sa_a.location_id, sa_b.location_id)
+                min_gap = max(travel_minutes - self.buffer_minutes, 0)
 
                 # Adjust A's intervals with min_gap as extension
                 adjusted_a_intervals = [(start, end + min_gap) for start, end in a_intervals]
@@ -88,3 +103,49 @@ class OverlapDetectionService:
                     logging.info(f"Overlap detected: {sa_a.id} overlaps with {sa_b.id}")
 
         return dict(overlap_map)
+
+    def transition_paddings(self) -> Dict[int, int]:
+        """
+        Minimum gap (travel time minus buffer) required after each service assignment before any
+        other service assignment, i.e. a lower bound of the gap used for every pair it starts.
+        Used to pad interval variables so padded overlap never forbids a pair that does not overlap.
+        """
+        location_ids = {sa.location_id for sa in self.service_assignments}
+
+        min_gaps = {
+            source_location_id: min(
+                max(self._travel_minutes(source_location_id, destination_location_id) - self.buffer_minutes, 0)
+                for destination_location_id in location_ids
+            )
+            for source_location_id in location_ids
+        }
+
+        return {sa.id: min_gaps[sa.location_id] for sa in self.service_assignments}
+
+    def _travel_minutes(self, source_location_id: int, destination_location_id: int) -> int:
+        """
+        Get travel time from the source to the destination location (with default fallback).
+        Resolved once per location pair.
+        """
+        key = (source_location_id, destination_location_id)
+        if key in self._travel_minutes_cache:
+            return self._travel_minutes_cache[key]
+
+        source_location = self.location_map.get(source_location_id, None)
+        destination_location = self.location_map.get(destination_location_id, None)
+
+        if not source_location or not destination_location:
+            travel_minutes = self.default_travel_time
+        elif source_location.parent_id and destination_location.parent_id:
+            travel_minutes = self.travel_time_map.get(
+                (source_location.parent_id, destination_location.parent_id),
+                self.default_travel_time
+            )
+        else:
+            travel_minutes = self.travel_time_map.get(
+                (source_location.id, destination_location.id),
+                self.default_travel_time
+            )
+
+        self._travel_minutes_cache[key] = travel_minutes
+        return travel_minutes
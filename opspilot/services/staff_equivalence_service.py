@@ -0,0 +1,67 @@
+from typing import Dict, Iterable, List, Set, Tuple
+from opspilot.models import Staff
+from opspilot.problem import CompiledProblem
+
+class StaffEquivalenceService:
+    """
+    Groups interchangeable staff into equivalence classes: staff with the same department, certifications,
+    service type eligibility, shifts, role_code, rank_level and priority_service_id, and the same feasible
+    service assignments in the compiled problem (which also separates staff pinned by frozen allocations).
+    These are all the staff fields the constraints and strategies read, so swapping the schedules of two
+    staff of a class never changes feasibility or the objective.
+
+    Attributes:
+        roster: List of staff members
+        problem: Compiled problem the classes are computed for
+    """
+
+    def __init__(self, roster: List[Staff], problem: CompiledProblem):
+        self.roster = roster
+        self.problem = problem
+
+    def classes(self) -> List[List[int]]:
+        """Classes of at least two staff ids, each sorted by staff id."""
+        groups: Dict[tuple, List[int]] = {}
+        for staff in self.roster:
+            groups.setdefault(self._key(staff), []).append(staff.id)
+
+        return sorted(sorted(staff_ids) for staff_ids in groups.values() if len(staff_ids) > 1)
+
+    def columns(self, staff_ids: List[int]) -> List[int]:
+        """Service assignment ids the staff of a class can perform, in task order."""
+        tasks = self.problem.tasks_of_staff(self.problem.staff_index[staff_ids[0]])
+        return self.problem.task_ids[tasks].tolist()
+
+    def canonical(self, pairs: Iterable[Tuple[int, int]], classes: List[List[int]]) -> Set[Tuple[int, int]]:
+        """
+        Permute the schedules of (staff_id, service_assignment_id) pairs within each class so they are
+        lexicographically non-increasing in staff id order, as required by SymmetryBreakingConstraint.
+        """
+        schedules: Dict[int, Set[int]] = {}
+        for staff_id, sa_id in pairs:
+            schedules.setdefault(staff_id, set()).add(sa_id)
+
+        for staff_ids in classes:
+            columns = self.columns(staff_ids)
+            ordered = sorted(
+                (schedules.pop(staff_id, set()) for staff_id in staff_ids),
+                key=lambda schedule: [sa_id in schedule for sa_id in columns],
+                reverse=True
+            )
+            for staff_id, schedule in zip(staff_ids, ordered):
+                if schedule:
+                    schedules[staff_id] = schedule
+
+        return {(staff_id, sa_id) for staff_id, sa_ids in schedules.items() for sa_id in sa_ids}
+
+    def _key(self, staff: Staff) -> tuple:
+        return (
+            staff.department_id,
+            frozenset(staff.certifications),
+            frozenset(staff.eligible_for_services),
+            tuple(sorted(interval for shift in staff.shifts for interval in shift.minute_intervals)),
+            staff.role_code,
+            staff.rank_level,
+            staff.priority_service_id,
+            self.problem.tasks_of_staff(self.problem.staff_index[staff.id]).tobytes(),
+        )
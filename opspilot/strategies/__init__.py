@@ -1,8 +1,9 @@
+from .objective_stage import ObjectiveStage
 from .strategy import Strategy
 from .minimize_staff_strategy import MinimizeStaffStrategy
 from .balance_workload_strategy import BalanceWorkloadStrategy
 from .turnaround_workload_strategy import TurnaroundWorkloadStrategy
 
 __all__ = [
-    'Strategy', 'MinimizeStaffStrategy', 'BalanceWorkloadStrategy', 'TurnaroundWorkloadStrategy'
+    'ObjectiveStage', 'Strategy', 'MinimizeStaffStrategy', 'BalanceWorkloadStrategy', 'TurnaroundWorkloadStrategy'
 ]
\ No newline at end of file
@@ -1,18 +1,21 @@
-from typing import Dict, Tuple, List
-from ortools.sat.python.cp_model import CpModel, IntVar
-from opspilot.models import Staff, ServiceAssignment
-from opspilot.strategies import Strategy
+from typing import Dict, Iterable, Tuple, List, Optional
+import numpy as np
+from ortools.sat.python.cp_model import CpModel, IntVar, LinearExpr
+from opspilot.problem import CompiledProblem
+from opspilot.strategies import Strategy, ObjectiveStage
+from opspilot.utils import AssignmentVarIndex
 
 class BalanceWorkloadStrategy(Strategy):
+    # Weights of the coverage, preference and staff used stages in the weighted objective
+    stage_weights = (1_000_000_000, 1, 1)
+
     def __init__(
             self, 
-            roster: List[Staff], 
-            service_assignment_map: Dict[int, ServiceAssignment],
-            staff_map: Dict[int, Staff], 
+            problem: CompiledProblem,
+            var_index: Optional[AssignmentVarIndex] = None,
     ):
-        self.roster = roster
-        self.service_assignment_map = service_assignment_map
-        self.staff_map = staff_map
+        self.problem = problem
+        self.var_index = var_index
 
     def apply(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]):
         """
@@ -26,22 +29,50 @@ class BalanceWorkloadStrategy(Strategy):
         This strategy aims to balance the workload fairly across staff, incorporating traits and preferences.
         """
 
+        total_assignments, preference_score, total_staff_used = self._objective_terms(model, assignment_vars)
+
+        # Maximize assignments first, then distribute based on preferences and traits,
+        # and finally slightly prefer involving more staff (to balance workload)
+        coverage_weight, preference_weight, staff_weight = self.stage_weights
+        model.Maximize(
+            coverage_weight * total_assignments +  # Primary: maximize service coverage
+            preference_weight * preference_score + # Secondary: score based on preferences and traits
+            staff_weight * total_staff_used        # Tertiary: prefer spreading load across staff
+        )
+
+    def objective_stages(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]) -> List[ObjectiveStage]:
+        total_assignments, preference_score, total_staff_used = self._objective_terms(model, assignment_vars)
+
+        return [
+            ObjectiveStage("coverage", total_assignments),
+            ObjectiveStage("preference", preference_score),
+            ObjectiveStage("staff_used", total_staff_used),
+        ]
+
+    def _objective_terms(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]):
+        """Total assignments, preference score and total staff used."""
         # Binary indicator for whether a staff member is used
+        staff_ids = self.problem.staff_ids.tolist()
         staff_used = {
-            staff.id: model.NewBoolVar(f"staff_used_{staff.id}")
-            for staff in self.roster
+            staff_id: model.NewBoolVar(f"staff_used_{staff_id}")
+            for staff_id in staff_ids
         }
 
         # staff_used[staff_id] = 1 if any assignment is made
-        for staff in self.roster:
-            staff_assignments = [
-                var for (staff_id, _), var in assignment_vars.items()
-                if staff_id == staff.id
-            ]
-            model.AddMaxEquality(staff_used[staff.id], staff_assignments)
+        var_index = self.var_index if self.var_index is not None else AssignmentVarIndex.from_assignments(assignment_vars)
+
+        for staff_id in staff_ids:
+            staff_assignments = list(var_index.for_staff(staff_id).values())
+
+            # Staff without any feasible assignment can never be used
+            if not staff_assignments:
+                model.Add(staff_used[staff_id] == 0)
+                continue
+
+            model.AddMaxEquality(staff_used[staff_id], staff_assignments)
 
         # Total staff used
-        total_staff_used = model.NewIntVar(0, len(self.roster), "total_staff_used")
+        total_staff_used = model.NewIntVar(0, len(staff_ids), "total_staff_used")
         model.Add(total_staff_used == sum(staff_used.values()))
 
         # Total assignments made
@@ -49,38 +80,44 @@ class BalanceWorkloadStrategy(Strategy):
         total_assignments = model.NewIntVar(0, len(assignment_var_list), "total_assignments")
         model.Add(total_assignments == sum(assignment_var_list))
 
-        # Per-assignment score considering staff traits and service properties
-        objective_terms = []
-        for (staff_id, sa_id), var in assignment_vars.items():
-            sa = self.service_assignment_map[sa_id]
-            staff = self.staff_map[staff_id]
+        staff_positions, task_positions = self.problem.pair_positions(assignment_vars.keys())
+        combined_score = self._preference_scores(staff_positions, task_positions)
 
-            # Lower priority value = higher preference
-            priority_score = -int(sa.priority * 1000)
+        preference_score = LinearExpr.WeightedSum(assignment_var_list, combined_score.tolist())
 
-            # Big bonus for assigning staff to their preferred service
-            priority_match_bonus = 1 if staff.priority_service_id == sa.service_id else 0
+        return total_assignments, preference_score, total_staff_used
 
-            # Lower rank_level is better
-            rank_score = -1 * (staff.rank_level or 0)
+    def evaluate(self, pairs: Iterable[Tuple[int, int]]) -> Tuple[int, ...]:
+        pairs = list(pairs)
+        staff_positions, task_positions = self.problem.pair_positions(pairs)
+        total_staff_used = len({staff_id for staff_id, _ in pairs})
+        return len(pairs), int(self._preference_scores(staff_positions, task_positions).sum()), total_staff_used
 
-            # Fewer certifications is better (preserve multi-skilled staff)
-            cert_score = -len(staff.certifications)
+    def _preference_scores(self, staff_positions: np.ndarray, task_positions: np.ndarray) -> np.ndarray:
+        """
+        Per-assignment score considering staff traits and service properties, computed on the arrays
+        of the compiled problem for all (staff, task) positions at once.
+        """
+        problem = self.problem
 
-            # Combine weights (tunable)
-            combined_score = (
-                10_000_000 * priority_match_bonus +
-                10_000 * priority_score +
-                1_000 * rank_score +
-                10 * cert_score
-            )
+        # Lower priority value = higher preference
+        priority_score = problem.task_priority_score[task_positions]
 
-            objective_terms.append(combined_score * var)
+        # Big bonus for assigning staff to their preferred service
+        priority_match_bonus = (problem.staff_priority_service[staff_positions] == problem.task_service[task_positions]).astype(np.int64)
 
-        # Maximize assignments first, then distribute based on preferences and traits,
-        # and finally slightly prefer involving more staff (to balance workload)
-        model.Maximize(
-            1_000_000_000 * total_assignments +  # Primary: maximize service coverage
-            sum(objective_terms) +               # Secondary: score based on preferences and traits
-            total_staff_used                     # Tertiary: prefer spreading load across staff
+        # Lower rank_level is better
+        rank_score = -problem.staff_rank[staff_positions].astype(np.int64)
+
+        # Fewer certifications is better (preserve multi-skilled staff)
+        cert_score = -problem.staff_certification_count[staff_positions].astype(np.int64)
+
+        # Combine weights (tunable)
+        combined_score = (
+            10_000_000 * priority_match_bonus +
+            10_000 * priority_score +
+            1_000 * rank_score +
+            10 * cert_score
         )
+
+        return combined_score
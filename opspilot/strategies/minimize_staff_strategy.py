@@ -1,16 +1,20 @@
-from typing import Dict, Tuple, List
-from ortools.sat.python.cp_model import CpModel, IntVar
-from opspilot.models import Staff, ServiceAssignment
-from opspilot.strategies import Strategy
+from typing import Dict, Iterable, Tuple, List, Optional
+from ortools.sat.python.cp_model import CpModel, IntVar, LinearExpr
+from opspilot.problem import CompiledProblem
+from opspilot.strategies import Strategy, ObjectiveStage
+from opspilot.utils import AssignmentVarIndex
 
 class MinimizeStaffStrategy(Strategy):
+    # Weights of the coverage, priority and staff used stages in the weighted objective
+    stage_weights = (1_000_000_000, 1_000, 1)
+
     def __init__(
             self, 
-            roster: List[Staff], 
-            service_assignment_map: Dict[int, ServiceAssignment], 
+            problem: CompiledProblem,
+            var_index: Optional[AssignmentVarIndex] = None,
     ):
-        self.roster = roster
-        self.service_assignment_map = service_assignment_map
+        self.problem = problem
+        self.var_index = var_index
 
     def apply(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]):
         """
@@ -22,22 +26,55 @@ class MinimizeStaffStrategy(Strategy):
         This strategy is suitable when reducing total active staff is important — e.g., for lean scheduling.
         """
 
+        total_assignments, priority_score, total_staff_used = self._objective_terms(model, assignment_vars)
+
+        # Maximize assignments first, then priority score, then minimize staff used
+        coverage_weight, priority_weight, staff_weight = self.stage_weights
+        model.Maximize(
+            coverage_weight * total_assignments +  # Primary: complete as many assignments as possible
+            priority_weight * priority_score -     # Secondary: favor lower-priority services
+            staff_weight * total_staff_used        # Tertiary: minimize how many staff are activated
+        )
+
+    def objective_stages(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]) -> List[ObjectiveStage]:
+        total_assignments, priority_score, total_staff_used = self._objective_terms(model, assignment_vars)
+
+        return [
+            ObjectiveStage("coverage", total_assignments),
+            ObjectiveStage("priority", priority_score),
+            ObjectiveStage("staff_used", -total_staff_used),
+        ]
+
+    def evaluate(self, pairs: Iterable[Tuple[int, int]]) -> Tuple[int, ...]:
+        pairs = list(pairs)
+        _, task_positions = self.problem.pair_positions(pairs)
+        total_staff_used = len({staff_id for staff_id, _ in pairs})
+        return len(pairs), int(self.problem.task_priority_score[task_positions].sum()), -total_staff_used
+
+    def _objective_terms(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]):
+        """Total assignments, priority score and total staff used."""
         # Create a binary variable for whether each staff is used at least once
+        staff_ids = self.problem.staff_ids.tolist()
         staff_used = {
-            staff.id: model.NewBoolVar(f"staff_used_{staff.id}")
-            for staff in self.roster
+            staff_id: model.NewBoolVar(f"staff_used_{staff_id}")
+            for staff_id in staff_ids
         }
 
         # staff_used[staff_id] = 1 if the staff is assigned to any service
-        for staff in self.roster:
-            staff_assignments = [
-                var for (staff_id, _), var in assignment_vars.items()
-                if staff_id == staff.id
-            ]
-            model.AddMaxEquality(staff_used[staff.id], staff_assignments)
+        var_index = self.var_index if self.var_index is not None else AssignmentVarIndex.from_assignments(assignment_vars)
+
+        for staff_id in staff_ids:
+            staff_assignments = list(var_index.for_staff(staff_id).values())
+
+            # Staff without any feasible assignment can never be used
+            if not staff_assignments:
+                model.Add(staff_used[staff_id] == 0)
+                continue
+
+            model.AddMaxEquality(staff_used[staff_id], staff_assignments)
 
         # Total number of distinct staff used
-        total_staff_used = model.NewIntVar(0, len(self.roster), "total_staff_used")
+        total_staff_used = model.NewIntVar(0, len(staff_ids), "total_staff_used")
         model.Add(total_staff_used == sum(staff_used.values()))
 
         # Total number of assignments actually made
@@ -47,14 +84,10 @@ class MinimizeStaffStrategy(Strategy):
 
         # Compute a total score from service assignment priorities
         # Lower priority values are better, so we negate the score
-        priority_score = sum(
-            -int(self.service_assignment_map[sa_id].priority * 1000) * var
-            for (_, sa_id), var in assignment_vars.items()
+        _, task_positions = self.problem.pair_positions(assignment_vars.keys())
+        priority_score = LinearExpr.WeightedSum(
+            assignment_var_list,
+            self.problem.task_priority_score[task_positions].tolist()
         )
 
-        # Maximize assignments first, then priority score, then minimize staff used
-        model.Maximize(
-            1_000_000_000 * total_assignments +  # Primary: complete as many assignments as possible
-            1_000 * priority_score -            # Secondary: favor lower-priority services
-            total_staff_used                    # Tertiary: minimize how many staff are activated
-        )
+        return total_assignments, priority_score, total_staff_used
@@ -0,0 +1,10 @@
+from typing import NamedTuple
+from ortools.sat.python.cp_model import LinearExprT
+
+class ObjectiveStage(NamedTuple):
+    """
+    One level of a lexicographic objective: the expression to maximize, in order of importance.
+    Minimization terms are expressed as the negated expression.
+    """
+    name: str
+    expression: LinearExprT
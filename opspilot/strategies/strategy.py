@@ -1,11 +1,35 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Tuple, List
 from ortools.sat.python.cp_model import CpModel, IntVar
+from .objective_stage import ObjectiveStage
 
 class Strategy(ABC):
     """
     Base class for all objectives in the scheduling system.
+
+    The weighted objective set by `apply` is the sum of the objective stage values times
+    `stage_weights`, so `evaluate` can score a plan without solving it.
     """
+    stage_weights: Tuple[int, ...] = ()
+
     @abstractmethod
     def apply(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]):
-        pass
\ No newline at end of file
+        pass
+
+    def objective_stages(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]) -> List[ObjectiveStage]:
+        """
+        The objective as separate stages for lexicographic solving, most important first.
+        Only adds the helper variables and constraints the stages need; no objective is set.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support lexicographic objectives")
+
+    def evaluate(self, pairs: Iterable[Tuple[int, int]]) -> Tuple[int, ...]:
+        """
+        Values of the objective stages, most important first, for the given assigned
+        (staff_id, service_assignment_id) pairs.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support evaluating plans")
+
+    def weighted_value(self, stage_values: Tuple[int, ...]) -> int:
+        """Value of the weighted objective for the values of the objective stages."""
+        return sum(weight * value for weight, value in zip(self.stage_weights, stage_values))
@@ -1,32 +1,36 @@
-from typing import Dict, Tuple, List
-from ortools.sat.python.cp_model import CpModel, IntVar
-from opspilot.models import Staff, ServiceAssignment
-from opspilot.strategies import Strategy
+from typing import Dict, Iterable, Tuple, List, Optional
+from ortools.sat.python.cp_model import CpModel, IntVar, LinearExpr
+from opspilot.problem import CompiledProblem
+from opspilot.strategies import Strategy, ObjectiveStage
+import numpy as np
 
 class TurnaroundWorkloadStrategy(Strategy):
+    # The turnaround score is the only stage of the weighted objective
+    stage_weights = (1,)
+
     def __init__(
             self, 
-            roster: List[Staff], 
-            service_assignment_map: Dict[int, ServiceAssignment],
-            staff_map: Dict[int, Staff],
-            department_factor: int = 10  # Higher factor gives more weight to same-department assignments
+            problem: CompiledProblem,
+            department_factor: int = 10,  # Higher factor gives more weight to same-department assignments
+            priority_ceiling: Optional[float] = None
     ):
         """
         Initialize the strategy with the necessary data.
         
         Args:
-            roster: List of staff members available for assignment
-            service_assignment_map: Dictionary mapping service assignment IDs to ServiceAssignment objects
-            staff_map: Dictionary mapping staff IDs to Staff objects
+            problem: Compiled scheduling inputs (staff and service assignment attributes as arrays)
             department_factor: Weight factor for same-department assignments (default: 10)
+            priority_ceiling: Priority the scores are computed against (default: highest priority value + 1).
+                              Pass the ceiling of the whole day when solving a subset of it so scores stay comparable.
         """
-        self.roster = roster
-        self.service_assignment_map = service_assignment_map
-        self.staff_map = staff_map
+        self.problem = problem
         self.department_factor = department_factor
         
         # Calculate the maximum priority value among all service assignments
-        self.max_priority = max(sa.priority for sa in service_assignment_map.values()) + 1        
+        if priority_ceiling is not None:
+            self.max_priority = priority_ceiling
+        else:
+            self.max_priority = float(problem.task_priority.max()) + 1
 
     def apply(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]):
         """
@@ -41,31 +45,37 @@ class TurnaroundWorkloadStrategy(Strategy):
             model: The CP-SAT model to apply the objective to
             assignment_vars: Dictionary mapping (staff_id, service_assignment_id) tuples to boolean variables
         """
-        objective_terms = []
+        model.Maximize(self._turnaround_score(assignment_vars))
+
+    def objective_stages(self, model: CpModel, assignment_vars: Dict[Tuple[int, int], IntVar]) -> List[ObjectiveStage]:
+        return [ObjectiveStage("turnaround", self._turnaround_score(assignment_vars))]
+
+    def evaluate(self, pairs: Iterable[Tuple[int, int]]) -> Tuple[int, ...]:
+        staff_positions, task_positions = self.problem.pair_positions(pairs)
+        return (int(self._pair_scores(staff_positions, task_positions).sum()),)
+
+    def _turnaround_score(self, assignment_vars: Dict[Tuple[int, int], IntVar]):
+        staff_positions, task_positions = self.problem.pair_positions(assignment_vars.keys())
 
-        for (staff_id, service_assignment_id), var in assignment_vars.items():
-            service_assignment = self.service_assignment_map[service_assignment_id]
-            staff = self.staff_map[staff_id]
+        # The weighted sum of assignments to maximize
+        return LinearExpr.WeightedSum(list(assignment_vars.values()), self._pair_scores(staff_positions, task_positions).tolist())
 
-            # Base priority score: lower original priority number means higher score
-            base_priority_score = self.max_priority - service_assignment.priority
+    def _pair_scores(self, staff_positions: np.ndarray, task_positions: np.ndarray) -> np.ndarray:
+        problem = self.problem
 
-            # Role factor: higher if staff's role is in an earlier priority list
-            role_factor = 1  # Default factor
-            
-            if service_assignment.priority_roles and staff.role_code:
-                for i, role_list in enumerate(service_assignment.priority_roles):
-                    if staff.role_code in role_list:
-                        role_factor = len(service_assignment.priority_roles) - i
-                        break  # Found the highest priority match for the role
+        # Base priority score: lower original priority number means higher score
+        base_priority_score = self.max_priority - problem.task_priority[task_positions]
 
-            # Department factor: higher if staff is from the same department as the service assignment
-            department_score = self.department_factor if staff.department_id == service_assignment.department_id else 1
+        # Role factor: higher if staff's role is in an earlier priority list (1 for staff without a role)
+        staff_roles = problem.staff_role[staff_positions]
+        role_factor = np.ones(len(task_positions), dtype=np.int64)
+        has_role = staff_roles >= 0
+        role_factor[has_role] = problem.task_role_factor[task_positions[has_role], staff_roles[has_role]]
 
-            # Combine scores for the objective term
-            # The higher the combined score, the more preferred the assignment
-            combined_score = base_priority_score * role_factor * department_score
-            objective_terms.append(var * int(combined_score))  # CP-SAT solver expects integer coefficients
+        # Department factor: higher if staff is from the same department as the service assignment
+        same_department = problem.staff_department[staff_positions] == problem.task_department[task_positions]
+        department_score = np.where(same_department, self.department_factor, 1)
 
-        # Set the objective to maximize the weighted sum of assignments
-        model.Maximize(sum(objective_terms))
\ No newline at end of file
+        # Combine scores for the objective term
+        # The higher the combined score, the more preferred the assignment
+        return np.trunc(base_priority_score * role_factor * department_score).astype(np.int64)  # CP-SAT solver expects integer coefficients
@@ -1,5 +1,8 @@
 from .time_range_utils import TimeRangeUtils
+from .assignment_var_index import AssignmentVarIndex
+from .capability_matrix import CapabilityMatrix
+from .certification_mask import CertificationMask
 
 __all__ = [
-    'TimeRangeUtils',
-]
\ No newline at end of file
+    'TimeRangeUtils', 'AssignmentVarIndex', 'CapabilityMatrix', 'CertificationMask',
+]
@@ -0,0 +1,41 @@
+from collections import defaultdict
+from typing import Dict, Tuple
+from ortools.sat.python.cp_model import IntVar
+
+class AssignmentVarIndex:
+    """
+    Index of the (staff_id, service_assignment_id) -> BoolVar assignment variables
+    by service assignment and by staff, so constraints and strategies can fetch the
+    variables of one service assignment or one staff member without scanning all of them.
+    """
+
+    def __init__(self):
+        self._by_service_assignment: Dict[int, Dict[int, IntVar]] = defaultdict(dict)
+        self._by_staff: Dict[int, Dict[int, IntVar]] = defaultdict(dict)
+
+    @classmethod
+    def from_assignments(cls, assignments: Dict[Tuple[int, int], IntVar]) -> 'AssignmentVarIndex':
+        """Build the index from an existing assignment variables dict."""
+        index = cls()
+        for (staff_id, service_assignment_id), var in assignments.items():
+            index.add(staff_id, service_assignment_id, var)
+        return index
+
+    def add(self, staff_id: int, service_assignment_id: int, var: IntVar) -> None:
+        self._by_service_assignment[service_assignment_id][staff_id] = var
+        self._by_staff[staff_id][service_assignment_id] = var
+
+    def for_service_assignment(self, service_assignment_id: int) -> Dict[int, IntVar]:
+        """Returns {staff_id: var} for the given service assignment."""
+        return self._by_service_assignment.get(service_assignment_id, {})
+
+    def for_staff(self, staff_id: int) -> Dict[int, IntVar]:
+        """Returns {service_assignment_id: var} for the given staff member."""
+        return self._by_staff.get(staff_id, {})
+
+    def staff_ids(self):
+        """Staff ids with at least one assignment variable."""
+        return self._by_staff.keys()
+
+    def __len__(self) -> int:
+        return sum(len(staff_vars) for staff_vars in self._by_staff.values())
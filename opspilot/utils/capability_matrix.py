@@ -0,0 +1,58 @@
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+
+class CapabilityMatrix:
+    """
+    Staff x service assignment boolean matrix telling which staff can perform which service assignment.
+
+    Rows follow `staff_ids` and columns follow `service_assignment_ids`; `staff_index` and
+    `service_assignment_index` map ids back to row/column positions.
+    """
+
+    def __init__(self, staff_ids: List[int], service_assignment_ids: List[int], matrix: np.ndarray):
+        if matrix.shape != (len(staff_ids), len(service_assignment_ids)):
+            raise ValueError(
+                f"Matrix shape {matrix.shape} does not match "
+                f"{len(staff_ids)} staff x {len(service_assignment_ids)} service assignments"
+            )
+
+        self.staff_ids = list(staff_ids)
+        self.service_assignment_ids = list(service_assignment_ids)
+        self.matrix = matrix
+        self.staff_index: Dict[int, int] = {staff_id: i for i, staff_id in enumerate(self.staff_ids)}
+        self.service_assignment_index: Dict[int, int] = {sa_id: j for j, sa_id in enumerate(self.service_assignment_ids)}
+
+    @classmethod
+    def from_pairs(
+        cls,
+        staff_ids: List[int],
+        service_assignment_ids: List[int],
+        pairs: Iterable[Tuple[int, int]]
+    ) -> 'CapabilityMatrix':
+        """Build the matrix from (staff_id, service_assignment_id) pairs, e.g. the keys of an assignment variables dict."""
+        capability = cls(staff_ids, service_assignment_ids, np.zeros((len(staff_ids), len(service_assignment_ids)), dtype=bool))
+        for staff_id, sa_id in pairs:
+            capability.matrix[capability.staff_index[staff_id], capability.service_assignment_index[sa_id]] = True
+        return capability
+
+    def can_perform(self, staff_id: int, service_assignment_id: int) -> bool:
+        i = self.staff_index.get(staff_id)
+        j = self.service_assignment_index.get(service_assignment_id)
+        if i is None or j is None:
+            return False
+        return bool(self.matrix[i, j])
+
+    def pairs(self) -> List[Tuple[int, int]]:
+        """All capable (staff_id, service_assignment_id) pairs, staff-major."""
+        rows, cols = np.nonzero(self.matrix)
+        return [
+            (self.staff_ids[i], self.service_assignment_ids[j])
+            for i, j in zip(rows.tolist(), cols.tolist())
+        ]
+
+    def columns(self, service_assignment_ids: List[int]) -> np.ndarray:
+        """Sub-matrix (all staff x given service assignments) in the given column order."""
+        return self.matrix[:, [self.service_assignment_index[sa_id] for sa_id in service_assignment_ids]]
+
+    def __len__(self) -> int:
+        return int(self.matrix.sum())
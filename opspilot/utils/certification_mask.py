@@ -0,0 +1,88 @@
+from functools import lru_cache
+from typing import Dict, Iterable, Sequence, Tuple
+import numpy as np
+
+class CertificationMask:
+    """
+    Bitmask encoding of certification ids, so certification requirements reduce to bitwise operations.
+
+    Single checks use Python int masks with bit c set for certification id c (`encode`, cached per
+    distinct combination of certifications, so each staff and service mask is built once). Whole rosters
+    and service catalogues use dense NumPy bitsets instead: certification ids are numbered 0..n-1
+    (`bit_positions`) and packed into rows of uint64 words (`bitsets`), so `matrix` can compare every
+    staff with every service at once.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def encode(certifications: Tuple[int, ...]) -> int:
+        mask = 0
+        for certification in certifications:
+            mask |= 1 << certification
+        return mask
+
+    @staticmethod
+    def has_all(mask: int, required: int) -> bool:
+        """True if every required bit is set (also when nothing is required)."""
+        return mask & required == required
+
+    @staticmethod
+    def has_any(mask: int, required: int) -> bool:
+        """True if at least one required bit is set."""
+        return mask & required != 0
+
+    @staticmethod
+    def bit_positions(*certification_lists: Iterable[Iterable[int]]) -> Dict[int, int]:
+        """Dense bit position of every certification id found in the lists, in ascending id order."""
+        certification_ids = sorted({
+            certification
+            for lists in certification_lists
+            for certifications in lists
+            for certification in certifications
+        })
+        return {certification: k for k, certification in enumerate(certification_ids)}
+
+    @staticmethod
+    def bitsets(certification_lists: Sequence[Iterable[int]], bit_positions: Dict[int, int]) -> np.ndarray:
+        """One row of uint64 words per list, with bit k of the row set for the certification at position k."""
+        words = max(1, (len(bit_positions) + 63) // 64)
+        rows, positions = [], []
+        for i, certifications in enumerate(certification_lists):
+            for certification in certifications:
+                rows.append(i)
+                positions.append(bit_positions[certification])
+
+        rows = np.array(rows, dtype=np.int64)
+        positions = np.array(positions, dtype=np.uint64)
+        bitsets = np.zeros((len(certification_lists), words), dtype=np.uint64)
+        np.bitwise_or.at(
+            bitsets,
+            (rows, (positions // np.uint64(64)).astype(np.int64)),
+            np.left_shift(np.uint64(1), positions % np.uint64(64))
+        )
+        return bitsets
+
+    @classmethod
+    def matrix(
+        cls,
+        staff_certifications: Sequence[Iterable[int]],
+        service_certifications: Sequence[Iterable[int]],
+        require_all: Sequence[bool]
+    ) -> np.ndarray:
+        """
+        Staff x service boolean matrix of certification matches: all required certifications where
+        `require_all` is set for the service, at least one of them otherwise.
+        """
+        bit_positions = cls.bit_positions(staff_certifications, service_certifications)
+        staff_bits = cls.bitsets(staff_certifications, bit_positions)
+        service_bits = cls.bitsets(service_certifications, bit_positions)
+
+        has_all = np.ones((len(staff_bits), len(service_bits)), dtype=bool)
+        has_any = np.zeros((len(staff_bits), len(service_bits)), dtype=bool)
+        for word in range(staff_bits.shape[1]):
+            required = service_bits[:, word][np.newaxis, :]
+            common = staff_bits[:, word][:, np.newaxis] & required
+            has_all &= common == required
+            has_any |= common != 0
+
+        return np.where(np.asarray(require_all, dtype=bool)[np.newaxis, :], has_all, has_any)
@@ -1,3 +1,4 @@
+from datetime import time
 from typing import List, Tuple
 
 class TimeRangeUtils:
@@ -26,6 +27,17 @@ class TimeRangeUtils:
         else:
             return [(start, end)]
 
+    @staticmethod
+    def to_minute_ranges_from_times(start: time, end: time) -> List[Tuple[int, int]]:
+        """
+        Converts time values into a list of minute ranges without a string round trip.
+        Supports ranges that span midnight.
+        """
+        return TimeRangeUtils.to_minute_ranges_from_minutes(
+            start.hour * 60 + start.minute,
+            end.hour * 60 + end.minute
+        )
+
     @staticmethod
     def has_overlap(ranges1: List[Tuple[int, int]], ranges2: List[Tuple[int, int]]) -> bool:
         for s1, e1 in ranges1: